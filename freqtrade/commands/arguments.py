@@ -162,6 +162,7 @@ ARGS_DOWNLOAD_DATA = [
     "dataformat_trades",
     "trading_mode",
     "prepend_data",
+    "download_concurrency",
 ]
 
 ARGS_PLOT_DATAFRAME = [
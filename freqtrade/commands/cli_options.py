@@ -497,6 +497,12 @@ AVAILABLE_CLI_OPTIONS = {
         help="Specify which tickers to download. Space-separated list. Default: `1m 5m`.",
         nargs="+",
     ),
+    "download_concurrency": Arg(
+        "--concurrency",
+        help="Number of pairs / timeframes to download concurrently. Default: `1`.",
+        type=check_int_positive,
+        metavar="INT",
+    ),
     "prepend_data": Arg(
         "--prepend",
         help="Allow data prepending. (Data-appending is disabled)",
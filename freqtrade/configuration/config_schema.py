@@ -4,8 +4,12 @@ from freqtrade.constants import (
     AVAILABLE_DATAHANDLERS,
     AVAILABLE_PAIRLISTS,
     BACKTEST_BREAKDOWNS,
+    BACKTEST_ENGINE_DEFAULT,
+    BACKTEST_ENGINES,
     DRY_RUN_WALLET,
     EXPORT_OPTIONS,
+    HYPEROPT_DATA_FORMAT_DEFAULT,
+    HYPEROPT_DATA_FORMATS,
     MARGIN_MODES,
     ORDERTIF_POSSIBILITIES,
     ORDERTYPE_POSSIBILITIES,
@@ -99,6 +103,15 @@ CONF_SCHEMA = {
             "description": "Process only new candles.",
             "type": "boolean",
         },
+        "analyze_workers": {
+            "description": (
+                "Number of threads used to analyze pairs in parallel in dry / live mode. "
+                "1 analyzes pairs sequentially."
+            ),
+            "type": "integer",
+            "minimum": 1,
+            "default": 1,
+        },
         "minimal_roi": {
             "description": f"Minimum return on investment. {__IN_STRATEGY}",
             "type": "object",
@@ -212,6 +225,40 @@ CONF_SCHEMA = {
             "type": "array",
             "items": {"type": "string", "enum": BACKTEST_BREAKDOWNS},
         },
+        "backtest_engine": {
+            "description": (
+                "Data representation used by the backtesting loop. "
+                "`columnar` keeps candle data in numpy arrays to reduce memory usage."
+            ),
+            "type": "string",
+            "enum": BACKTEST_ENGINES,
+            "default": BACKTEST_ENGINE_DEFAULT,
+        },
+        "backtest_fast_path": {
+            "description": (
+                "Skip the exit evaluation of open trades for candles which can't trigger an "
+                "exit. Only used for strategies without per-candle callbacks."
+            ),
+            "type": "boolean",
+            "default": True,
+        },
+        "hyperopt_data_format": {
+            "description": (
+                "Storage format for hyperopt candle data shared with worker processes. "
+                "`mmap` memory-maps the data, so it's not copied into each worker."
+            ),
+            "type": "string",
+            "enum": HYPEROPT_DATA_FORMATS,
+            "default": HYPEROPT_DATA_FORMAT_DEFAULT,
+        },
+        "hyperopt_worker_pool": {
+            "description": (
+                "Use long-lived hyperopt worker processes, which receive strategy and data "
+                "only once instead of once per batch of epochs."
+            ),
+            "type": "boolean",
+            "default": False,
+        },
         "bot_name": {
             "description": "Name of the trading bot. Passed via API to a client.",
             "type": "string",
@@ -710,6 +757,24 @@ CONF_SCHEMA = {
             "enum": AVAILABLE_DATAHANDLERS,
             "default": "feather",
         },
+        "data_load_workers": {
+            "description": (
+                "Number of worker processes used to load historic OHLCV data, and to convert "
+                "trades to OHLCV data. 1 processes pairs sequentially, -1 uses all CPUs."
+            ),
+            "type": "integer",
+            "minimum": -1,
+            "default": 1,
+        },
+        "ohlcv_cache_size": {
+            "description": (
+                "Maximum size (in MB) of the on-disk cache of cleaned OHLCV data used by "
+                "backtesting. 0 disables the cache."
+            ),
+            "type": "integer",
+            "minimum": 0,
+            "default": 0,
+        },
         "dataformat_trades": {
             "description": "Data format for trade data.",
             "type": "string",
@@ -730,6 +795,12 @@ CONF_SCHEMA = {
             "description": "Download trades data by default (instead of ohlcv data).",
             "type": "boolean",
         },
+        "download_concurrency": {
+            "description": "Number of pairs / timeframes to download concurrently.",
+            "type": "integer",
+            "minimum": 1,
+            "default": 1,
+        },
         "max_entry_position_adjustment": {
             "description": f"Maximum entry position adjustment allowed. {__IN_STRATEGY}",
             "type": ["integer", "number"],
@@ -776,6 +847,13 @@ CONF_SCHEMA = {
                     "type": "number",
                     "minimum": 0.0,
                 },
+                "include_details": {
+                    "description": (
+                        "Populate the per-candle trades, orderflow and imbalances columns."
+                    ),
+                    "type": "boolean",
+                    "default": False,
+                },
             },
             "required": [
                 "max_candles",
@@ -847,6 +925,24 @@ CONF_SCHEMA = {
                     "type": "integer",
                     "default": 60,
                 },
+                "metadata_cache_ttl": {
+                    "description": (
+                        "Time in minutes to reuse markets, trading fees and leverage tiers "
+                        "cached on disk. 0 disables the cache."
+                    ),
+                    "type": "integer",
+                    "minimum": 0,
+                    "default": 0,
+                },
+                "ticker_snapshot_ttl": {
+                    "description": (
+                        "Time in seconds to reuse tickers loaded in bulk for pricing and "
+                        "balance conversion. 0 fetches tickers per pair."
+                    ),
+                    "type": "number",
+                    "minimum": 0,
+                    "default": 0,
+                },
                 "ccxt_config": {"description": "CCXT configuration settings.", "type": "object"},
                 "ccxt_async_config": {
                     "description": "CCXT asynchronous configuration settings.",
@@ -62,6 +62,10 @@ AVAILABLE_DATAHANDLERS = ["json", "jsongz", "hdf5", "feather", "parquet"]
 BACKTEST_BREAKDOWNS = ["day", "week", "month"]
 BACKTEST_CACHE_AGE = ["none", "day", "week", "month"]
 BACKTEST_CACHE_DEFAULT = "day"
+BACKTEST_ENGINES = ["list", "columnar"]
+BACKTEST_ENGINE_DEFAULT = "list"
+HYPEROPT_DATA_FORMATS = ["joblib", "mmap"]
+HYPEROPT_DATA_FORMAT_DEFAULT = "joblib"
 DRY_RUN_WALLET = 1000
 DATETIME_PRINT_FORMAT = "%Y-%m-%d %H:%M:%S"
 MATH_CLOSE_PREC = 1e-14  # Precision used for float comparisons
@@ -12,6 +12,7 @@ from freqtrade.data.converter.orderflow import populate_dataframe_with_trades
 from freqtrade.data.converter.trade_converter import (
     convert_trades_format,
     convert_trades_to_ohlcv,
+    trades_batches_to_ohlcv,
     trades_convert_types,
     trades_df_remove_duplicates,
     trades_dict_to_list,
@@ -32,6 +33,7 @@ __all__ = [
     "convert_trades_format",
     "convert_trades_to_ohlcv",
     "populate_dataframe_with_trades",
+    "trades_batches_to_ohlcv",
     "trades_convert_types",
     "trades_df_remove_duplicates",
     "trades_dict_to_list",
@@ -4,7 +4,6 @@ Functions to convert orderflow data from public_trades
 
 import logging
 import time
-from datetime import datetime
 
 import numpy as np
 import pandas as pd
@@ -123,72 +122,30 @@ def populate_dataframe_with_trades(
         trades = trades.loc[trades["candle_start"] >= start_date]
         trades.reset_index(inplace=True, drop=True)
 
-        # group trades by candle start
-        trades_grouped_by_candle_start = trades.groupby("candle_start", group_keys=False)
-
-        candle_start: datetime
-        for candle_start, trades_grouped_df in trades_grouped_by_candle_start:
-            is_between = candle_start == dataframe["date"]
-            if is_between.any():
-                # there can only be one row with the same date
-                index = dataframe.index[is_between][0]
-
-                if (
-                    cached_grouped_trades is not None
-                    and (candle_start == cached_grouped_trades["date"]).any()
-                ):
-                    # Check if the trades are already in the cache
-                    cache_idx = cached_grouped_trades.index[
-                        cached_grouped_trades["date"] == candle_start
-                    ][0]
-                    for col in ORDERFLOW_ADDED_COLUMNS:
-                        dataframe.at[index, col] = cached_grouped_trades.at[cache_idx, col]
-                    continue
-
-                dataframe.at[index, "trades"] = trades_grouped_df.drop(
-                    columns=["candle_start", "candle_end"]
-                ).to_dict(orient="records")
-
-                # Calculate orderflow for each candle
-                orderflow = trades_to_volumeprofile_with_total_delta_bid_ask(
-                    trades_grouped_df, scale=config_orderflow["scale"]
-                )
-                dataframe.at[index, "orderflow"] = orderflow.to_dict(orient="index")
-                # orderflow_series.loc[[index]] = [orderflow.to_dict(orient="index")]
-                # Calculate imbalances for each candle's orderflow
-                imbalances = trades_orderflow_to_imbalances(
-                    orderflow,
-                    imbalance_ratio=config_orderflow["imbalance_ratio"],
-                    imbalance_volume=config_orderflow["imbalance_volume"],
-                )
-                dataframe.at[index, "imbalances"] = imbalances.to_dict(orient="index")
-
-                stacked_imbalance_range = config_orderflow["stacked_imbalance_range"]
-                dataframe.at[index, "stacked_imbalances_bid"] = stacked_imbalance_bid(
-                    imbalances, stacked_imbalance_range=stacked_imbalance_range
-                )
-
-                dataframe.at[index, "stacked_imbalances_ask"] = stacked_imbalance_ask(
-                    imbalances, stacked_imbalance_range=stacked_imbalance_range
-                )
-
-                bid = np.where(
-                    trades_grouped_df["side"].str.contains("sell"), trades_grouped_df["amount"], 0
-                )
-
-                ask = np.where(
-                    trades_grouped_df["side"].str.contains("buy"), trades_grouped_df["amount"], 0
-                )
-                deltas_per_trade = ask - bid
-                dataframe.at[index, "max_delta"] = deltas_per_trade.cumsum().max()
-                dataframe.at[index, "min_delta"] = deltas_per_trade.cumsum().min()
-
-                dataframe.at[index, "bid"] = bid.sum()
-                dataframe.at[index, "ask"] = ask.sum()
-                dataframe.at[index, "delta"] = (
-                    dataframe.at[index, "ask"] - dataframe.at[index, "bid"]
-                )
-                dataframe.at[index, "total_trades"] = len(trades_grouped_df)
+        # Position of the candle of each trade - -1 if the candle is not in the dataframe
+        rows = pd.Index(dataframe["date"]).get_indexer(trades["candle_start"])
+        candle_rows = np.unique(rows[rows >= 0])
+        columns = {col: dataframe[col].to_numpy(copy=True) for col in ORDERFLOW_ADDED_COLUMNS}
+
+        if cached_grouped_trades is not None and not cached_grouped_trades.empty:
+            # Use cached values for candles which are already in the cache
+            cache_idx = pd.Index(cached_grouped_trades["date"]).get_indexer(
+                dataframe["date"].iloc[candle_rows]
+            )
+            is_cached = cache_idx >= 0
+            for col in ORDERFLOW_ADDED_COLUMNS:
+                columns[col][candle_rows[is_cached]] = cached_grouped_trades[col].to_numpy()[
+                    cache_idx[is_cached]
+                ]
+            rows = np.where(np.isin(rows, candle_rows[is_cached]), -1, rows)
+
+        to_calculate = rows >= 0
+        if to_calculate.any():
+            _calculate_orderflow_columns(
+                columns, trades.loc[to_calculate], rows[to_calculate], config_orderflow
+            )
+        for col, values in columns.items():
+            dataframe[col] = values
 
         logger.debug(f"trades.groups_keys in {time.time() - start_time} seconds")
 
@@ -202,6 +159,108 @@ def populate_dataframe_with_trades(
     return dataframe, cached_grouped_trades
 
 
+def _stacked_imbalance_counts(rows: np.ndarray, imbalance: np.ndarray) -> np.ndarray:
+    """
+    Number of consecutive imbalanced price levels (within one candle) up to each price level.
+    Vectorized version of the counting in stacked_imbalance().
+    """
+    positions = np.arange(len(imbalance))
+    new_run = np.ones(len(imbalance), dtype=bool)
+    new_run[1:] = (imbalance[1:] != imbalance[:-1]) | (rows[1:] != rows[:-1])
+    run_start = np.maximum.accumulate(np.where(new_run, positions, 0))
+    return imbalance * (positions - run_start + 1)
+
+
+def _calculate_orderflow_columns(
+    columns: dict[str, np.ndarray], trades: pd.DataFrame, rows: np.ndarray, config_orderflow: dict
+) -> None:
+    """
+    Calculate the orderflow columns for all candles at once, and write them to columns.
+    Results are identical to calling trades_to_volumeprofile_with_total_delta_bid_ask(),
+    trades_orderflow_to_imbalances() and stacked_imbalance_bid() / stacked_imbalance_ask()
+    for each candle.
+    :param columns: Column values, by column name - updated in place
+    :param trades: Trades to calculate the orderflow for
+    :param rows: Position of the candle of each trade in columns
+    :param config_orderflow: orderflow configuration
+    """
+    sell = trades["side"].str.contains("sell").to_numpy(dtype=bool)
+    buy = trades["side"].str.contains("buy").to_numpy(dtype=bool)
+    amount = trades["amount"].to_numpy(dtype="float64")
+    bid = np.where(sell, amount, 0)
+    ask = np.where(buy, amount, 0)
+
+    per_trade = pd.DataFrame({"row": rows, "bid": bid, "ask": ask, "delta": ask - bid})
+    grouped = per_trade.groupby("row", sort=True)
+    candles = grouped[["bid", "ask"]].sum()
+    cum_delta = grouped["delta"].cumsum().groupby(per_trade["row"])
+    idx = candles.index.to_numpy()
+    columns["bid"][idx] = candles["bid"].to_numpy()
+    columns["ask"][idx] = candles["ask"].to_numpy()
+    columns["delta"][idx] = (candles["ask"] - candles["bid"]).to_numpy()
+    columns["max_delta"][idx] = cum_delta.max().to_numpy()
+    columns["min_delta"][idx] = cum_delta.min().to_numpy()
+    columns["total_trades"][idx] = grouped.size().to_numpy()
+
+    # Volume profile per candle and price level
+    scale = config_orderflow["scale"]
+    profile = pd.DataFrame(
+        {
+            "row": rows,
+            "price": ((trades["price"] / scale).round() * scale).astype("float64").to_numpy(),
+            "bid": sell.astype("int64"),
+            "ask": buy.astype("int64"),
+            "delta": ask - bid,
+            "bid_amount": bid,
+            "ask_amount": ask,
+            "total_volume": ask + bid,
+            "total_trades": sell.astype("int64") + buy.astype("int64"),
+        }
+    )
+    profile = profile.groupby(["row", "price"], sort=True).sum()
+
+    # Imbalances compare bid and ask diagonally - within the same candle
+    next_ask = profile.groupby(level="row")["ask"].shift(-1)
+    low_volume = profile["total_volume"] < config_orderflow["imbalance_volume"]
+    imbalance_ratio = config_orderflow["imbalance_ratio"]
+    bid_imbalance = (profile["bid"] / next_ask) > imbalance_ratio
+    ask_imbalance = (next_ask / profile["bid"]) > imbalance_ratio
+    imbalances = pd.DataFrame(
+        {
+            "bid_imbalance": np.where(low_volume, False, bid_imbalance),
+            "ask_imbalance": np.where(low_volume, False, ask_imbalance),
+        },
+        index=profile.index,
+    )
+
+    profile_rows = profile.index.get_level_values("row").to_numpy()
+    prices = profile.index.get_level_values("price").to_numpy()
+    stacked_imbalance_range = config_orderflow["stacked_imbalance_range"]
+    for label, use_last in (("bid", False), ("ask", True)):
+        stacked = _stacked_imbalance_counts(
+            profile_rows, imbalances[f"{label}_imbalance"].to_numpy(dtype="int64")
+        )
+        is_stacked = stacked >= stacked_imbalance_range
+        stacked_prices = pd.Series(prices[is_stacked]).groupby(profile_rows[is_stacked])
+        stacked_price = stacked_prices.last() if use_last else stacked_prices.first()
+        columns[f"stacked_imbalances_{label}"][stacked_price.index.to_numpy()] = (
+            stacked_price.to_numpy()
+        )
+
+    if config_orderflow.get("include_details", False):
+        trade_records = trades.drop(columns=["candle_start", "candle_end"]).to_dict(
+            orient="records"
+        )
+        for row, positions in grouped.indices.items():
+            columns["trades"][row] = [trade_records[pos] for pos in positions]
+        for col, data in (("orderflow", profile), ("imbalances", imbalances)):
+            per_candle: dict[int, dict] = {}
+            for (row, price), values in data.to_dict(orient="index").items():
+                per_candle.setdefault(row, {})[price] = values
+            for row, values in per_candle.items():
+                columns[col][row] = values
+
+
 def trades_to_volumeprofile_with_total_delta_bid_ask(
     trades: pd.DataFrame, scale: float
 ) -> pd.DataFrame:
@@ -3,7 +3,9 @@ Functions to convert data from one format to another
 """
 
 import logging
+from collections.abc import Iterable
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import pandas as pd
 from pandas import DataFrame, to_datetime
@@ -18,6 +20,11 @@ from freqtrade.constants import (
 )
 from freqtrade.enums import CandleType, TradingMode
 from freqtrade.exceptions import OperationalException
+from freqtrade.util.parallel_workers import run_pairs_in_workers
+
+
+if TYPE_CHECKING:
+    from freqtrade.data.history.datahandlers import IDataHandler
 
 
 logger = logging.getLogger(__name__)
@@ -89,6 +96,118 @@ def trades_to_ohlcv(trades: DataFrame, timeframe: str) -> DataFrame:
     return df_new.loc[:, DEFAULT_DATAFRAME_COLUMNS]
 
 
+def _trades_to_partial_ohlcv(trades: DataFrame, timeframe: str) -> DataFrame:
+    """
+    Converts a batch of trades to OHLCV - including the timestamps of the first and last
+    trade of each candle, which are required to merge candles of multiple batches.
+    """
+    from freqtrade.exchange import timeframe_to_resample_freq
+
+    ohlcv = trades_to_ohlcv(trades, timeframe)
+    timestamps = trades.set_index("date")["timestamp"].resample(
+        timeframe_to_resample_freq(timeframe)
+    )
+    ohlcv["first_ts"] = timestamps.min()
+    ohlcv["last_ts"] = timestamps.max()
+    return ohlcv
+
+
+def _merge_partial_candles(candles: DataFrame) -> DataFrame:
+    """
+    Merge candles with the same date (built from different trade batches).
+    Open and close are taken from the candles containing the first and last trade.
+    """
+    candles = candles.reset_index(drop=True)
+    merged = (
+        candles.sort_values(["date", "first_ts"], kind="stable")
+        .groupby("date", sort=True)
+        .agg(
+            {
+                "open": "first",
+                "high": "max",
+                "low": "min",
+                "volume": "sum",
+                "first_ts": "min",
+                "last_ts": "max",
+            }
+        )
+    )
+    merged["close"] = (
+        candles.sort_values(["date", "last_ts"], kind="stable").groupby("date")["close"].last()
+    )
+    merged["date"] = merged.index
+    return merged
+
+
+def trades_batches_to_ohlcv(
+    batches: Iterable[DataFrame], timeframes: list[str]
+) -> dict[str, DataFrame]:
+    """
+    Converts trades to OHLCV for multiple timeframes, reading the trades only once.
+    Trades are processed batch by batch - only the candles are kept in memory.
+    The last candle of each batch is kept back, as it may continue in the next batch.
+    Result is identical to trades_to_ohlcv() on all trades.
+    :param batches: Trade batches, as returned by IDataHandler.trades_load_batches()
+    :param timeframes: Timeframes to resample data to
+    :return: Dict of timeframe -> OHLCV Dataframe. Timeframes without trades are missing.
+    """
+    candles: dict[str, list[DataFrame]] = {tf: [] for tf in timeframes}
+    pending: dict[str, DataFrame] = {}
+    for trades in batches:
+        if trades.empty:
+            continue
+        for timeframe in timeframes:
+            ohlcv = _trades_to_partial_ohlcv(trades, timeframe)
+            if (last := pending.get(timeframe)) is not None:
+                if ohlcv["date"].iloc[0] == last["date"].iloc[0]:
+                    first = _merge_partial_candles(pd.concat([last, ohlcv.iloc[:1]]))
+                    ohlcv = pd.concat([first, ohlcv.iloc[1:]])
+                else:
+                    candles[timeframe].append(last)
+            candles[timeframe].append(ohlcv.iloc[:-1])
+            pending[timeframe] = ohlcv.iloc[-1:]
+
+    result: dict[str, DataFrame] = {}
+    for timeframe, last in pending.items():
+        ohlcv = pd.concat([*candles[timeframe], last])
+        if not ohlcv.index.is_monotonic_increasing or not ohlcv.index.is_unique:
+            # Trades were not stored in order - candles may be spread over several batches.
+            ohlcv = _merge_partial_candles(ohlcv)
+        result[timeframe] = ohlcv.loc[:, DEFAULT_DATAFRAME_COLUMNS]
+    return result
+
+
+def _convert_pair_trades(
+    pair: str,
+    *,
+    timeframes: list[str],
+    data_handler_trades: "IDataHandler",
+    data_handler_ohlcv: "IDataHandler",
+    erase: bool,
+    candle_type: CandleType,
+    trading_mode: TradingMode,
+) -> None:
+    """
+    Convert the trades of one pair to ohlcv data for all timeframes, and store the result.
+    """
+    try:
+        ohlcvs = trades_batches_to_ohlcv(
+            data_handler_trades.trades_load_batches(pair, trading_mode), timeframes
+        )
+    except Exception:
+        logger.exception(f"Error loading trades for {pair}")
+        ohlcvs = {}
+    for timeframe in timeframes:
+        if erase:
+            if data_handler_ohlcv.ohlcv_purge(pair, timeframe, candle_type=candle_type):
+                logger.info(f"Deleting existing data for pair {pair}, interval {timeframe}.")
+        if (ohlcv := ohlcvs.get(timeframe)) is None:
+            logger.warning(f"Could not convert {pair} to OHLCV.")
+            continue
+        # Store ohlcv
+        data_handler_ohlcv.ohlcv_store(pair, timeframe, data=ohlcv, candle_type=candle_type)
+
+
 def convert_trades_to_ohlcv(
     pairs: list[str],
     timeframes: list[str],
@@ -98,9 +217,13 @@ def convert_trades_to_ohlcv(
     data_format_ohlcv: str,
     data_format_trades: str,
     candle_type: CandleType,
+    workers: int = 1,
 ) -> None:
     """
     Convert stored trades data to ohlcv data
+    Trades are read in batches, and only once per pair for all timeframes.
+    :param workers: Number of worker processes to convert pairs in parallel.
+                    1 converts pairs sequentially, -1 uses all CPUs.
     """
     from freqtrade.data.history import get_datahandler
 
@@ -112,18 +235,21 @@ def convert_trades_to_ohlcv(
         f"intervals: '{', '.join(timeframes)}' to {datadir}"
     )
     trading_mode = TradingMode.FUTURES if candle_type != CandleType.SPOT else TradingMode.SPOT
-    for pair in pairs:
-        trades = data_handler_trades.trades_load(pair, trading_mode)
-        for timeframe in timeframes:
-            if erase:
-                if data_handler_ohlcv.ohlcv_purge(pair, timeframe, candle_type=candle_type):
-                    logger.info(f"Deleting existing data for pair {pair}, interval {timeframe}.")
-            try:
-                ohlcv = trades_to_ohlcv(trades, timeframe)
-                # Store ohlcv
-                data_handler_ohlcv.ohlcv_store(pair, timeframe, data=ohlcv, candle_type=candle_type)
-            except ValueError:
-                logger.warning(f"Could not convert {pair} to OHLCV.")
+    convert_kwargs: dict[str, Any] = {
+        "timeframes": timeframes,
+        "data_handler_trades": data_handler_trades,
+        "data_handler_ohlcv": data_handler_ohlcv,
+        "erase": erase,
+        "candle_type": candle_type,
+        "trading_mode": trading_mode,
+    }
+    if workers in (0, 1) or len(pairs) < 2:
+        for pair in pairs:
+            _convert_pair_trades(pair, **convert_kwargs)
+        return
+
+    logger.info(f"Converting {len(pairs)} pairs using {workers} workers.")
+    run_pairs_in_workers(_convert_pair_trades, pairs, workers, **convert_kwargs)
 
 
 def convert_trades_format(config: Config, convert_from: str, convert_to: str, erase: bool):
@@ -7,7 +7,10 @@ Common Interface for bot and strategy to access data.
 
 import logging
 from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime, timezone
+from threading import Lock
 from typing import Any
 
 from pandas import DataFrame, Timedelta, Timestamp, to_timedelta
@@ -49,6 +52,9 @@ class DataProvider:
         self._pairlists = pairlists
         self.__rpc = rpc
         self.__cached_pairs: dict[PairWithTimeframe, tuple[DataFrame, datetime]] = {}
+        # Guards cache writes and buffered messages while pairs are analyzed in parallel
+        self.__lock = Lock()
+        self.__emit_buffer: dict[str, list[tuple[PairWithTimeframe, DataFrame, bool]]] | None = None
         self.__slice_index: int | None = None
         self.__slice_date: datetime | None = None
 
@@ -98,7 +104,8 @@ class DataProvider:
         :param candle_type: Any of the enum CandleType (must match trading mode!)
         """
         pair_key = (pair, timeframe, candle_type)
-        self.__cached_pairs[pair_key] = (dataframe, datetime.now(timezone.utc))
+        with self.__lock:
+            self.__cached_pairs[pair_key] = (dataframe, datetime.now(timezone.utc))
 
     # For multiple producers we will want to merge the pairlists instead of overwriting
     def _set_producer_pairs(self, pairlist: list[str], producer_name: str = "default"):
@@ -125,6 +132,13 @@ class DataProvider:
         :param dataframe: Dataframe to emit
         :param new_candle: This is a new candle
         """
+        if self.__emit_buffer is not None:
+            with self.__lock:
+                if self.__emit_buffer is not None:
+                    self.__emit_buffer.setdefault(pair_key[0], []).append(
+                        (pair_key, dataframe, new_candle)
+                    )
+                    return
         if self.__rpc:
             msg: RPCAnalyzedDFMsg = {
                 "type": RPCMessageType.ANALYZED_DF,
@@ -143,6 +157,34 @@ class DataProvider:
                     }
                 )
 
+    @contextmanager
+    def _buffer_emitted_dfs(self, pairs: list[str]) -> Iterator[None]:
+        """
+        Hold back dataframes emitted via _emit_df() while pairs are analyzed in parallel,
+        and send them in the order of pairs afterwards - independent of which pair finished first.
+        :param pairs: Pairs being analyzed, in the order messages should be sent in
+        """
+        self.__emit_buffer = {}
+        try:
+            yield
+        finally:
+            with self.__lock:
+                buffer, self.__emit_buffer = self.__emit_buffer or {}, None
+            order = {pair: idx for idx, pair in enumerate(pairs)}
+            for pair in sorted(buffer, key=lambda p: order.get(p, len(order))):
+                for pair_key, dataframe, new_candle in buffer[pair]:
+                    self._emit_df(pair_key, dataframe, new_candle)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Locks can't be pickled (the dataprovider is sent to hyperopt workers)
+        state = self.__dict__.copy()
+        del state["_DataProvider__lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.__lock = Lock()
+
     def _replace_external_df(
         self,
         pair: str,
@@ -328,6 +370,7 @@ class DataProvider:
                 timerange=timerange,
                 data_format=self._config["dataformat_ohlcv"],
                 candle_type=_candle_type,
+                cache_size=self._config.get("ohlcv_cache_size", 0),
             )
         return self.__cached_pairs_backtesting[saved_pair].copy()
 
@@ -524,8 +567,18 @@ class DataProvider:
             data_handler = get_datahandler(
                 self._config["datadir"], data_format=self._config["dataformat_trades"]
             )
+            # Only load trades for the backtest timerange (including startup candles)
+            timerange = TimeRange.parse_timerange(
+                None
+                if self._config.get("timerange") is None
+                else str(self._config.get("timerange"))
+            )
+            if _timeframe := timeframe or self._config.get("timeframe"):
+                timerange.subtract_start(
+                    timeframe_to_seconds(_timeframe) * self.get_required_startup(_timeframe)
+                )
             trades_df = data_handler.trades_load(
-                pair, self._config.get("trading_mode", TradingMode.SPOT)
+                pair, self._config.get("trading_mode", TradingMode.SPOT), timerange=timerange
             )
             return trades_df
 
@@ -548,7 +601,7 @@ class DataProvider:
         if self._exchange is None:
             raise OperationalException(NO_EXCHANGE_EXCEPTION)
         try:
-            return self._exchange.fetch_ticker(pair)
+            return self._exchange.get_ticker(pair)
         except ExchangeError:
             return {}
 
@@ -0,0 +1,258 @@
+"""
+Timerange-restricted loading of Arrow based (feather / parquet) OHLCV files.
+Only reads the date column to find the rows within the timerange - and afterwards only
+materializes the record batches / row groups containing these rows.
+Trades files are stored in partitions of one day, with an index of the partition timerange.
+"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+from pandas import DataFrame
+
+from freqtrade.configuration import TimeRange
+
+
+def _dates_to_ns(dates: pa.ChunkedArray | pa.Array) -> np.ndarray | None:
+    """
+    Convert a date column to int64 nanosecond timestamps.
+    Integer columns are assumed to be millisecond timestamps.
+    :return: numpy array, or None if the column type is not supported
+    """
+    if pa.types.is_timestamp(dates.type):
+        return dates.cast(pa.timestamp("ns", tz=dates.type.tz)).cast(pa.int64()).to_numpy()
+    if pa.types.is_integer(dates.type):
+        return dates.cast(pa.int64()).to_numpy() * 1_000_000
+    return None
+
+
+def timerange_rows(dates_ns: np.ndarray | None, timerange: TimeRange) -> tuple[int, int] | None:
+    """
+    Get the [start, end) row range of the rows within timerange.
+    The first row after the timerange end is included, so the caller can still tell
+    whether the data continues after the timerange (relevant for drop_incomplete).
+    :param dates_ns: Dates as int64 nanosecond timestamps
+    :return: Row range - or None if the rows can't be determined (unsupported or unsorted dates)
+    """
+    if dates_ns is None or (len(dates_ns) > 1 and np.any(np.diff(dates_ns) < 0)):
+        return None
+    start = 0
+    end = len(dates_ns)
+    if timerange.starttype == "date":
+        start = int(np.searchsorted(dates_ns, timerange.startts * 1_000_000_000, side="left"))
+    if timerange.stoptype == "date":
+        stop = int(np.searchsorted(dates_ns, timerange.stopts * 1_000_000_000, side="right"))
+        end = min(stop + 1, end)
+    return start, max(start, end)
+
+
+def _slice_chunks(chunk_rows: list[int], start: int, end: int) -> tuple[list[int], int]:
+    """
+    Select the chunks (record batches / row groups) overlapping the row range [start, end).
+    :return: List of chunk indexes, offset of start within the first selected chunk
+    """
+    selected: list[int] = []
+    offset = 0
+    chunk_start = 0
+    for idx, rows in enumerate(chunk_rows):
+        chunk_end = chunk_start + rows
+        if chunk_end > start and chunk_start < end:
+            if not selected:
+                offset = start - chunk_start
+            selected.append(idx)
+        chunk_start = chunk_end
+    return selected, offset
+
+
+def _table_to_df(table: pa.Table, offset: int, length: int) -> DataFrame:
+    return table.slice(offset, length).to_pandas().reset_index(drop=True)
+
+
+def read_feather_timerange(filename: Path, timerange: TimeRange) -> DataFrame:
+    """
+    Read the rows within timerange (including startup candles already contained in
+    timerange) from a feather file.
+    Falls back to reading the whole file if the rows can't be determined.
+    """
+    with pa.OSFile(str(filename)) as source:
+        date_reader = ipc.open_file(source, options=ipc.IpcReadOptions(included_fields=[0]))
+        date_batches = [
+            date_reader.get_batch(i).column(0) for i in range(date_reader.num_record_batches)
+        ]
+        reader = ipc.open_file(source)
+        rows = timerange_rows(
+            _dates_to_ns(pa.chunked_array(date_batches, type=reader.schema.field(0).type)),
+            timerange,
+        )
+        if rows is None:
+            return reader.read_pandas()
+        start, end = rows
+        selected, offset = _slice_chunks([len(b) for b in date_batches], start, end)
+        table = pa.Table.from_batches([reader.get_batch(i) for i in selected], reader.schema)
+        return _table_to_df(table, offset, end - start)
+
+
+def read_parquet_timerange(filename: Path, timerange: TimeRange) -> DataFrame:
+    """
+    Read the rows within timerange (including startup candles already contained in
+    timerange) from a parquet file. Only row groups containing these rows are read.
+    Falls back to reading the whole file if the rows can't be determined.
+    """
+    parquet_file = pq.ParquetFile(filename)
+    date_col = parquet_file.schema_arrow.names[0]
+    rows = timerange_rows(_dates_to_ns(parquet_file.read(columns=[date_col]).column(0)), timerange)
+    if rows is None:
+        return parquet_file.read().to_pandas()
+    start, end = rows
+    metadata = parquet_file.metadata
+    selected, offset = _slice_chunks(
+        [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)], start, end
+    )
+    table = parquet_file.read_row_groups(selected)
+    return _table_to_df(table, offset, end - start)
+
+
+# Trades are stored in partitions (feather record batches / parquet row groups) of one day.
+TRADES_PARTITION_MS = 86_400_000
+# Maximum number of trades per partition - busy days are split into multiple partitions.
+TRADES_PARTITION_MAX_ROWS = 1_000_000
+# Schema metadata key of the partition index (timestamp of the first / last trade per batch)
+TRADES_INDEX_KEY = b"freqtrade_trades_index"
+
+
+def _trades_partitions(timestamps: np.ndarray) -> list[tuple[int, int]]:
+    """
+    Split trades into [start, end) row ranges of one day each.
+    Trades not sorted by timestamp are kept in one range.
+    """
+    if len(timestamps) == 0:
+        return []
+    if len(timestamps) > 1 and np.any(np.diff(timestamps) < 0):
+        return [(0, len(timestamps))]
+    days = timestamps // TRADES_PARTITION_MS
+    bounds = [0, *(np.flatnonzero(np.diff(days)) + 1).tolist(), len(timestamps)]
+    return list(zip(bounds[:-1], bounds[1:], strict=True))
+
+
+def _trades_table_partitions(
+    data: DataFrame,
+) -> tuple[pa.Table, list[tuple[int, int]], list[list[int]]]:
+    """
+    Convert trades to an arrow table and split it into partitions.
+    :return: Table, row ranges of all partitions, [first, last] timestamp per partition
+    """
+    table = pa.Table.from_pandas(data.reset_index(drop=True), preserve_index=False)
+    timestamps = data["timestamp"].to_numpy(dtype=np.int64)
+    partitions: list[tuple[int, int]] = []
+    for start, end in _trades_partitions(timestamps):
+        partitions.extend(
+            (pos, min(pos + TRADES_PARTITION_MAX_ROWS, end))
+            for pos in range(start, end, TRADES_PARTITION_MAX_ROWS)
+        )
+    index = [
+        [int(timestamps[start:end].min()), int(timestamps[start:end].max())]
+        for start, end in partitions
+    ]
+    return table, partitions, index
+
+
+def _select_partitions(index: list[list[int]], timerange: TimeRange) -> list[int]:
+    """
+    Select the partitions containing trades within timerange.
+    :param index: [first, last] timestamp per partition
+    """
+    start = timerange.startts * 1000 if timerange.starttype == "date" else None
+    stop = timerange.stopts * 1000 if timerange.stoptype == "date" else None
+    return [
+        idx
+        for idx, (first, last) in enumerate(index)
+        if (start is None or last >= start) and (stop is None or first < stop)
+    ]
+
+
+def write_feather_trades(filename: Path, data: DataFrame) -> None:
+    """
+    Write trades to a feather file - one record batch per day, and the partition index
+    as schema metadata.
+    """
+    table, partitions, index = _trades_table_partitions(data)
+    schema = table.schema.with_metadata(
+        {**(table.schema.metadata or {}), TRADES_INDEX_KEY: json.dumps(index).encode()}
+    )
+    options = ipc.IpcWriteOptions(compression=pa.Codec("lz4", compression_level=9))
+    with ipc.new_file(str(filename), schema, options=options) as writer:
+        for start, end in partitions:
+            writer.write_batch(table.slice(start, end - start).combine_chunks().to_batches()[0])
+
+
+def _feather_trades_index(source: pa.NativeFile, reader: ipc.RecordBatchFileReader) -> list:
+    """
+    Partition index of a feather trades file.
+    Files without index (written by earlier versions) are indexed by reading the
+    timestamp column only.
+    """
+    metadata = reader.schema.metadata or {}
+    if TRADES_INDEX_KEY in metadata:
+        index = json.loads(metadata[TRADES_INDEX_KEY])
+        if len(index) == reader.num_record_batches:
+            return index
+    ts_field = reader.schema.get_field_index("timestamp")
+    ts_reader = ipc.open_file(source, options=ipc.IpcReadOptions(included_fields=[ts_field]))
+    index = []
+    for i in range(ts_reader.num_record_batches):
+        min_max = pc.min_max(ts_reader.get_batch(i).column(0))
+        # Empty batches have no min / max
+        first, last = min_max["min"].as_py(), min_max["max"].as_py()
+        index.append([first, last] if first is not None else [0, -1])
+    return index
+
+
+def read_feather_trades(filename: Path, timerange: TimeRange) -> DataFrame:
+    """
+    Read the partitions of a feather trades file containing trades within timerange.
+    Returned trades are not filtered to the timerange.
+    """
+    with pa.memory_map(str(filename)) as source:
+        reader = ipc.open_file(source)
+        selected = _select_partitions(_feather_trades_index(source, reader), timerange)
+        table = pa.Table.from_batches([reader.get_batch(i) for i in selected], reader.schema)
+        return table.to_pandas()
+
+
+def write_parquet_trades(filename: Path, data: DataFrame) -> None:
+    """
+    Write trades to a parquet file - one row group per day. Row group statistics serve as
+    partition index.
+    """
+    table, partitions, _ = _trades_table_partitions(data)
+    with pq.ParquetWriter(filename, table.schema) as writer:
+        for start, end in partitions:
+            writer.write_table(table.slice(start, end - start))
+        if not partitions:
+            writer.write_table(table)
+
+
+def read_parquet_trades(filename: Path, timerange: TimeRange) -> DataFrame:
+    """
+    Read the row groups of a parquet trades file containing trades within timerange.
+    Returned trades are not filtered to the timerange.
+    Falls back to reading the whole file if row group statistics are missing.
+    """
+    with pq.ParquetFile(filename) as parquet_file:
+        metadata = parquet_file.metadata
+        ts_col = parquet_file.schema_arrow.get_field_index("timestamp")
+        index = []
+        for i in range(metadata.num_row_groups):
+            stats = metadata.row_group(i).column(ts_col).statistics
+            if stats is None or not stats.has_min_max:
+                return parquet_file.read().to_pandas()
+            index.append([stats.min, stats.max])
+        selected = _select_partitions(index, timerange)
+        if not selected:
+            return parquet_file.schema_arrow.empty_table().to_pandas()
+        return parquet_file.read_row_groups(selected).to_pandas()
@@ -1,16 +1,25 @@
 import logging
+from collections.abc import Iterator
+from glob import escape
+from pathlib import Path
 
-from pandas import DataFrame, read_feather, to_datetime
+import pyarrow as pa
+import pyarrow.ipc as ipc
+from pandas import DataFrame, concat, read_feather, to_datetime
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, DEFAULT_TRADES_COLUMNS
 from freqtrade.enums import CandleType, TradingMode
 
+from .arrowtimerange import read_feather_timerange, read_feather_trades, write_feather_trades
 from .idatahandler import IDataHandler
 
 
 logger = logging.getLogger(__name__)
 
+# Number of append segments per file - exceeding this merges them into the main file.
+MAX_APPEND_SEGMENTS = 50
+
 
 class FeatherDataHandler(IDataHandler):
     _columns = DEFAULT_DATAFRAME_COLUMNS
@@ -34,6 +43,9 @@ class FeatherDataHandler(IDataHandler):
         data.reset_index(drop=True).loc[:, self._columns].to_feather(
             filename, compression_level=9, compression="lz4"
         )
+        # All data is now in the main file
+        for segment in self._ohlcv_segments(filename):
+            segment.unlink()
 
     def _ohlcv_load(
         self, pair: str, timeframe: str, timerange: TimeRange | None, candle_type: CandleType
@@ -59,18 +71,15 @@ class FeatherDataHandler(IDataHandler):
             if not filename.exists():
                 return DataFrame(columns=self._columns)
         try:
-            pairdata = read_feather(filename)
-            pairdata.columns = self._columns
-            pairdata = pairdata.astype(
-                dtype={
-                    "open": "float",
-                    "high": "float",
-                    "low": "float",
-                    "close": "float",
-                    "volume": "float",
-                }
-            )
-            pairdata["date"] = to_datetime(pairdata["date"], unit="ms", utc=True)
+            if timerange and (timerange.starttype == "date" or timerange.stoptype == "date"):
+                # Only read rows within the timerange
+                pairdata = self._convert_ohlcv(read_feather_timerange(filename, timerange))
+            else:
+                pairdata = self._convert_ohlcv(read_feather(filename))
+            for segment in self._ohlcv_segments(filename):
+                pairdata = self._merge_appended(
+                    pairdata, self._convert_ohlcv(read_feather(segment))
+                )
             return pairdata
         except Exception as e:
             logger.exception(
@@ -82,13 +91,92 @@ class FeatherDataHandler(IDataHandler):
         self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType
     ) -> None:
         """
-        Append data to existing data structures
+        Append data to existing data.
+        Feather files can't be appended to, so data is written to a separate segment file
+        next to the main file - only the new candles are written.
+        Stored candles from the first date in data onwards are replaced by data.
         :param pair: Pair
         :param timeframe: Timeframe this ohlcv data is for
         :param data: Data to append.
         :param candle_type: Any of the enum CandleType (must match trading mode!)
         """
-        raise NotImplementedError()
+        if data.empty:
+            return
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        segments = self._ohlcv_segments(filename)
+        if not filename.exists() or len(segments) >= MAX_APPEND_SEGMENTS:
+            # Merge everything into the main file
+            stored = self._ohlcv_load(pair, timeframe, None, candle_type)
+            self.ohlcv_store(pair, timeframe, self._merge_appended(stored, data), candle_type)
+            return
+
+        index = int(segments[-1].suffix[1:]) + 1 if segments else 1
+        data.reset_index(drop=True).loc[:, self._columns].to_feather(
+            filename.with_name(f"{filename.name}.{index:04d}"),
+            compression_level=9,
+            compression="lz4",
+        )
+
+    def ohlcv_source_files(self, pair: str, timeframe: str, candle_type: CandleType) -> list[Path]:
+        files = super().ohlcv_source_files(pair, timeframe, candle_type)
+        return files + self._ohlcv_segments(files[0])
+
+    def ohlcv_purge(self, pair: str, timeframe: str, candle_type: CandleType) -> bool:
+        """
+        Remove data for this pair - including append segments.
+        :param pair: Delete data for this pair.
+        :param timeframe: Timeframe (e.g. "5m")
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: True when deleted, false if file did not exist.
+        """
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        for segment in self._ohlcv_segments(filename):
+            segment.unlink()
+        return super().ohlcv_purge(pair, timeframe, candle_type)
+
+    def _convert_ohlcv(self, pairdata: DataFrame) -> DataFrame:
+        pairdata.columns = self._columns
+        pairdata = pairdata.astype(
+            dtype={
+                "open": "float",
+                "high": "float",
+                "low": "float",
+                "close": "float",
+                "volume": "float",
+            }
+        )
+        pairdata["date"] = to_datetime(pairdata["date"], unit="ms", utc=True)
+        return pairdata
+
+    def _ohlcv_rename(self, file_old: Path, file_new: Path) -> None:
+        for segment in self._ohlcv_segments(file_new):
+            segment.unlink()
+        for segment in self._ohlcv_segments(file_old):
+            segment.rename(file_new.with_name(f"{file_new.name}{segment.suffix}"))
+        super()._ohlcv_rename(file_old, file_new)
+
+    @staticmethod
+    def _ohlcv_segments(filename: Path) -> list[Path]:
+        """
+        Get the append segments of an ohlcv file, in the order they were written.
+        Segments are named like the main file, with a numeric suffix (e.g. ".0001").
+        """
+        segments = [
+            p for p in filename.parent.glob(f"{escape(filename.name)}.*") if p.suffix[1:].isdigit()
+        ]
+        return sorted(segments, key=lambda p: int(p.suffix[1:]))
+
+    @staticmethod
+    def _merge_appended(data: DataFrame, appended: DataFrame) -> DataFrame:
+        """
+        Replace candles in data from the first date in appended onwards by appended.
+        """
+        if data.empty:
+            return appended.reset_index(drop=True)
+        if appended.empty:
+            return data
+        data = data[data["date"] < appended["date"].iloc[0]]
+        return concat([data, appended], axis=0, ignore_index=True)
 
     def _trades_store(self, pair: str, data: DataFrame, trading_mode: TradingMode) -> None:
         """
@@ -100,7 +188,7 @@ class FeatherDataHandler(IDataHandler):
         """
         filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
         self.create_dir_if_needed(filename)
-        data.reset_index(drop=True).to_feather(filename, compression_level=9, compression="lz4")
+        write_feather_trades(filename, data)
 
     def trades_append(self, pair: str, data: DataFrame):
         """
@@ -115,21 +203,52 @@ class FeatherDataHandler(IDataHandler):
         self, pair: str, trading_mode: TradingMode, timerange: TimeRange | None = None
     ) -> DataFrame:
         """
-        Load a pair from file, either .json.gz or .json
-        # TODO: respect timerange ...
+        Load a pair from file.
         :param pair: Load trades for this pair
         :param trading_mode: Trading mode to use (used to determine the filename)
-        :param timerange: Timerange to load trades for - currently not implemented
+        :param timerange: Timerange to load trades for - only the daily partitions
+                          overlapping the timerange are read.
         :return: Dataframe containing trades
         """
         filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
         if not filename.exists():
             return DataFrame(columns=DEFAULT_TRADES_COLUMNS)
 
+        if timerange and (timerange.starttype == "date" or timerange.stoptype == "date"):
+            return read_feather_trades(filename, timerange)
         tradesdata = read_feather(filename)
 
         return tradesdata
 
+    def _trades_load_batches(
+        self, pair: str, trading_mode: TradingMode, batch_size: int
+    ) -> Iterator[DataFrame]:
+        """
+        Load a pair from file, combining record batches up to batch_size trades.
+        :param pair: Load trades for this pair
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        :param batch_size: Approximate number of trades per batch
+        :return: Iterator of Dataframes containing trades
+        """
+        filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        if not filename.exists():
+            return
+
+        with pa.memory_map(str(filename)) as source:
+            reader = ipc.open_file(source)
+            batches: list[pa.RecordBatch] = []
+            rows = 0
+            for idx in range(reader.num_record_batches):
+                batch = reader.get_batch(idx)
+                batches.append(batch)
+                rows += batch.num_rows
+                if rows >= batch_size:
+                    yield pa.Table.from_batches(batches, schema=reader.schema).to_pandas()
+                    batches = []
+                    rows = 0
+            if batches:
+                yield pa.Table.from_batches(batches, schema=reader.schema).to_pandas()
+
     @classmethod
     def _get_file_extension(cls):
         return "feather"
@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Iterator
 
 import numpy as np
 import pandas as pd
@@ -103,13 +104,32 @@ class HDF5DataHandler(IDataHandler):
         self, pair: str, timeframe: str, data: pd.DataFrame, candle_type: CandleType
     ) -> None:
         """
-        Append data to existing data structures
+        Append data to the existing hdf5 table.
+        Stored candles from the first date in data onwards are replaced by data -
+        only the new candles are written.
         :param pair: Pair
         :param timeframe: Timeframe this ohlcv data is for
         :param data: Data to append.
         :param candle_type: Any of the enum CandleType (must match trading mode!)
         """
-        raise NotImplementedError()
+        if data.empty:
+            return
+        key = self._pair_ohlcv_key(pair, timeframe)
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        if not filename.exists():
+            self.ohlcv_store(pair, timeframe, data, candle_type)
+            return
+
+        _data = data.loc[:, self._columns].reset_index(drop=True)
+        _data["date"] = _data["date"].astype("datetime64[ns, UTC]")
+        with pd.HDFStore(filename, mode="a", complevel=9, complib="blosc") as store:
+            if key in store:
+                stored_date = store.select(key, stop=1)["date"]
+                if not stored_date.empty:
+                    # Timezone objects must match the stored table.
+                    _data["date"] = _data["date"].dt.tz_convert(stored_date.dt.tz)
+                store.remove(key, where=[f"date >= Timestamp({_data['date'].iloc[0].value})"])
+            store.append(key, _data, format="table", data_columns=["date"])
 
     def _trades_store(self, pair: str, data: pd.DataFrame, trading_mode: TradingMode) -> None:
         """
@@ -166,6 +186,26 @@ class HDF5DataHandler(IDataHandler):
         trades[["id", "type"]] = trades[["id", "type"]].replace({np.nan: None})
         return trades
 
+    def _trades_load_batches(
+        self, pair: str, trading_mode: TradingMode, batch_size: int
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Load a pair from h5 file in chunks of batch_size trades.
+        :param pair: Load trades for this pair
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        :param batch_size: Approximate number of trades per batch
+        :return: Iterator of Dataframes containing trades
+        """
+        key = self._pair_trades_key(pair)
+        filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        if not filename.exists():
+            return
+
+        with pd.HDFStore(filename, mode="r") as store:
+            for trades in store.select(key, chunksize=batch_size):
+                trades[["id", "type"]] = trades[["id", "type"]].replace({np.nan: None})
+                yield trades
+
     @classmethod
     def _get_file_extension(cls):
         return "h5"
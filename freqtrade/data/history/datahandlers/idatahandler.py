@@ -7,6 +7,7 @@ It's subclasses handle and storing data from disk.
 import logging
 import re
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from copy import deepcopy
 from datetime import datetime, timezone
 from pathlib import Path
@@ -28,6 +29,9 @@ from freqtrade.exchange import timeframe_to_seconds
 
 logger = logging.getLogger(__name__)
 
+# Default number of trades per batch when loading trades in batches
+TRADES_BATCH_SIZE = 1_000_000
+
 
 class IDataHandler(ABC):
     _OHLCV_REGEX = r"^([a-zA-Z_\d-]+)\-(\d+[a-zA-Z]{1,2})\-?([a-zA-Z_]*)?(?=\.)"
@@ -140,6 +144,23 @@ class IDataHandler(ABC):
         :return: DataFrame with ohlcv data, or empty DataFrame
         """
 
+    def ohlcv_source_files(self, pair: str, timeframe: str, candle_type: CandleType) -> list[Path]:
+        """
+        Get the files the ohlcv data of this pair is loaded from.
+        Files don't necessarily exist.
+        :param pair: Pair to get files for
+        :param timeframe: Timeframe (e.g. "5m")
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: List of files
+        """
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        if not filename.exists():
+            # Fallback mode for 1M files
+            filename = self._pair_data_filename(
+                self._datadir, pair, timeframe, candle_type, no_timeframe_modify=True
+            )
+        return [filename]
+
     def ohlcv_purge(self, pair: str, timeframe: str, candle_type: CandleType) -> bool:
         """
         Remove data for this pair
@@ -252,10 +273,24 @@ class IDataHandler(ABC):
         Load a pair from file, either .json.gz or .json
         :param pair: Load trades for this pair
         :param trading_mode: Trading mode to use (used to determine the filename)
-        :param timerange: Timerange to load trades for - currently not implemented
+        :param timerange: Timerange to load trades for - implementations may return
+                          additional trades outside of the timerange
         :return: Dataframe containing trades
         """
 
+    def _trades_load_batches(
+        self, pair: str, trading_mode: TradingMode, batch_size: int
+    ) -> Iterator[DataFrame]:
+        """
+        Load a pair from file in batches, in file order.
+        Loads the whole file at once - formats supporting partial reads override this.
+        :param pair: Load trades for this pair
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        :param batch_size: Approximate number of trades per batch
+        :return: Iterator of Dataframes containing trades
+        """
+        yield self._trades_load(pair, trading_mode)
+
     def trades_store(self, pair: str, data: DataFrame, trading_mode: TradingMode) -> None:
         """
         Store trades data (list of Dicts) to file
@@ -288,7 +323,7 @@ class IDataHandler(ABC):
         Removes duplicates in the process.
         :param pair: Load trades for this pair
         :param trading_mode: Trading mode to use (used to determine the filename)
-        :param timerange: Timerange to load trades for - currently not implemented
+        :param timerange: Timerange to load trades for
         :return: List of trades
         """
         try:
@@ -297,11 +332,56 @@ class IDataHandler(ABC):
             logger.exception(f"Error loading trades for {pair}")
             return DataFrame(columns=DEFAULT_TRADES_COLUMNS)
 
+        if timerange:
+            if timerange.starttype == "date":
+                trades = trades[trades["timestamp"] >= timerange.startts * 1000]
+            if timerange.stoptype == "date":
+                trades = trades[trades["timestamp"] < timerange.stopts * 1000]
         trades = trades_df_remove_duplicates(trades)
 
         trades = trades_convert_types(trades)
         return trades
 
+    def trades_load_batches(
+        self, pair: str, trading_mode: TradingMode, batch_size: int = TRADES_BATCH_SIZE
+    ) -> Iterator[DataFrame]:
+        """
+        Load a pair from file in batches - so large files don't need to fit into memory.
+        Removes duplicates in the process. Duplicates across batch boundaries are only
+        detected for trades stored in timestamp order (as stored by download-data).
+        Errors while loading are raised - a partial result must not be mistaken for all trades.
+        :param pair: Load trades for this pair
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        :param batch_size: Approximate number of trades per batch
+        :return: Iterator of Dataframes containing trades
+        """
+        # Keys of the trades with the last timestamp of the previous batch
+        boundary_ts = None
+        boundary_keys: set[tuple] = set()
+        for trades in self._trades_load_batches(pair, trading_mode, batch_size):
+            trades = trades_df_remove_duplicates(trades)
+            if boundary_keys:
+                head = (trades["timestamp"] == boundary_ts).to_numpy()
+                if head.any():
+                    head[head] = [
+                        key in boundary_keys
+                        for key in zip(
+                            trades["timestamp"][head].tolist(),
+                            trades["id"][head].tolist(),
+                            strict=True,
+                        )
+                    ]
+                    trades = trades[~head]
+            if trades.empty:
+                continue
+            last_ts = trades["timestamp"].iloc[-1]
+            if last_ts != boundary_ts:
+                boundary_ts = last_ts
+                boundary_keys = set()
+            tail = trades[trades["timestamp"] == last_ts]
+            boundary_keys.update(zip(tail["timestamp"].tolist(), tail["id"].tolist(), strict=True))
+            yield trades_convert_types(trades)
+
     @classmethod
     def create_dir_if_needed(cls, datadir: Path):
         """
@@ -499,7 +579,7 @@ class IDataHandler(ABC):
         if file_new.exists():
             logger.warning(f"{file_new} exists already, can't migrate {pair}.")
             return
-        file_old.rename(file_new)
+        self._ohlcv_rename(file_old, file_new)
 
     def fix_funding_fee_timeframe(self, ff_timeframe: str):
         """
@@ -528,7 +608,14 @@ class IDataHandler(ABC):
                 logger.warning(f"{new_name} already exists, Removing.")
                 Path(new_name).unlink()
 
-            Path(old_name).rename(new_name)
+            self._ohlcv_rename(Path(old_name), Path(new_name))
+
+    def _ohlcv_rename(self, file_old: Path, file_new: Path) -> None:
+        """
+        Rename an ohlcv data file.
+        Subclasses storing one pair in multiple files must rename all of them.
+        """
+        file_old.rename(file_new)
 
 
 def get_datahandlerclass(datatype: str) -> type[IDataHandler]:
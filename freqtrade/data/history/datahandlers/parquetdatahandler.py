@@ -1,11 +1,14 @@
 import logging
+from collections.abc import Iterator
 
+import pyarrow.parquet as pq
 from pandas import DataFrame, read_parquet, to_datetime
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, DEFAULT_TRADES_COLUMNS
 from freqtrade.enums import CandleType, TradingMode
 
+from .arrowtimerange import read_parquet_timerange, read_parquet_trades, write_parquet_trades
 from .idatahandler import IDataHandler
 
 
@@ -57,7 +60,11 @@ class ParquetDataHandler(IDataHandler):
             if not filename.exists():
                 return DataFrame(columns=self._columns)
         try:
-            pairdata = read_parquet(filename)
+            if timerange and (timerange.starttype == "date" or timerange.stoptype == "date"):
+                # Only read rows within the timerange
+                pairdata = read_parquet_timerange(filename, timerange)
+            else:
+                pairdata = read_parquet(filename)
             pairdata.columns = self._columns
             pairdata = pairdata.astype(
                 dtype={
@@ -98,7 +105,7 @@ class ParquetDataHandler(IDataHandler):
         """
         filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
         self.create_dir_if_needed(filename)
-        data.reset_index(drop=True).to_parquet(filename)
+        write_parquet_trades(filename, data)
 
     def trades_append(self, pair: str, data: DataFrame):
         """
@@ -113,21 +120,41 @@ class ParquetDataHandler(IDataHandler):
         self, pair: str, trading_mode: TradingMode, timerange: TimeRange | None = None
     ) -> DataFrame:
         """
-        Load a pair from file, either .json.gz or .json
-        # TODO: respect timerange ...
+        Load a pair from file.
         :param pair: Load trades for this pair
         :param trading_mode: Trading mode to use (used to determine the filename)
-        :param timerange: Timerange to load trades for - currently not implemented
+        :param timerange: Timerange to load trades for - only the daily row groups
+                          overlapping the timerange are read.
         :return: List of trades
         """
         filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
         if not filename.exists():
             return DataFrame(columns=DEFAULT_TRADES_COLUMNS)
 
+        if timerange and (timerange.starttype == "date" or timerange.stoptype == "date"):
+            return read_parquet_trades(filename, timerange)
         tradesdata = read_parquet(filename)
 
         return tradesdata
 
+    def _trades_load_batches(
+        self, pair: str, trading_mode: TradingMode, batch_size: int
+    ) -> Iterator[DataFrame]:
+        """
+        Load a pair from file in batches of batch_size trades.
+        :param pair: Load trades for this pair
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        :param batch_size: Approximate number of trades per batch
+        :return: Iterator of Dataframes containing trades
+        """
+        filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        if not filename.exists():
+            return
+
+        with pq.ParquetFile(filename) as parquet_file:
+            for batch in parquet_file.iter_batches(batch_size=batch_size):
+                yield batch.to_pandas()
+
     @classmethod
     def _get_file_extension(cls):
         return "parquet"
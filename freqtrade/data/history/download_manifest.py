@@ -0,0 +1,86 @@
+"""
+Progress of a download-data run, allowing interrupted downloads to resume.
+"""
+
+import logging
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+from freqtrade.enums import CandleType
+from freqtrade.misc import atomic_write_file, dump_json_to_file, file_load_json
+from freqtrade.util import dt_ts
+
+
+logger = logging.getLogger(__name__)
+
+# File in the datadir containing the progress of the last download
+DOWNLOAD_MANIFEST_FILE = ".download_manifest.json"
+# Interrupted downloads are only resumed within this time - later runs must update all data
+DOWNLOAD_MANIFEST_MAX_AGE = timedelta(hours=6)
+
+
+class DownloadManifest:
+    """
+    Records completed downloads (pair / timeframe / candle type) in the data directory.
+    Starting the same download again (same exchange, timerange and options) shortly after an
+    interruption skips downloads which completed before. A download with different parameters,
+    or started after DOWNLOAD_MANIFEST_MAX_AGE, starts from scratch.
+    The manifest is removed once a run finished - also if some downloads failed.
+    """
+
+    def __init__(self, filename: Path, params: dict[str, Any]) -> None:
+        """
+        :param filename: File to store the manifest in
+        :param params: Download parameters - must be JSON serializable
+        """
+        self._filename = filename
+        self._params = params
+        self._completed: set[str] = set()
+        self._created = dt_ts()
+        try:
+            content = file_load_json(filename)
+        except Exception:
+            logger.warning(f"Could not read download manifest {filename}.")
+            content = None
+        if (
+            isinstance(content, dict)
+            and content.get("params") == params
+            and isinstance(content.get("created"), int)
+            and dt_ts() - content["created"] <= DOWNLOAD_MANIFEST_MAX_AGE.total_seconds() * 1000
+        ):
+            self._created = content["created"]
+            self._completed = set(content.get("completed", []))
+            if self._completed:
+                logger.info(
+                    f"Resuming download - skipping {len(self._completed)} completed downloads."
+                )
+
+    @staticmethod
+    def _key(pair: str, timeframe: str, candle_type: CandleType) -> str:
+        return f"{pair}|{timeframe}|{candle_type}"
+
+    def is_completed(self, pair: str, timeframe: str, candle_type: CandleType) -> bool:
+        return self._key(pair, timeframe, candle_type) in self._completed
+
+    def mark_completed(self, pair: str, timeframe: str, candle_type: CandleType) -> None:
+        """
+        Record a completed download, and write the manifest.
+        """
+        self._completed.add(self._key(pair, timeframe, candle_type))
+        content = {
+            "params": self._params,
+            "created": self._created,
+            "completed": sorted(self._completed),
+        }
+        try:
+            with atomic_write_file(self._filename) as tmp_file, tmp_file.open("w") as fp:
+                dump_json_to_file(fp, content)
+        except OSError as e:
+            logger.warning(f"Could not write download manifest {self._filename}: {e}")
+
+    def remove(self) -> None:
+        """
+        Remove the manifest - once the download run finished.
+        """
+        self._filename.unlink(missing_ok=True)
@@ -1,7 +1,10 @@
 import logging
 import operator
+import threading
+from collections.abc import Iterator
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Any
 
 from pandas import DataFrame, concat
 
@@ -14,12 +17,16 @@ from freqtrade.data.converter import (
     trades_list_to_df,
 )
 from freqtrade.data.history.datahandlers import IDataHandler, get_datahandler
+from freqtrade.data.history.download_manifest import DOWNLOAD_MANIFEST_FILE, DownloadManifest
+from freqtrade.data.history.ohlcv_cache import OHLCV_CACHE_DIR, OhlcvCache
 from freqtrade.enums import CandleType, TradingMode
 from freqtrade.exceptions import OperationalException
 from freqtrade.exchange import Exchange
+from freqtrade.exchange.exchange_types import OHLCVDownloadRequest
 from freqtrade.plugins.pairlist.pairlist_helpers import dynamic_expand_pairlist
 from freqtrade.util import dt_now, dt_ts, format_ms_time
 from freqtrade.util.migrations import migrate_data
+from freqtrade.util.parallel_workers import LogRecordCollector, run_pairs_in_workers
 from freqtrade.util.progress_tracker import CustomProgress, retrieve_progress_tracker
 
 
@@ -38,6 +45,7 @@ def load_pair_history(
     data_format: str | None = None,
     data_handler: IDataHandler | None = None,
     candle_type: CandleType = CandleType.SPOT,
+    cache_size: int = 0,
 ) -> DataFrame:
     """
     Load cached ohlcv history for the given pair.
@@ -53,19 +61,62 @@ def load_pair_history(
     :param data_handler: Initialized data-handler to use.
                          Will be initialized from data_format if not set
     :param candle_type: Any of the enum CandleType (must match trading mode!)
+    :param cache_size: Maximum size of the on-disk cache of cleaned data, in MB.
+                       0 disables the cache.
     :return: DataFrame with ohlcv data, or empty DataFrame
     """
     data_handler = get_datahandler(datadir, data_format, data_handler)
 
-    return data_handler.ohlcv_load(
-        pair=pair,
-        timeframe=timeframe,
-        timerange=timerange,
-        fill_missing=fill_up_missing,
-        drop_incomplete=drop_incomplete,
-        startup_candles=startup_candles,
-        candle_type=candle_type,
+    def load() -> DataFrame:
+        return data_handler.ohlcv_load(
+            pair=pair,
+            timeframe=timeframe,
+            timerange=timerange,
+            fill_missing=fill_up_missing,
+            drop_incomplete=drop_incomplete,
+            startup_candles=startup_candles,
+            candle_type=candle_type,
+        )
+
+    if cache_size <= 0:
+        return load()
+
+    cache_key = OhlcvCache.get_key(
+        data_handler.ohlcv_source_files(pair, timeframe, candle_type),
+        type(data_handler).__name__,
+        pair,
+        timeframe,
+        candle_type,
+        (timerange.starttype, timerange.startts, timerange.stoptype, timerange.stopts)
+        if timerange
+        else None,
+        fill_up_missing,
+        drop_incomplete,
+        startup_candles,
     )
+    if cache_key is None:
+        return load()
+    cache = OhlcvCache(datadir / OHLCV_CACHE_DIR, cache_size)
+    if (cached := cache.get(cache_key)) is not None:
+        data, messages = cached
+        # Repeat messages of the initial load - so output doesn't depend on the cache.
+        for level, name, msg in messages:
+            logging.getLogger(name).log(level, msg)
+        return data
+
+    # Collect log messages of the load, to store them alongside the data.
+    collector = LogRecordCollector()
+    # Other threads (e.g. the API server) may log at the same time.
+    thread_id = threading.get_ident()
+    collector.addFilter(lambda record: record.thread == thread_id)
+    ft_logger = logging.getLogger("freqtrade")
+    ft_logger.addHandler(collector)
+    try:
+        data = load()
+    finally:
+        ft_logger.removeHandler(collector)
+    cache.put(cache_key, data, [(r.levelno, r.name, r.msg) for r in collector.records])
+    return data
 
 
 def load_data(
@@ -80,6 +131,8 @@ def load_data(
     data_format: str = "feather",
     candle_type: CandleType = CandleType.SPOT,
     user_futures_funding_rate: int | None = None,
+    workers: int = 1,
+    cache_size: int = 0,
 ) -> dict[str, DataFrame]:
     """
     Load ohlcv history data for a list of pairs.
@@ -93,6 +146,10 @@ def load_data(
     :param fail_without_data: Raise OperationalException if no data is found.
     :param data_format: Data format which should be used. Defaults to json
     :param candle_type: Any of the enum CandleType (must match trading mode!)
+    :param workers: Number of worker processes to load pairs in parallel.
+                    1 loads pairs sequentially, -1 uses all CPUs.
+    :param cache_size: Maximum size of the on-disk cache of cleaned data, in MB.
+                       0 disables the cache.
     :return: dict(<pair>:<Dataframe>)
     """
     result: dict[str, DataFrame] = {}
@@ -100,18 +157,24 @@ def load_data(
         logger.info(f"Using indicator startup period: {startup_candles} ...")
 
     data_handler = get_datahandler(datadir, data_format)
-
-    for pair in pairs:
-        hist = load_pair_history(
-            pair=pair,
-            timeframe=timeframe,
-            datadir=datadir,
-            timerange=timerange,
-            fill_up_missing=fill_up_missing,
-            startup_candles=startup_candles,
-            data_handler=data_handler,
-            candle_type=candle_type,
-        )
+    load_kwargs: dict[str, Any] = {
+        "timeframe": timeframe,
+        "datadir": datadir,
+        "timerange": timerange,
+        "fill_up_missing": fill_up_missing,
+        "startup_candles": startup_candles,
+        "data_handler": data_handler,
+        "candle_type": candle_type,
+        "cache_size": cache_size,
+    }
+    if workers not in (0, 1) and len(pairs) > 1:
+        logger.info(f"Loading data for {len(pairs)} pairs using {workers} workers.")
+        # Each worker reads and cleans complete pairs, so data is only sent back once.
+        pair_data = run_pairs_in_workers(load_pair_history, pairs, workers, **load_kwargs)
+    else:
+        pair_data = [load_pair_history(pair=pair, **load_kwargs) for pair in pairs]
+
+    for pair, hist in zip(pairs, pair_data, strict=True):
         if not hist.empty:
             result[pair] = hist
         else:
@@ -159,6 +222,21 @@ def refresh_data(
         )
 
 
+def _load_stored_ohlcv(
+    pair: str, timeframe: str, data_handler: IDataHandler, candle_type: CandleType
+) -> DataFrame:
+    # Intentionally don't pass timerange in - since we need to load the full dataset.
+    return data_handler.ohlcv_load(
+        pair,
+        timeframe=timeframe,
+        timerange=None,
+        fill_missing=False,
+        drop_incomplete=True,
+        warn_no_data=False,
+        candle_type=candle_type,
+    )
+
+
 def _load_cached_data_for_updating(
     pair: str,
     timeframe: str,
@@ -183,16 +261,7 @@ def _load_cached_data_for_updating(
         if timerange.stoptype == "date":
             end = timerange.stopdt
 
-    # Intentionally don't pass timerange in - since we need to load the full dataset.
-    data = data_handler.ohlcv_load(
-        pair,
-        timeframe=timeframe,
-        timerange=None,
-        fill_missing=False,
-        drop_incomplete=True,
-        warn_no_data=False,
-        candle_type=candle_type,
-    )
+    data = _load_stored_ohlcv(pair, timeframe, data_handler, candle_type)
     if not data.empty:
         if prepend:
             end = data.iloc[0]["date"]
@@ -214,6 +283,114 @@ def _load_cached_data_for_updating(
     return data, start_ms, end_ms
 
 
+def _prepare_pair_download(
+    pair: str,
+    *,
+    datadir: Path,
+    timeframe: str,
+    new_pairs_days: int,
+    data_handler: IDataHandler,
+    timerange: TimeRange | None,
+    candle_type: CandleType,
+    erase: bool,
+    prepend: bool,
+) -> tuple[DataFrame, int, int | None]:
+    """
+    Erase / load stored data, and determine the range to download.
+    :return: Tuple of (stored data, since_ms, until_ms)
+    """
+    if erase:
+        if data_handler.ohlcv_purge(pair, timeframe, candle_type=candle_type):
+            logger.info(f"Deleting existing data for pair {pair}, {timeframe}, {candle_type}.")
+
+    data, since_ms, until_ms = _load_cached_data_for_updating(
+        pair,
+        timeframe,
+        timerange,
+        data_handler=data_handler,
+        candle_type=candle_type,
+        prepend=prepend,
+    )
+
+    logger.info(
+        f'Download history data for "{pair}", {timeframe}, '
+        f"{candle_type} and store in {datadir}. "
+        f'From {format_ms_time(since_ms) if since_ms else "start"} to '
+        f'{format_ms_time(until_ms) if until_ms else "now"}'
+    )
+
+    logger.debug(
+        "Current Start: %s",
+        f"{data.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
+    )
+    logger.debug(
+        "Current End: %s",
+        f"{data.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
+    )
+    # Default since_ms to 30 days if nothing is given
+    if not since_ms:
+        since_ms = int((datetime.now() - timedelta(days=new_pairs_days)).timestamp()) * 1000
+    return data, since_ms, until_ms
+
+
+def _store_pair_download(
+    pair: str,
+    *,
+    timeframe: str,
+    data_handler: IDataHandler,
+    candle_type: CandleType,
+    data: DataFrame | None,
+    new_dataframe: DataFrame,
+    prepend: bool,
+) -> None:
+    """
+    Store downloaded candles - appending them to the stored data if possible.
+    :param data: Stored data as returned by _prepare_pair_download().
+        None if stored data exists, but was not kept in memory - it's loaded again if needed.
+    """
+    logger.info(f"Downloaded data for {pair} with length {len(new_dataframe)}.")
+    if not prepend and (data is None or not data.empty):
+        # New data starts at the end of the stored data - only write the new candles.
+        try:
+            data_handler.ohlcv_append(
+                pair,
+                timeframe,
+                data=clean_ohlcv_dataframe(
+                    new_dataframe, timeframe, pair, fill_missing=False, drop_incomplete=False
+                ),
+                candle_type=candle_type,
+            )
+            return
+        except NotImplementedError:
+            pass
+
+    if data is None:
+        data = _load_stored_ohlcv(pair, timeframe, data_handler, candle_type)
+    if data.empty:
+        data = new_dataframe
+    else:
+        # Run cleaning again to ensure there were no duplicate candles
+        # Especially between existing and new data.
+        data = clean_ohlcv_dataframe(
+            concat([data, new_dataframe], axis=0),
+            timeframe,
+            pair,
+            fill_missing=False,
+            drop_incomplete=False,
+        )
+
+    logger.debug(
+        "New Start: %s",
+        f"{data.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
+    )
+    logger.debug(
+        "New End: %s",
+        f"{data.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
+    )
+
+    data_handler.ohlcv_store(pair, timeframe, data=data, candle_type=candle_type)
+
+
 def _download_pair_history(
     pair: str,
     *,
@@ -243,72 +420,35 @@ def _download_pair_history(
     data_handler = get_datahandler(datadir, data_handler=data_handler)
 
     try:
-        if erase:
-            if data_handler.ohlcv_purge(pair, timeframe, candle_type=candle_type):
-                logger.info(f"Deleting existing data for pair {pair}, {timeframe}, {candle_type}.")
-
-        data, since_ms, until_ms = _load_cached_data_for_updating(
+        data, since_ms, until_ms = _prepare_pair_download(
             pair,
-            timeframe,
-            timerange,
+            datadir=datadir,
+            timeframe=timeframe,
+            new_pairs_days=new_pairs_days,
             data_handler=data_handler,
+            timerange=timerange,
             candle_type=candle_type,
+            erase=erase,
             prepend=prepend,
         )
 
-        logger.info(
-            f'Download history data for "{pair}", {timeframe}, '
-            f"{candle_type} and store in {datadir}. "
-            f'From {format_ms_time(since_ms) if since_ms else "start"} to '
-            f'{format_ms_time(until_ms) if until_ms else "now"}'
-        )
-
-        logger.debug(
-            "Current Start: %s",
-            f"{data.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
-        )
-        logger.debug(
-            "Current End: %s",
-            f"{data.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
-        )
-
-        # Default since_ms to 30 days if nothing is given
         new_dataframe = exchange.get_historic_ohlcv(
             pair=pair,
             timeframe=timeframe,
-            since_ms=(
-                since_ms
-                if since_ms
-                else int((datetime.now() - timedelta(days=new_pairs_days)).timestamp()) * 1000
-            ),
+            since_ms=since_ms,
             is_new_pair=data.empty,
             candle_type=candle_type,
             until_ms=until_ms if until_ms else None,
         )
-        logger.info(f"Downloaded data for {pair} with length {len(new_dataframe)}.")
-        if data.empty:
-            data = new_dataframe
-        else:
-            # Run cleaning again to ensure there were no duplicate candles
-            # Especially between existing and new data.
-            data = clean_ohlcv_dataframe(
-                concat([data, new_dataframe], axis=0),
-                timeframe,
-                pair,
-                fill_missing=False,
-                drop_incomplete=False,
-            )
-
-        logger.debug(
-            "New Start: %s",
-            f"{data.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
-        )
-        logger.debug(
-            "New End: %s",
-            f"{data.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
+        _store_pair_download(
+            pair,
+            timeframe=timeframe,
+            data_handler=data_handler,
+            candle_type=candle_type,
+            data=data,
+            new_dataframe=new_dataframe,
+            prepend=prepend,
         )
-
-        data_handler.ohlcv_store(pair, timeframe, data=data, candle_type=candle_type)
         return True
 
     except Exception:
@@ -318,6 +458,91 @@ def _download_pair_history(
         return False
 
 
+def _download_pairs_concurrent(
+    jobs: list[tuple[str, str, CandleType]],
+    *,
+    datadir: Path,
+    exchange: Exchange,
+    new_pairs_days: int,
+    data_handler: IDataHandler,
+    timerange: TimeRange | None,
+    erase: bool,
+    prepend: bool,
+    concurrency: int,
+    manifest: DownloadManifest,
+    progress: CustomProgress,
+) -> None:
+    """
+    Download multiple pairs / timeframes / candle types concurrently.
+    Stored data is only loaded when a download starts, and candles are written as soon as a
+    download finished - so memory usage depends on concurrency, not on the number of jobs.
+    """
+    job_task = progress.add_task("Downloading data...", total=len(jobs))
+    # Stored data of running downloads - None if it's not kept in memory
+    stored: dict[tuple[str, str, CandleType], DataFrame | None] = {}
+
+    def requests() -> Iterator[OHLCVDownloadRequest]:
+        for pair, timeframe, candle_type in jobs:
+            logger.debug(f"Downloading pair {pair}, {candle_type}, interval {timeframe}.")
+            try:
+                data, since_ms, until_ms = _prepare_pair_download(
+                    pair,
+                    datadir=datadir,
+                    timeframe=timeframe,
+                    new_pairs_days=new_pairs_days,
+                    data_handler=data_handler,
+                    timerange=timerange,
+                    candle_type=candle_type,
+                    erase=erase,
+                    prepend=prepend,
+                )
+            except Exception:
+                logger.exception(
+                    f'Failed to download history data for pair: "{pair}", timeframe: {timeframe}.'
+                )
+                progress.update(job_task, advance=1)
+                continue
+            # Data is only needed again for prepending, or if it's empty.
+            stored[(pair, timeframe, candle_type)] = data if prepend or data.empty else None
+            yield {
+                "pair": pair,
+                "timeframe": timeframe,
+                "since_ms": since_ms,
+                "candle_type": candle_type,
+                "is_new_pair": data.empty,
+                "until_ms": until_ms,
+            }
+
+    def on_result(request: OHLCVDownloadRequest, result: DataFrame | Exception) -> None:
+        pair, timeframe, candle_type = (
+            request["pair"],
+            request["timeframe"],
+            request["candle_type"],
+        )
+        data = stored.pop((pair, timeframe, candle_type))
+        progress.update(job_task, advance=1, description=f"Downloaded {pair}, {timeframe}")
+        try:
+            if isinstance(result, Exception):
+                raise result
+            _store_pair_download(
+                pair,
+                timeframe=timeframe,
+                data_handler=data_handler,
+                candle_type=candle_type,
+                data=data,
+                new_dataframe=result,
+                prepend=prepend,
+            )
+        except Exception:
+            logger.exception(
+                f'Failed to download history data for pair: "{pair}", timeframe: {timeframe}.'
+            )
+            return
+        manifest.mark_completed(pair, timeframe, candle_type)
+
+    exchange.get_historic_ohlcv_concurrent(requests(), on_result, concurrency)
+
+
 def refresh_backtest_ohlcv_data(
     exchange: Exchange,
     pairs: list[str],
@@ -330,10 +555,14 @@ def refresh_backtest_ohlcv_data(
     data_format: str | None = None,
     prepend: bool = False,
     progress_tracker: CustomProgress | None = None,
+    concurrency: int = 1,
 ) -> list[str]:
     """
     Refresh stored ohlcv data for backtesting and hyperopt operations.
     Used by freqtrade download-data subcommand.
+    Completed downloads are recorded in a manifest in the datadir - so an interrupted download
+    continues where it stopped when started again soon with the same parameters.
+    :param concurrency: Number of pairs / timeframes to download concurrently.
     :return: List of pairs that are not available.
     """
     progress_tracker = retrieve_progress_tracker(progress_tracker)
@@ -341,66 +570,101 @@ def refresh_backtest_ohlcv_data(
     pairs_not_available = []
     data_handler = get_datahandler(datadir, data_format)
     candle_type = CandleType.get_default(trading_mode)
-    with progress_tracker as progress:
-        tf_length = len(timeframes) if trading_mode != "futures" else len(timeframes) + 2
-        timeframe_task = progress.add_task("Timeframe", total=tf_length)
-        pair_task = progress.add_task("Downloading data...", total=len(pairs))
-
-        for pair in pairs:
-            progress.update(pair_task, description=f"Downloading {pair}")
-            progress.update(timeframe_task, completed=0)
+    manifest = DownloadManifest(
+        datadir / DOWNLOAD_MANIFEST_FILE,
+        {
+            "exchange": exchange.name,
+            "trading_mode": str(trading_mode),
+            "timerange": [timerange.startts, timerange.stopts] if timerange else None,
+            "new_pairs_days": new_pairs_days,
+            "erase": erase,
+            "prepend": prepend,
+            "data_format": data_format,
+        },
+    )
+    jobs: dict[str, list[tuple[str, CandleType]]] = {}
+    for pair in pairs:
+        if pair not in exchange.markets:
+            pairs_not_available.append(f"{pair}: Pair not available on exchange.")
+            logger.info(f"Skipping pair {pair}...")
+            continue
+        jobs[pair] = [(str(timeframe), candle_type) for timeframe in timeframes]
+        if trading_mode == "futures":
+            # Predefined candletype (and timeframe) depending on exchange
+            # Downloads what is necessary to backtest based on futures data.
+            tf_mark = exchange.get_option("mark_ohlcv_timeframe")
+            tf_funding_rate = exchange.get_option("funding_fee_timeframe")
+
+            fr_candle_type = CandleType.from_string(exchange.get_option("mark_ohlcv_price"))
+            # All exchanges need FundingRate for futures trading.
+            # The timeframe is aligned to the mark-price timeframe.
+            jobs[pair] += [
+                (str(tf_funding_rate), CandleType.FUNDING_RATE),
+                (str(tf_mark), fr_candle_type),
+            ]
 
-            if pair not in exchange.markets:
-                pairs_not_available.append(f"{pair}: Pair not available on exchange.")
-                logger.info(f"Skipping pair {pair}...")
-                continue
-            for timeframe in timeframes:
-                progress.update(timeframe_task, description=f"Timeframe {timeframe}")
-                logger.debug(f"Downloading pair {pair}, {candle_type}, interval {timeframe}.")
-                _download_pair_history(
-                    pair=pair,
-                    datadir=datadir,
-                    exchange=exchange,
-                    timerange=timerange,
-                    data_handler=data_handler,
-                    timeframe=str(timeframe),
-                    new_pairs_days=new_pairs_days,
-                    candle_type=candle_type,
-                    erase=erase,
-                    prepend=prepend,
-                )
-                progress.update(timeframe_task, advance=1)
-            if trading_mode == "futures":
-                # Predefined candletype (and timeframe) depending on exchange
-                # Downloads what is necessary to backtest based on futures data.
-                tf_mark = exchange.get_option("mark_ohlcv_timeframe")
-                tf_funding_rate = exchange.get_option("funding_fee_timeframe")
-
-                fr_candle_type = CandleType.from_string(exchange.get_option("mark_ohlcv_price"))
-                # All exchanges need FundingRate for futures trading.
-                # The timeframe is aligned to the mark-price timeframe.
-                combs = ((CandleType.FUNDING_RATE, tf_funding_rate), (fr_candle_type, tf_mark))
-                for candle_type_f, tf in combs:
-                    logger.debug(f"Downloading pair {pair}, {candle_type_f}, interval {tf}.")
-                    _download_pair_history(
+    with progress_tracker as progress:
+        if concurrency > 1:
+            pending = [
+                (pair, timeframe, candle_type_j)
+                for pair, pair_jobs in jobs.items()
+                for timeframe, candle_type_j in pair_jobs
+                if not manifest.is_completed(pair, timeframe, candle_type_j)
+            ]
+            _download_pairs_concurrent(
+                pending,
+                datadir=datadir,
+                exchange=exchange,
+                new_pairs_days=new_pairs_days,
+                data_handler=data_handler,
+                timerange=timerange,
+                erase=erase,
+                prepend=prepend,
+                concurrency=concurrency,
+                manifest=manifest,
+                progress=progress,
+            )
+        else:
+            tf_length = len(timeframes) if trading_mode != "futures" else len(timeframes) + 2
+            timeframe_task = progress.add_task("Timeframe", total=tf_length)
+            pair_task = progress.add_task("Downloading data...", total=len(jobs))
+
+            for pair, pair_jobs in jobs.items():
+                progress.update(pair_task, description=f"Downloading {pair}")
+                progress.update(timeframe_task, completed=0)
+                for timeframe, candle_type_j in pair_jobs:
+                    progress.update(
+                        timeframe_task,
+                        description=(
+                            f"Timeframe {timeframe}"
+                            if candle_type_j == candle_type
+                            else f"Timeframe {candle_type_j}, {timeframe}"
+                        ),
+                    )
+                    if manifest.is_completed(pair, timeframe, candle_type_j):
+                        progress.update(timeframe_task, advance=1)
+                        continue
+                    logger.debug(f"Downloading pair {pair}, {candle_type_j}, interval {timeframe}.")
+                    if _download_pair_history(
                         pair=pair,
                         datadir=datadir,
                         exchange=exchange,
                         timerange=timerange,
                         data_handler=data_handler,
-                        timeframe=str(tf),
+                        timeframe=timeframe,
                         new_pairs_days=new_pairs_days,
-                        candle_type=candle_type_f,
+                        candle_type=candle_type_j,
                         erase=erase,
                         prepend=prepend,
-                    )
-                    progress.update(
-                        timeframe_task, advance=1, description=f"Timeframe {candle_type_f}, {tf}"
-                    )
+                    ):
+                        manifest.mark_completed(pair, timeframe, candle_type_j)
+                    progress.update(timeframe_task, advance=1)
 
-            progress.update(pair_task, advance=1)
-            progress.update(timeframe_task, description="Timeframe")
+                progress.update(pair_task, advance=1)
+                progress.update(timeframe_task, description="Timeframe")
 
+    # Only interrupted runs resume - failed downloads are retried by the next run anyway.
+    manifest.remove()
     return pairs_not_available
 
 
@@ -676,6 +940,7 @@ def download_data(
                     data_format_ohlcv=config["dataformat_ohlcv"],
                     data_format_trades=config["dataformat_trades"],
                     candle_type=config.get("candle_type_def", CandleType.SPOT),
+                    workers=config.get("data_load_workers", 1),
                 )
         else:
             if not exchange.get_option("ohlcv_has_history", True):
@@ -697,6 +962,7 @@ def download_data(
                 trading_mode=config.get("trading_mode", "spot"),
                 prepend=config.get("prepend_data", False),
                 progress_tracker=progress_tracker,
+                concurrency=config.get("download_concurrency", 1),
             )
     finally:
         if pairs_not_available:
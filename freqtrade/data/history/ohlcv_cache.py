@@ -0,0 +1,119 @@
+"""
+On-disk cache for cleaned OHLCV data.
+Entries are stored as feather files, keyed by a hash of the source files and load parameters.
+The total size of the cache is bounded - least recently used entries are evicted first.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.feather as feather
+from pandas import DataFrame
+
+from freqtrade.misc import atomic_write_file
+
+
+logger = logging.getLogger(__name__)
+
+# Subdirectory of the datadir containing the cache
+OHLCV_CACHE_DIR = ".ohlcv_cache"
+
+_MESSAGES_KEY = b"freqtrade_messages"
+
+
+class OhlcvCache:
+    """
+    Size-bounded cache of loaded OHLCV dataframes, including the log messages emitted
+    while loading them.
+    """
+
+    def __init__(self, cache_dir: Path, max_size_mb: int) -> None:
+        """
+        :param cache_dir: Directory to store cache entries in
+        :param max_size_mb: Maximum total size of all entries, in MB
+        """
+        self._cache_dir = cache_dir
+        self._max_size = max_size_mb * 1024 * 1024
+
+    @staticmethod
+    def get_key(source_files: list[Path], *params) -> str | None:
+        """
+        Build the cache key for data loaded from source_files with the given parameters.
+        Source files are identified by path, modification time and size - so entries of
+        changed files are no longer found.
+        :return: Cache key - or None if no source file exists
+        """
+        sources = []
+        for file in source_files:
+            try:
+                stat = file.stat()
+            except FileNotFoundError:
+                continue
+            sources.append((str(file.resolve()), stat.st_mtime_ns, stat.st_size))
+        if not sources:
+            return None
+        return hashlib.sha256(repr((sources, params)).encode()).hexdigest()
+
+    def _entry_file(self, key: str) -> Path:
+        return self._cache_dir / f"{key}.feather"
+
+    def get(self, key: str) -> tuple[DataFrame, list[tuple[int, str, str]]] | None:
+        """
+        Load a cache entry.
+        :return: Tuple of (dataframe, log messages) - or None if there's no entry for key.
+            log messages are tuples of (level, logger name, message).
+        """
+        filename = self._entry_file(key)
+        try:
+            table = feather.read_table(filename)
+        except (FileNotFoundError, pa.ArrowInvalid):
+            return None
+        try:
+            # Mark as recently used
+            os.utime(filename)
+        except OSError:
+            pass
+        metadata = table.schema.metadata or {}
+        messages = [
+            (level, name, msg)
+            for level, name, msg in json.loads(metadata.get(_MESSAGES_KEY, b"[]"))
+        ]
+        return table.to_pandas(), messages
+
+    def put(self, key: str, data: DataFrame, messages: list[tuple[int, str, str]]) -> None:
+        """
+        Store a cache entry, and evict least recently used entries if the cache is too large.
+        Failing writes (e.g. read-only or full datadir) are logged - the data stays uncached.
+        """
+        table = pa.Table.from_pandas(data, preserve_index=False)
+        table = table.replace_schema_metadata(
+            {**(table.schema.metadata or {}), _MESSAGES_KEY: json.dumps(messages).encode()}
+        )
+        filename = self._entry_file(key)
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            with atomic_write_file(filename) as tmp_file:
+                feather.write_feather(table, tmp_file, compression="lz4")
+            self._evict()
+        except OSError as e:
+            logger.warning(f"Could not write OHLCV cache entry {filename}: {e}")
+
+    def _evict(self) -> None:
+        entries = []
+        for file in self._cache_dir.glob("*.feather"):
+            try:
+                stat = file.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, file))
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, file in sorted(entries, key=lambda e: e[0]):
+            if total_size <= self._max_size:
+                break
+            logger.debug(f"Evicting {file.name} from OHLCV cache.")
+            file.unlink(missing_ok=True)
+            total_size -= size
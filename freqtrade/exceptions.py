@@ -82,3 +82,10 @@ class StrategyError(FreqtradeException):
     Errors with custom user-code detected.
     Usually caused by errors in the strategy.
     """
+
+
+class IncrementalStateError(StrategyError):
+    """
+    An incremental indicator was continued without being calculated for the pair first.
+    Triggers a full analysis of the dataframe.
+    """
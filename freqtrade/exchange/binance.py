@@ -35,6 +35,20 @@ class Binance(Exchange):
         "trades_has_history": True,
         "l2_limit_range": [5, 10, 20, 50, 100, 500, 1000],
         "ws_enabled": True,
+        "request_weight_limit": 6000,
+        "request_weights": {
+            "fetch_ohlcv": 2,
+            "fetch_trades": 25,
+            "fetch_ticker": 2,
+            "fetch_tickers": 80,
+            "fetch_order": 4,
+            "fetch_open_orders": 6,
+            "fetch_closed_orders": 20,
+            "fetch_orders": 20,
+            "fetch_my_trades": 20,
+            "fetch_balance": 20,
+            "load_markets": 20,
+        },
     }
     _ft_has_futures: FtHas = {
         "stoploss_order_types": {"limit": "stop", "market": "stop_market"},
@@ -48,6 +62,25 @@ class Binance(Exchange):
             PriceType.MARK: "MARK_PRICE",
         },
         "ws_enabled": False,
+        "request_weight_limit": 2400,
+        "request_weights": {
+            "fetch_trades": 20,
+            "fetch_ticker": 1,
+            "fetch_tickers": 40,
+            "fetch_order": 1,
+            "fetch_open_orders": 1,
+            "fetch_closed_orders": 5,
+            "fetch_orders": 5,
+            "fetch_my_trades": 5,
+            "fetch_balance": 5,
+            "fetch_positions": 5,
+            "fetch_funding_history": 30,
+            "fetch_funding_rates": 10,
+            "fetch_leverage_tiers": 1,
+            "fapiPrivateGetPositionSideDual": 30,
+            "fapiPrivateGetMultiAssetsMargin": 30,
+            "load_markets": 1,
+        },
     }
 
     _supported_trading_mode_margin_pairs: list[tuple[TradingMode, MarginMode]] = [
@@ -72,6 +105,37 @@ class Binance(Exchange):
             tickers = deep_merge_dicts(bidsasks, tickers, allow_null_overrides=False)
         return tickers
 
+    def ohlcv_request_weight(self, timeframe: str, candle_type: CandleType, limit: int) -> int:
+        if self.trading_mode == TradingMode.FUTURES:
+            # Futures klines weight depends on the number of candles requested
+            if limit < 100:
+                return 1
+            if limit < 500:
+                return 2
+            if limit <= 1000:
+                return 5
+            return 10
+        return super().ohlcv_request_weight(timeframe, candle_type, limit)
+
+    def l2_order_book_request_weight(self, limit: int | None) -> int:
+        # Order book weight depends on the depth requested
+        limit = limit or 100
+        if self.trading_mode == TradingMode.FUTURES:
+            if limit <= 50:
+                return 2
+            if limit <= 100:
+                return 5
+            if limit <= 500:
+                return 10
+            return 20
+        if limit <= 100:
+            return 5
+        if limit <= 500:
+            return 25
+        if limit <= 1000:
+            return 50
+        return 250
+
     @retrier
     def additional_exchange_init(self) -> None:
         """
@@ -111,7 +175,7 @@ class Binance(Exchange):
         except ccxt.BaseError as e:
             raise OperationalException(e) from e
 
-    def get_historic_ohlcv(
+    async def _async_get_historic_ohlcv_df(
         self,
         pair: str,
         timeframe: str,
@@ -126,9 +190,7 @@ class Binance(Exchange):
         :param candle_type: Any of the enum CandleType (must match trading mode!)
         """
         if is_new_pair:
-            x = self.loop.run_until_complete(
-                self._async_get_candle_history(pair, timeframe, candle_type, 0)
-            )
+            x = await self._async_get_candle_history(pair, timeframe, candle_type, 0)
             if x and x[3] and x[3][0] and x[3][0][0] > since_ms:
                 # Set starting date to first available candle.
                 since_ms = x[3][0][0]
@@ -156,7 +218,7 @@ class Binance(Exchange):
                 )
             )
         ):
-            return super().get_historic_ohlcv(
+            return await super()._async_get_historic_ohlcv_df(
                 pair=pair,
                 timeframe=timeframe,
                 since_ms=since_ms,
@@ -166,7 +228,7 @@ class Binance(Exchange):
             )
         else:
             # Download from data.binance.vision
-            return self.get_historic_ohlcv_fast(
+            return await self._async_get_historic_ohlcv_fast(
                 pair=pair,
                 timeframe=timeframe,
                 since_ms=since_ms,
@@ -175,7 +237,7 @@ class Binance(Exchange):
                 until_ms=until_ms,
             )
 
-    def get_historic_ohlcv_fast(
+    async def _async_get_historic_ohlcv_fast(
         self,
         pair: str,
         timeframe: str,
@@ -187,15 +249,13 @@ class Binance(Exchange):
         """
         Fastly fetch OHLCV data by leveraging https://data.binance.vision.
         """
-        df = self.loop.run_until_complete(
-            download_archive_ohlcv(
-                candle_type=candle_type,
-                pair=pair,
-                timeframe=timeframe,
-                since_ms=since_ms,
-                until_ms=until_ms,
-                markets=self.markets,
-            )
+        df = await download_archive_ohlcv(
+            candle_type=candle_type,
+            pair=pair,
+            timeframe=timeframe,
+            since_ms=since_ms,
+            until_ms=until_ms,
+            markets=self.markets,
         )
 
         # download the remaining data from rest API
@@ -208,7 +268,7 @@ class Binance(Exchange):
         if until_ms and rest_since_ms > until_ms:
             rest_df = DataFrame()
         else:
-            rest_df = super().get_historic_ohlcv(
+            rest_df = await super()._async_get_historic_ohlcv_df(
                 pair=pair,
                 timeframe=timeframe,
                 since_ms=rest_since_ms,
@@ -7,12 +7,13 @@ import asyncio
 import inspect
 import logging
 import signal
-from collections.abc import Coroutine, Generator
+from collections.abc import Callable, Coroutine, Generator, Iterable
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
 from math import floor, isnan
+from pathlib import Path
 from threading import Lock
-from typing import Any, Literal, TypeGuard
+from typing import Any, Literal, TypeGuard, TypeVar
 
 import ccxt
 import ccxt.pro as ccxt_pro
@@ -21,6 +22,7 @@ from ccxt import TICK_SIZE
 from dateutil import parser
 from pandas import DataFrame, concat
 
+from freqtrade.configuration import TimeRange
 from freqtrade.constants import (
     DEFAULT_AMOUNT_RESERVE_PERCENT,
     DEFAULT_TRADES_COLUMNS,
@@ -38,7 +40,6 @@ from freqtrade.constants import (
 from freqtrade.data.converter import (
     clean_ohlcv_dataframe,
     ohlcv_to_dataframe,
-    trades_df_remove_duplicates,
     trades_dict_to_list,
     trades_list_to_df,
 )
@@ -68,11 +69,13 @@ from freqtrade.exchange.common import (
     retrier,
     retrier_async,
 )
+from freqtrade.exchange.exchange_metadata_cache import ExchangeMetadataCache
 from freqtrade.exchange.exchange_types import (
     CcxtBalances,
     CcxtOrder,
     CcxtPosition,
     FtHas,
+    OHLCVDownloadRequest,
     OHLCVResponse,
     OrderBook,
     Ticker,
@@ -99,6 +102,14 @@ from freqtrade.exchange.exchange_utils_timeframe import (
     timeframe_to_seconds,
 )
 from freqtrade.exchange.exchange_ws import ExchangeWS
+from freqtrade.exchange.kline_buffer import KlineBuffer
+from freqtrade.exchange.request_scheduler import (
+    RequestPriority,
+    RequestScheduler,
+    WeightRecordingApi,
+)
+from freqtrade.exchange.ticker_snapshot import TickerSnapshot
+from freqtrade.exchange.trade_store import TradeStore
 from freqtrade.misc import (
     chunks,
     deep_merge_dicts,
@@ -113,6 +124,8 @@ from freqtrade.util.periodic_cache import PeriodicCache
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class Exchange:
     # Parameters to add directly to buy/sell calls (like agreeing to trading agreement)
@@ -158,6 +171,9 @@ class Exchange:
         "exchange_has_overrides": {},  # Dictionary overriding ccxt's "has".
         # Expected to be in the format {"fetchOHLCV": True} or {"fetchOHLCV": False}
         "ws_enabled": False,  # Set to true for exchanges with tested websocket support
+        # Request weight allowed per minute. Enables scheduling of async requests if set.
+        "request_weight_limit": None,
+        "request_weights": {},  # Weight per endpoint (e.g. {"fetch_tickers": 40}), default 1
     }
     _ft_has: FtHas = {}
     _ft_has_futures: FtHas = {}
@@ -211,10 +227,13 @@ class Exchange:
 
         # Holds candles
         self._klines: dict[PairWithTimeframe, DataFrame] = {}
+        # Preallocated storage backing the cached candles, to merge new candles efficiently
+        self._kline_buffers: dict[PairWithTimeframe, KlineBuffer] = {}
         self._expiring_candle_cache: dict[tuple[str, int], PeriodicCache] = {}
 
         # Holds public_trades
         self._trades: dict[PairWithTimeframe, DataFrame] = {}
+        self._trade_stores: dict[PairWithTimeframe, TradeStore] = {}
 
         # Holds all open sell orders for dry_run
         self._dry_run_open_orders: dict[str, Any] = {}
@@ -249,12 +268,25 @@ class Exchange:
         self._trades_pagination = self._ft_has["trades_pagination"]
         self._trades_pagination_arg = self._ft_has["trades_pagination_arg"]
 
+        weight_limit = self._ft_has["request_weight_limit"]
+        self._request_scheduler: RequestScheduler | None = (
+            RequestScheduler(weight_limit) if weight_limit else None
+        )
+
         # Initialize ccxt objects
         ccxt_config = self._ccxt_config
         ccxt_config = deep_merge_dicts(exchange_conf.get("ccxt_config", {}), ccxt_config)
         ccxt_config = deep_merge_dicts(exchange_conf.get("ccxt_sync_config", {}), ccxt_config)
 
         self._api = self._init_ccxt(exchange_conf, True, ccxt_config)
+        if self._request_scheduler:
+            # Account for the weight of all synchronous requests
+            self._api = WeightRecordingApi(  # type: ignore[assignment]
+                self._api,
+                self._request_scheduler,
+                self._sync_request_weight,
+                self._ft_has["request_weights"],
+            )
 
         ccxt_async_config = self._ccxt_config
         ccxt_async_config = deep_merge_dicts(
@@ -274,6 +306,30 @@ class Exchange:
             self._exchange_ws = ExchangeWS(self._config, self._ws_async)
 
         logger.info(f'Using Exchange "{self.name}"')
+        self._metadata_cache: ExchangeMetadataCache | None = None
+        metadata_cache_ttl = exchange_conf.get("metadata_cache_ttl", 0)
+        if metadata_cache_ttl and self._config.get("datadir"):
+            self._metadata_cache = ExchangeMetadataCache(
+                Path(self._config["datadir"])
+                / f"exchange_metadata_{self.id}_{self.trading_mode}.json",
+                metadata_cache_ttl,
+                self.id,
+                exchange_conf.get("key", ""),
+            )
+        self._ticker_snapshot: TickerSnapshot | None = None
+        ticker_snapshot_ttl = exchange_conf.get("ticker_snapshot_ttl", 0)
+        if ticker_snapshot_ttl:
+            if (
+                self.exchange_has("fetchTickers")
+                and self._ft_has["tickers_have_bid_ask"]
+                and self._ft_has["tickers_have_price"]
+            ):
+                self._ticker_snapshot = TickerSnapshot(ticker_snapshot_ttl)
+            else:
+                logger.warning(
+                    f"{self.name} does not provide complete tickers in bulk - "
+                    "ignoring `ticker_snapshot_ttl`."
+                )
         self.required_candle_call_count = 1
         if validate:
             # Initial markets load
@@ -474,6 +530,67 @@ class Exchange:
             )
         )
 
+    def request_weight(self, endpoint: str) -> int:
+        """
+        Weight of one request to endpoint, as counted by the exchange's rate limit.
+        :param endpoint: ccxt method name (e.g. "fetch_tickers")
+        """
+        return self._ft_has["request_weights"].get(endpoint, 1)
+
+    def ohlcv_request_weight(self, timeframe: str, candle_type: CandleType, limit: int) -> int:
+        """
+        Weight of one fetch_ohlcv call. Can be overridden for exchanges where the weight
+        depends on the number of candles requested.
+        """
+        return self.request_weight("fetch_ohlcv")
+
+    def l2_order_book_request_weight(self, limit: int | None) -> int:
+        """
+        Weight of one fetch_l2_order_book call. Can be overridden for exchanges where the
+        weight depends on the order book depth requested.
+        """
+        return self.request_weight("fetch_l2_order_book")
+
+    def _sync_request_weight(self, endpoint: str, args: tuple, kwargs: dict) -> int:
+        """
+        Weight of a synchronous ccxt call, recorded for all requests sent via self._api.
+        :param endpoint: ccxt method name
+        :param args: Positional arguments of the call
+        :param kwargs: Keyword arguments of the call
+        """
+        if endpoint == "fetch_l2_order_book":
+            return self.l2_order_book_request_weight(
+                kwargs.get("limit", args[1] if len(args) > 1 else None)
+            )
+        return self.request_weight(endpoint)
+
+    def _record_request(self, endpoint: str) -> None:
+        """
+        Record an asynchronous request which is not scheduled,
+        so scheduled requests account for its weight.
+        """
+        if self._request_scheduler:
+            self._request_scheduler.record(self.request_weight(endpoint))
+
+    async def _schedule_request(
+        self, awaitable: Coroutine[Any, Any, T], weight: int, priority: RequestPriority
+    ) -> T:
+        """
+        Run an async request once it fits into the exchange's request weight limit.
+        """
+        if not self._request_scheduler:
+            return await awaitable
+        return await self._request_scheduler.run(awaitable, weight, priority)
+
+    def get_request_stats(self) -> dict[str, Any]:
+        """
+        Request scheduler statistics (queue depth, used weight, waits per priority).
+        Empty if the exchange has no request weight limit configured.
+        """
+        if not self._request_scheduler:
+            return {}
+        return self._request_scheduler.get_stats()
+
     def get_markets(
         self,
         base_currencies: list[str] | None = None,
@@ -628,6 +745,7 @@ class Exchange:
 
     async def _api_reload_markets(self, reload: bool = False) -> dict[str, Any]:
         try:
+            self._record_request("load_markets")
             return await self._api_async.load_markets(reload=reload, params={})
         except ccxt.DDoSProtection as e:
             raise DDosProtection(e) from e
@@ -664,10 +782,28 @@ class Exchange:
             return None
         logger.debug("Performing scheduled market reload..")
         try:
-            # on initial load, we retry 3 times to ensure we get the markets
-            retries: int = 3 if force else 0
-            # Reload async markets, then assign them to sync api
-            self._markets = retrier(self._load_async_markets, retries=retries)(reload=True)
+            cached = (
+                self._metadata_cache.get("markets") if is_initial and self._metadata_cache else None
+            )
+            if cached:
+                (markets, currencies, options), updated = cached
+                logger.info("Using cached markets.")
+                self._markets = self._api_async.set_markets(markets, currencies)
+                deep_merge_dicts(options, self._api_async.options)
+            else:
+                # on initial load, we retry 3 times to ensure we get the markets
+                retries: int = 3 if force else 0
+                # Reload async markets, then assign them to sync api
+                self._markets = retrier(self._load_async_markets, retries=retries)(reload=True)
+                updated = dt_ts()
+                if self._metadata_cache:
+                    self._metadata_cache.set(
+                        markets=(
+                            self._api_async.markets,
+                            self._api_async.currencies,
+                            self._api_async.options,
+                        )
+                    )
             self._api.set_markets(self._api_async.markets, self._api_async.currencies)
             # Assign options array, as it contains some temporary information from the exchange.
             self._api.options = self._api_async.options
@@ -675,16 +811,36 @@ class Exchange:
                 # Set markets to avoid reloading on websocket api
                 self._ws_async.set_markets(self._api.markets, self._api.currencies)
                 self._ws_async.options = self._api.options
-            self._last_markets_refresh = dt_ts()
+            # Cached markets are reloaded once they're older than the refresh interval
+            self._last_markets_refresh = updated
 
             if is_initial and self._ft_has["needs_trading_fees"]:
-                self._trading_fees = self.fetch_trading_fees()
+                self._trading_fees = self._get_cached_metadata(
+                    "trading_fees", self.fetch_trading_fees
+                )
 
             if load_leverage_tiers and self.trading_mode == TradingMode.FUTURES:
                 self.fill_leverage_tiers()
         except (ccxt.BaseError, TemporaryError):
             logger.exception("Could not load markets.")
 
+    def _get_cached_metadata(self, section: str, loader: Callable[[], T]) -> T:
+        """
+        Get exchange metadata from the metadata cache if enabled and up to date,
+        otherwise load it using loader and update the cache.
+        :param section: Name of the cache section
+        :param loader: Function loading the data from the exchange
+        """
+        if self._metadata_cache:
+            cached = self._metadata_cache.get(section)
+            if cached:
+                logger.info(f"Using cached {section.replace('_', ' ')}.")
+                return cached[0]
+        data = loader()
+        if self._metadata_cache and data:
+            self._metadata_cache.set(**{section: data})
+        return data
+
     def validate_stakecurrency(self, stake_currency: str) -> None:
         """
         Checks stake-currency against available currencies on the exchange.
@@ -1817,6 +1973,7 @@ class Exchange:
         market_type: TradingMode | None = None,
     ) -> Tickers:
         """
+        Results for the default market type also refresh the ticker snapshot (if enabled).
         :param symbols: List of symbols to fetch
         :param cached: Allow cached result
         :param market_type: Market type to fetch - either spot or futures.
@@ -1840,6 +1997,8 @@ class Exchange:
             tickers = self._api.fetch_tickers(symbols, params)
             with self._cache_lock:
                 self._fetch_tickers_cache[cache_key] = tickers
+            if self._ticker_snapshot and not market_type:
+                self._ticker_snapshot.update(tickers, bulk=symbols is None)
             return tickers
         except ccxt.NotSupported as e:
             raise OperationalException(
@@ -1874,10 +2033,15 @@ class Exchange:
         """
         if coin == currency:
             return 1.0
-        tickers = self.get_tickers(cached=True)
+        # The ticker snapshot is refreshed by bulk calls - shared with pricing.
+        tickers = {} if self._ticker_snapshot else self.get_tickers(cached=True)
         try:
             for pair in self.get_valid_pair_combination(coin, currency):
-                ticker: Ticker | None = tickers.get(pair, None)
+                ticker: Ticker | None = (
+                    self._get_snapshot_ticker(pair)
+                    if self._ticker_snapshot
+                    else tickers.get(pair, None)
+                )
                 if not ticker:
                     tickers_other: Tickers = self.get_tickers(
                         cached=True,
@@ -1913,6 +2077,39 @@ class Exchange:
         except ccxt.BaseError as e:
             raise OperationalException(e) from e
 
+    def get_ticker(self, pair: str) -> Ticker:
+        """
+        Get the ticker of a pair from the ticker snapshot - refreshing all pairs with one bulk
+        call if needed. Falls back to fetch_ticker() if the snapshot is disabled or the pair
+        is not part of the bulk result.
+        :param pair: Pair to get the ticker for
+        :return: Ticker
+        """
+        snapshot = self._ticker_snapshot
+        if snapshot is None:
+            return self.fetch_ticker(pair)
+        ticker = self._get_snapshot_ticker(pair)
+        if ticker is None:
+            ticker = self.fetch_ticker(pair)
+            snapshot.update({pair: ticker})
+        return ticker
+
+    def _get_snapshot_ticker(self, pair: str) -> Ticker | None:
+        """
+        Get the ticker of a pair from the ticker snapshot.
+        Refreshes the snapshot with one bulk call if the last bulk call is outdated.
+        :return: Ticker - or None if the pair is not part of the bulk result
+        """
+        snapshot = self._ticker_snapshot
+        if snapshot is None:
+            return None
+        ticker = snapshot.get(pair)
+        if ticker is None and snapshot.bulk_expired():
+            # Fills the snapshot
+            self.get_tickers()
+            ticker = snapshot.get(pair)
+        return ticker
+
     @staticmethod
     def get_next_limit_in_list(
         limit: int, limit_range: list[int] | None, range_required: bool = True
@@ -2017,7 +2214,7 @@ class Exchange:
         else:
             logger.debug(f"Using Last {price_side.capitalize()} / Last Price")
             if ticker is None:
-                ticker = self.fetch_ticker(pair)
+                ticker = self.get_ticker(pair)
             rate = self._get_rate_from_ticker(side, ticker, conf_strategy, price_side)
 
         if rate is None:
@@ -2096,7 +2293,7 @@ class Exchange:
             order_book = self.fetch_l2_order_book(pair, order_book_top)
             entry_rate = self.get_rate(pair, refresh, "entry", is_short, order_book=order_book)
         elif not entry_rate:
-            ticker = self.fetch_ticker(pair)
+            ticker = self.get_ticker(pair)
             entry_rate = self.get_rate(pair, refresh, "entry", is_short, ticker=ticker)
         if not exit_rate:
             exit_rate = self.get_rate(
@@ -2305,15 +2502,77 @@ class Exchange:
         :param until_ms: Timestamp in milliseconds to get history up to
         :return: Dataframe with candle (OHLCV) data
         """
-        pair, _, _, data, _ = self.loop.run_until_complete(
-            self._async_get_historic_ohlcv(
+        return self.loop.run_until_complete(
+            self._async_get_historic_ohlcv_df(
                 pair=pair,
                 timeframe=timeframe,
                 since_ms=since_ms,
-                until_ms=until_ms,
                 candle_type=candle_type,
+                is_new_pair=is_new_pair,
+                until_ms=until_ms,
             )
         )
+
+    def get_historic_ohlcv_concurrent(
+        self,
+        requests: Iterable[OHLCVDownloadRequest],
+        on_result: Callable[[OHLCVDownloadRequest, DataFrame | Exception], None],
+        max_concurrent: int,
+    ) -> None:
+        """
+        Download candle history of multiple pairs / timeframes / candle types concurrently.
+        requests and on_result run in a worker thread (one call at a time), so disk I/O
+        in them doesn't block other downloads.
+        :param requests: Downloads to run - arguments as for get_historic_ohlcv().
+            Consumed lazily - the next request is only taken once a download finished.
+        :param on_result: Called as soon as a download finished, with the request and the
+            downloaded candles (or the exception raised by the download).
+        :param max_concurrent: Maximum number of downloads running at the same time
+        """
+        request_iter = iter(requests)
+
+        async def download_all() -> None:
+            # Serializes calls to the iterator and on_result
+            io_lock = asyncio.Lock()
+
+            async def next_request() -> OHLCVDownloadRequest | None:
+                async with io_lock:
+                    return await asyncio.to_thread(next, request_iter, None)
+
+            async def download_worker() -> None:
+                # All workers take requests from the same iterator
+                while (request := await next_request()) is not None:
+                    result: DataFrame | Exception
+                    try:
+                        result = await self._async_get_historic_ohlcv_df(**request)
+                    except Exception as e:
+                        result = e
+                    async with io_lock:
+                        await asyncio.to_thread(on_result, request, result)
+
+            await asyncio.gather(*(download_worker() for _ in range(max(max_concurrent, 1))))
+
+        self.loop.run_until_complete(download_all())
+
+    async def _async_get_historic_ohlcv_df(
+        self,
+        pair: str,
+        timeframe: str,
+        since_ms: int,
+        candle_type: CandleType,
+        is_new_pair: bool = False,
+        until_ms: int | None = None,
+    ) -> DataFrame:
+        """
+        Async implementation of get_historic_ohlcv()
+        """
+        pair, _, _, data, _ = await self._async_get_historic_ohlcv(
+            pair=pair,
+            timeframe=timeframe,
+            since_ms=since_ms,
+            until_ms=until_ms,
+            candle_type=candle_type,
+        )
         logger.debug(f"Downloaded data for {pair} from ccxt with length {len(data)}.")
         return ohlcv_to_dataframe(data, timeframe, pair, fill_missing=False, drop_incomplete=True)
 
@@ -2383,20 +2642,22 @@ class Exchange:
 
             if self._exchange_ws:
                 candle_date = int(timeframe_to_prev_date(timeframe).timestamp() * 1000)
-                prev_candle_date = int(date_minus_candles(timeframe, 1).timestamp() * 1000)
                 candles = self._exchange_ws.ccxt_object.ohlcvs.get(pair, {}).get(timeframe)
-                half_candle = int(candle_date - (candle_date - prev_candle_date) * 0.5)
                 last_refresh_time = int(
                     self._exchange_ws.klines_last_refresh.get((pair, timeframe, candle_type), 0)
                 )
+                # Open time of the last cached candle (incomplete if drop_incomplete is disabled)
+                last_cached = (
+                    self._pairs_last_refresh_time.get((pair, timeframe, candle_type), 0) * 1000
+                )
 
                 if (
                     candles
-                    and candles[-1][0] >= prev_candle_date
-                    and last_refresh_time >= half_candle
+                    and (candles[-1][0] >= candle_date or last_refresh_time >= candle_date)
+                    and candles[0][0] <= last_cached + timeframe_to_msecs(timeframe)
                 ):
-                    # Usable result, candle contains the previous candle.
-                    # Also, we check if the last refresh time is no more than half the candle ago.
+                    # Usable result - the previous candle is complete, as the stream received
+                    # updates after its close, and there's no gap to the cached candles.
                     logger.debug(f"reuse watch result for {pair}, {timeframe}, {last_refresh_time}")
 
                     return self._exchange_ws.get_ohlcv(pair, timeframe, candle_type, candle_date)
@@ -2492,24 +2753,45 @@ class Exchange:
         )
         if cache:
             if (pair, timeframe, c_type) in self._klines:
-                old = self._klines[(pair, timeframe, c_type)]
                 # Reassign so we return the updated, combined df
-                ohlcv_df = clean_ohlcv_dataframe(
-                    concat([old, ohlcv_df], axis=0),
-                    timeframe,
-                    pair,
-                    fill_missing=True,
-                    drop_incomplete=False,
-                )
-                candle_limit = self.ohlcv_candle_limit(timeframe, self._config["candle_type_def"])
-                # Age out old candles
-                ohlcv_df = ohlcv_df.tail(candle_limit + self._startup_candle_count)
-                ohlcv_df = ohlcv_df.reset_index(drop=True)
-                self._klines[(pair, timeframe, c_type)] = ohlcv_df
-            else:
-                self._klines[(pair, timeframe, c_type)] = ohlcv_df
+                ohlcv_df = self._merge_klines(pair, timeframe, c_type, ohlcv_df)
+            self._klines[(pair, timeframe, c_type)] = ohlcv_df
         return ohlcv_df
 
+    def _merge_klines(
+        self, pair: str, timeframe: str, c_type: CandleType, ohlcv_df: DataFrame
+    ) -> DataFrame:
+        """
+        Combine cached candles with new candles, aging out old candles.
+        Uses the kline buffer if possible - which only processes the new candles.
+        """
+        key = (pair, timeframe, c_type)
+        old = self._klines[key]
+        candle_limit = self.ohlcv_candle_limit(timeframe, self._config["candle_type_def"])
+        capacity = candle_limit + self._startup_candle_count
+
+        buffer = self._kline_buffers.get(key)
+        if buffer is None and KlineBuffer.supports_timeframe(timeframe):
+            buffer = KlineBuffer(timeframe, capacity)
+            self._kline_buffers[key] = buffer
+        if buffer is not None:
+            # Cached candles may have been replaced since the last merge.
+            in_sync = buffer.dataframe is not None and buffer.dataframe is old
+            if (in_sync or buffer.reset(old)) and buffer.update(ohlcv_df):
+                return buffer.to_dataframe()
+            del self._kline_buffers[key]
+
+        ohlcv_df = clean_ohlcv_dataframe(
+            concat([old, ohlcv_df], axis=0),
+            timeframe,
+            pair,
+            fill_missing=True,
+            drop_incomplete=False,
+        )
+        # Age out old candles
+        ohlcv_df = ohlcv_df.tail(capacity)
+        return ohlcv_df.reset_index(drop=True)
+
     def refresh_latest_ohlcv(
         self,
         pair_list: ListPairsWithTimeframes,
@@ -2557,6 +2839,9 @@ class Exchange:
 
                 results_df[(pair, timeframe, c_type)] = ohlcv_df
 
+        if self._request_scheduler and ohlcv_dl_jobs:
+            logger.debug("Request scheduler stats: %s", self._request_scheduler.get_stats())
+
         # Return cached klines
         for pair, timeframe, c_type in cached_pairs:
             results_df[(pair, timeframe, c_type)] = self.klines(
@@ -2565,6 +2850,22 @@ class Exchange:
 
         return results_df
 
+    def wait_for_candle_close(self, timeframe: str, timeout: float) -> bool:
+        """
+        Wait until the websocket delivered the current candle for all watched pairs of this
+        timeframe - allowing to analyze the previous candle right after it closed.
+        :param timeframe: Timeframe to wait for
+        :param timeout: Maximum time to wait, in seconds
+        :return: False if candles are not streamed (the caller has to wait on its own),
+            True once waiting is done.
+        """
+        if not self._exchange_ws:
+            return False
+        candle_date = dt_ts(timeframe_to_prev_date(timeframe))
+        if not self._exchange_ws.wait_for_candles(timeframe, candle_date, timeout):
+            logger.debug(f"Timeout waiting for websocket candles of {timeframe}.")
+        return True
+
     def refresh_ohlcv_with_cache(
         self, pairs: list[PairWithTimeframe], since_ms: int
     ) -> dict[PairWithTimeframe, DataFrame]:
@@ -2635,17 +2936,27 @@ class Exchange:
 
             if candle_type and candle_type != CandleType.SPOT:
                 params.update({"price": candle_type.value})
+            # Regular refreshes take precedence over history downloads
+            priority = RequestPriority.NORMAL if since_ms is None else RequestPriority.LOW
             if candle_type != CandleType.FUNDING_RATE:
-                data = await self._api_async.fetch_ohlcv(
-                    pair, timeframe=timeframe, since=since_ms, limit=candle_limit, params=params
+                data = await self._schedule_request(
+                    self._api_async.fetch_ohlcv(
+                        pair, timeframe=timeframe, since=since_ms, limit=candle_limit, params=params
+                    ),
+                    self.ohlcv_request_weight(timeframe, candle_type, candle_limit),
+                    priority,
                 )
             else:
                 # Funding rate
-                data = await self._fetch_funding_rate_history(
-                    pair=pair,
-                    timeframe=timeframe,
-                    limit=candle_limit,
-                    since_ms=since_ms,
+                data = await self._schedule_request(
+                    self._fetch_funding_rate_history(
+                        pair=pair,
+                        timeframe=timeframe,
+                        limit=candle_limit,
+                        since_ms=since_ms,
+                    ),
+                    self.request_weight("fetch_funding_rate_history"),
+                    priority,
                 )
             # Some exchanges sort OHLCV in ASC order and others in DESC.
             # Ex: Bittrex returns the list of OHLCV in ASC order (oldest first, newest last)
@@ -2727,18 +3038,20 @@ class Exchange:
         trades_df = trades_list_to_df(ticks, True)
 
         if cache:
-            if (pair, timeframe, c_type) in self._trades:
-                old = self._trades[(pair, timeframe, c_type)]
+            key = (pair, timeframe, c_type)
+            store = self._trade_stores.get(key)
+            if store is None:
+                store = self._trade_stores[key] = TradeStore(timeframe)
+            if key in self._trades:
+                old = self._trades[key]
+                # Cached trades may have been replaced since the last update.
+                if store.dataframe is not old:
+                    store.reset(old)
                 # Reassign so we return the updated, combined df
-                combined_df = concat([old, trades_df], axis=0)
-                logger.debug(f"Clean duplicated ticks from Trades data {pair}")
-                trades_df = DataFrame(
-                    trades_df_remove_duplicates(combined_df), columns=combined_df.columns
-                )
-                # Age out old candles
-                trades_df = trades_df[first_required_candle_date < trades_df["timestamp"]]
-                trades_df = trades_df.reset_index(drop=True)
-            self._trades[(pair, timeframe, c_type)] = trades_df
+                trades_df = store.update(trades_df, first_required_candle_date)
+            else:
+                store.reset(trades_df)
+            self._trades[key] = trades_df
         return trades_df
 
     async def _build_trades_dl_jobs(
@@ -2774,9 +3087,23 @@ class Exchange:
 
                 else:
                     until = int(timeframe_to_prev_date(timeframe).timestamp()) * 1000
+                    # Only read the cache from one candle before the first required candle -
+                    # enough to tell whether the cache covers the required timerange.
+                    cache_start = first_candle_ms - timeframe_to_msecs(timeframe)
                     all_stored_ticks_df = data_handler.trades_load(
-                        f"{pair}-cached", self.trading_mode
+                        f"{pair}-cached",
+                        self.trading_mode,
+                        timerange=TimeRange("date", None, cache_start // 1000, 0),
                     )
+                    if (
+                        not all_stored_ticks_df.empty
+                        and all_stored_ticks_df.iloc[0]["timestamp"] > first_candle_ms
+                    ):
+                        # No trades shortly before the first required candle (illiquid pair).
+                        # Older cached trades may still cover it - check the whole cache.
+                        all_stored_ticks_df = data_handler.trades_load(
+                            f"{pair}-cached", self.trading_mode
+                        )
 
                     if not all_stored_ticks_df.empty:
                         if (
@@ -2898,10 +3225,15 @@ class Exchange:
         """
         try:
             trades_limit = self._max_trades_limit
+            weight = self.request_weight("fetch_trades")
             # fetch trades asynchronously
             if params:
                 logger.debug("Fetching trades for pair %s, params: %s ", pair, params)
-                trades = await self._api_async.fetch_trades(pair, params=params, limit=trades_limit)
+                trades = await self._schedule_request(
+                    self._api_async.fetch_trades(pair, params=params, limit=trades_limit),
+                    weight,
+                    RequestPriority.LOW,
+                )
             else:
                 logger.debug(
                     "Fetching trades for pair %s, since %s %s...",
@@ -2909,7 +3241,11 @@ class Exchange:
                     since,
                     "(" + dt_from_ts(since).isoformat() + ") " if since is not None else "",
                 )
-                trades = await self._api_async.fetch_trades(pair, since=since, limit=trades_limit)
+                trades = await self._schedule_request(
+                    self._api_async.fetch_trades(pair, since=since, limit=trades_limit),
+                    weight,
+                    RequestPriority.LOW,
+                )
             trades = self._trades_contracts_to_amount(trades)
             pagination_value = self._get_trade_pagination_next_value(trades)
             return trades_dict_to_list(trades), pagination_value
@@ -3161,7 +3497,11 @@ class Exchange:
     async def get_market_leverage_tiers(self, symbol: str) -> tuple[str, list[dict]]:
         """Leverage tiers per symbol"""
         try:
-            tier = await self._api_async.fetch_market_leverage_tiers(symbol)
+            tier = await self._schedule_request(
+                self._api_async.fetch_market_leverage_tiers(symbol),
+                self.request_weight("fetch_market_leverage_tiers"),
+                RequestPriority.LOW,
+            )
             return symbol, tier
         except ccxt.DDoSProtection as e:
             raise DDosProtection(e) from e
@@ -3273,7 +3613,7 @@ class Exchange:
         Assigns property _leverage_tiers to a dictionary of information about the leverage
         allowed on each pair
         """
-        leverage_tiers = self.load_leverage_tiers()
+        leverage_tiers = self._get_cached_metadata("leverage_tiers", self.load_leverage_tiers)
         for pair, tiers in leverage_tiers.items():
             pair_tiers = []
             for tier in tiers:
@@ -0,0 +1,96 @@
+"""
+On-disk cache for exchange metadata (markets, currencies, trading fees, leverage tiers).
+"""
+
+import logging
+from hashlib import sha256
+from pathlib import Path
+from typing import Any
+
+import ccxt
+
+from freqtrade.misc import atomic_write_file, dump_json_to_file, file_load_json
+from freqtrade.util.datetime_helpers import dt_ts
+
+
+logger = logging.getLogger(__name__)
+
+# Increase when the layout of cached sections changes
+METADATA_CACHE_VERSION = 1
+
+
+class ExchangeMetadataCache:
+    """
+    Stores metadata sections of one exchange (and trading mode) in a single file.
+    Each section has its own timestamp - sections older than ttl are not returned, and the
+    whole file is ignored if it was written by a different cache or ccxt version,
+    or for a different exchange or account.
+    """
+
+    def __init__(
+        self, filename: Path, ttl_minutes: int, exchange_id: str, api_key: str = ""
+    ) -> None:
+        """
+        :param filename: File to store the cache in
+        :param ttl_minutes: Maximum age of a section, in minutes
+        :param exchange_id: ccxt id of the exchange
+        :param api_key: API key of the account - trading fees can differ between accounts.
+            Only a hash of the key is stored.
+        """
+        self._filename = filename
+        self._ttl_ms = ttl_minutes * 60 * 1000
+        self._exchange_id = exchange_id
+        self._account = sha256(api_key.encode()).hexdigest()[:16] if api_key else ""
+        self._sections: dict[str, dict[str, Any]] | None = None
+
+    def _load_sections(self) -> dict[str, dict[str, Any]]:
+        if self._sections is None:
+            sections: dict[str, dict[str, Any]] = {}
+            try:
+                content = file_load_json(self._filename)
+            except Exception:
+                logger.warning(f"Could not read exchange metadata cache {self._filename}.")
+                content = None
+            if (
+                isinstance(content, dict)
+                and content.get("version") == METADATA_CACHE_VERSION
+                and content.get("ccxt_version") == ccxt.__version__
+                and content.get("exchange") == self._exchange_id
+                and content.get("account") == self._account
+            ):
+                sections = content.get("sections", {})
+            self._sections = sections
+        return self._sections
+
+    def get(self, section: str) -> tuple[Any, int] | None:
+        """
+        Get a cached section.
+        :param section: Name of the section (e.g. "markets")
+        :return: Tuple of (data, update timestamp in ms) - or None if missing or outdated.
+        """
+        entry = self._load_sections().get(section)
+        if not entry or entry["updated"] + self._ttl_ms < dt_ts():
+            return None
+        return entry["data"], entry["updated"]
+
+    def set(self, **sections: Any) -> None:
+        """
+        Update sections and write the cache file.
+        """
+        cached = self._load_sections()
+        now = dt_ts()
+        for section, data in sections.items():
+            cached[section] = {"updated": now, "data": data}
+        content = {
+            "version": METADATA_CACHE_VERSION,
+            "ccxt_version": ccxt.__version__,
+            "exchange": self._exchange_id,
+            "account": self._account,
+            "sections": cached,
+        }
+        try:
+            self._filename.parent.mkdir(parents=True, exist_ok=True)
+            with atomic_write_file(self._filename) as tmp_file, tmp_file.open("w") as fp:
+                dump_json_to_file(fp, content)
+        except OSError as e:
+            logger.warning(f"Could not write exchange metadata cache {self._filename}: {e}")
@@ -50,6 +50,10 @@ class FtHas(TypedDict, total=False):
     # Websocket control
     ws_enabled: bool
 
+    # Request weight limits
+    request_weight_limit: int | None
+    request_weights: dict[str, int]
+
 
 class Ticker(TypedDict):
     symbol: str
@@ -99,3 +103,12 @@ CcxtOrder = dict[str, Any]
 
 # pair, timeframe, candleType, OHLCV, drop last?,
 OHLCVResponse = tuple[str, str, CandleType, list, bool]
+
+
+class OHLCVDownloadRequest(TypedDict):
+    pair: str
+    timeframe: str
+    since_ms: int
+    candle_type: CandleType
+    is_new_pair: bool
+    until_ms: int | None
@@ -3,7 +3,7 @@ import logging
 import time
 from copy import deepcopy
 from functools import partial
-from threading import Thread
+from threading import Condition, Thread
 
 import ccxt
 
@@ -27,6 +27,9 @@ class ExchangeWS:
         self._klines_scheduled: set[PairWithTimeframe] = set()
         self.klines_last_refresh: dict[PairWithTimeframe, float] = {}
         self.klines_last_request: dict[PairWithTimeframe, float] = {}
+        # Open time of the latest candle received per pair - a new value means a candle closed.
+        self.klines_last_candle: dict[PairWithTimeframe, int] = {}
+        self._candle_closed = Condition()
         self._thread = Thread(name="ccxt_ws", target=self._start_forever)
         self._thread.start()
         self.__cleanup_called = False
@@ -135,6 +138,7 @@ class ExchangeWS:
 
         logger.info(f"{pair}, {timeframe}, {candle_type} - Task finished - {result}")
         self._klines_scheduled.discard((pair, timeframe, candle_type))
+        self.klines_last_candle.pop((pair, timeframe, candle_type), None)
         self._pop_history((pair, timeframe, candle_type))
 
     async def _continuously_async_watch_ohlcv(
@@ -145,6 +149,8 @@ class ExchangeWS:
                 start = dt_ts()
                 data = await self.ccxt_object.watch_ohlcv(pair, timeframe)
                 self.klines_last_refresh[(pair, timeframe, candle_type)] = dt_ts()
+                if data:
+                    self._candle_received((pair, timeframe, candle_type), data[-1][0])
                 logger.debug(
                     f"watch done {pair}, {timeframe}, data {len(data)} "
                     f"in {dt_ts() - start:.2f}s"
@@ -156,6 +162,34 @@ class ExchangeWS:
         finally:
             self._klines_watching.discard((pair, timeframe, candle_type))
 
+    def _candle_received(self, paircomb: PairWithTimeframe, candle_open: int) -> None:
+        """
+        Track the latest candle of a pair - and wake up waiters once a new candle starts.
+        """
+        if self.klines_last_candle.get(paircomb, 0) < candle_open:
+            with self._candle_closed:
+                self.klines_last_candle[paircomb] = candle_open
+                self._candle_closed.notify_all()
+
+    def wait_for_candles(self, timeframe: str, candle_date: int, timeout: float) -> bool:
+        """
+        Block until all watched pairs of this timeframe received the candle opening at
+        candle_date - which means the previous candle is closed.
+        :param timeframe: Timeframe to wait for
+        :param candle_date: Open time of the new candle, in ms
+        :param timeout: Maximum time to wait, in seconds
+        :return: True if all candles arrived, False on timeout
+        """
+
+        def received() -> bool:
+            pairs = [p for p in list(self._klines_watching) if p[1] == timeframe]
+            return bool(pairs) and all(
+                self.klines_last_candle.get(p, 0) >= candle_date for p in pairs
+            )
+
+        with self._candle_closed:
+            return self._candle_closed.wait_for(received, timeout)
+
     def schedule_ohlcv(self, pair: str, timeframe: str, candle_type: CandleType) -> None:
         """
         Schedule a pair/timeframe combination to be watched
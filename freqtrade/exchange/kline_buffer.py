@@ -0,0 +1,138 @@
+"""
+Preallocated storage for the cached candles of one pair / timeframe / candle type.
+"""
+
+import logging
+
+import numpy as np
+from pandas import DataFrame, to_datetime
+
+from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS
+from freqtrade.exchange.exchange_utils_timeframe import (
+    timeframe_to_msecs,
+    timeframe_to_resample_freq,
+    timeframe_to_seconds,
+)
+
+
+logger = logging.getLogger(__name__)
+
+_PRICE_COLUMNS = ["open", "high", "low", "close", "volume"]
+
+
+class KlineBuffer:
+    """
+    Keeps the most recent `capacity` candles in typed arrays.
+    New candles are merged into the buffer in O(new candles), with the same result as
+    combining old and new candles with clean_ohlcv_dataframe() (fill_missing=True):
+    * candles for existing dates are combined (first open, max high, min low, last close,
+      max volume).
+    * missing candles between old and new data are filled with the previous close.
+    Arrays have twice the capacity, so old candles only need to be moved once every
+    `capacity` appended candles.
+    """
+
+    def __init__(self, timeframe: str, capacity: int) -> None:
+        self._timeframe = timeframe
+        self._tf_ms = timeframe_to_msecs(timeframe)
+        self._capacity = capacity
+        self._dates = np.zeros(2 * capacity, dtype="int64")
+        self._values = np.zeros((len(_PRICE_COLUMNS), 2 * capacity), dtype="float64")
+        self._start = 0
+        self._end = 0
+        self.dataframe: DataFrame | None = None
+
+    @staticmethod
+    def supports_timeframe(timeframe: str) -> bool:
+        """
+        Only timeframes with a fixed duration can be merged by position.
+        """
+        return timeframe_to_resample_freq(timeframe) == f"{timeframe_to_seconds(timeframe)}s"
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def reset(self, df: DataFrame) -> bool:
+        """
+        Replace the buffer content with the last `capacity` candles of df.
+        :param df: Cleaned candle data (sorted, without gaps)
+        :return: False if df can't be represented by the buffer (e.g. gaps in the data)
+        """
+        self._start = self._end = 0
+        self.dataframe = None
+        return self.update(df)
+
+    def update(self, df: DataFrame) -> bool:
+        """
+        Merge new candles into the buffer.
+        :param df: Cleaned candle data (sorted, without gaps), as returned by ohlcv_to_dataframe
+        :return: False if the candles can't be merged - the buffer is unchanged in this case.
+        """
+        if df.empty:
+            return True
+        dates = df["date"].to_numpy(dtype="datetime64[ms]").view("int64")
+        if len(dates) > 1 and np.any(np.diff(dates) != self._tf_ms):
+            return False
+        if len(self) == 0:
+            position = 0
+        else:
+            offset = int(dates[0] - self._dates[self._start])
+            if offset < 0 or offset % self._tf_ms:
+                # Data before the buffer start, or not aligned to the buffer
+                return False
+            position = offset // self._tf_ms
+        values = df[_PRICE_COLUMNS].to_numpy(dtype="float64").T
+
+        length = len(self)
+        overlap = max(min(length - position, len(dates)), 0)
+        if overlap:
+            target = slice(self._start + position, self._start + position + overlap)
+            buffer = self._values[:, target]
+            buffer[1] = np.maximum(buffer[1], values[1, :overlap])
+            buffer[2] = np.minimum(buffer[2], values[2, :overlap])
+            buffer[3] = values[3, :overlap]
+            buffer[4] = np.maximum(buffer[4], values[4, :overlap])
+
+        gap = max(position - length, 0)
+        if gap:
+            last_close = self._values[3, self._end - 1]
+            fill = np.full((len(_PRICE_COLUMNS), gap), last_close)
+            fill[4] = 0.0
+            gap_dates = self._dates[self._end - 1] + self._tf_ms * np.arange(1, gap + 1)
+            self._append(gap_dates, fill)
+            logger.debug(f"Filled {gap} missing candles for {self._timeframe}.")
+        self._append(dates[overlap:], values[:, overlap:])
+        self.dataframe = None
+        return True
+
+    def _append(self, dates: np.ndarray, values: np.ndarray) -> None:
+        count = len(dates)
+        if count >= self._capacity:
+            dates = dates[-self._capacity :]
+            values = values[:, -self._capacity :]
+            count = self._capacity
+            self._start = self._end = 0
+        if self._end + count > len(self._dates):
+            # Move the candles to keep to the start of the arrays
+            keep = min(len(self), self._capacity - count)
+            self._dates[:keep] = self._dates[self._end - keep : self._end]
+            self._values[:, :keep] = self._values[:, self._end - keep : self._end]
+            self._start, self._end = 0, keep
+        self._dates[self._end : self._end + count] = dates
+        self._values[:, self._end : self._end + count] = values
+        self._end += count
+        # Age out old candles
+        self._start = max(self._start, self._end - self._capacity)
+
+    def to_dataframe(self) -> DataFrame:
+        """
+        Get the buffer content as dataframe.
+        The dataframe is created once per update, and kept in `dataframe`.
+        """
+        if self.dataframe is None:
+            window = slice(self._start, self._end)
+            data = {"date": to_datetime(self._dates[window], unit="ms", utc=True)}
+            for idx, column in enumerate(_PRICE_COLUMNS):
+                data[column] = self._values[idx, window].copy()
+            self.dataframe = DataFrame(data, columns=DEFAULT_DATAFRAME_COLUMNS)
+        return self.dataframe
@@ -0,0 +1,247 @@
+"""
+Weight-aware scheduling of exchange requests.
+"""
+
+import asyncio
+import heapq
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable
+from enum import IntEnum
+from itertools import count
+from threading import Lock
+from typing import Any, TypeVar
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class RequestPriority(IntEnum):
+    """
+    Lower values are scheduled first.
+    """
+
+    # Order and ticker calls. Not delayed - only recorded.
+    HIGH = 0
+    # Regular candle refresh
+    NORMAL = 1
+    # History backfill (multiple calls per pair, trades pagination)
+    LOW = 2
+
+
+class RequestScheduler:
+    """
+    Keeps the request weight sent to the exchange below the exchange's weight limit.
+    Weight is tracked in a sliding window of `interval` seconds - which is shared between
+    scheduled (async) requests and recorded requests (e.g. orders, which are never delayed).
+    Scheduled requests start in priority order, as soon as the window has room for them.
+    """
+
+    def __init__(self, weight_limit: int, interval: float = 60.0, headroom: float = 0.9) -> None:
+        """
+        :param weight_limit: Request weight allowed by the exchange per interval
+        :param interval: Length of the rate limit window, in seconds
+        :param headroom: Fraction of weight_limit to use
+        """
+        self._budget = max(int(weight_limit * headroom), 1)
+        self._interval = interval
+        # (timestamp, weight) of requests within the window
+        self._window: deque[tuple[float, int]] = deque()
+        self._window_weight = 0
+        self._lock = Lock()
+
+        self._queue: list[tuple[int, int]] = []
+        self._seq = count()
+        self._condition: asyncio.Condition | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._running = 0
+        self._stats: dict[RequestPriority, dict[str, float]] = {
+            p: {
+                "requests": 0,
+                "weight": 0,
+                "wait_total": 0.0,
+                "wait_max": 0.0,
+                "latency_total": 0.0,
+            }
+            for p in RequestPriority
+        }
+
+    def _used_weight(self, now: float) -> int:
+        with self._lock:
+            while self._window and self._window[0][0] <= now - self._interval:
+                self._window_weight -= self._window.popleft()[1]
+            return self._window_weight
+
+    def _time_until_available(self, weight: int, now: float) -> float:
+        """
+        Seconds until `weight` fits into the window - 0 if it fits now.
+        """
+        used = self._used_weight(now)
+        # A single request heavier than the budget still has to run at some point.
+        weight = min(weight, self._budget)
+        if used + weight <= self._budget:
+            return 0.0
+        with self._lock:
+            excess = used + weight - self._budget
+            for timestamp, entry_weight in self._window:
+                excess -= entry_weight
+                if excess <= 0:
+                    return max(timestamp + self._interval - now, 0.0)
+        return self._interval
+
+    def record(self, weight: int, priority: RequestPriority = RequestPriority.HIGH) -> None:
+        """
+        Record a request which was sent without being scheduled.
+        Thread-safe - can be used from synchronous code.
+        """
+        with self._lock:
+            self._window.append((time.monotonic(), weight))
+            self._window_weight += weight
+            stats = self._stats[priority]
+            stats["requests"] += 1
+            stats["weight"] += weight
+
+    async def run(
+        self,
+        awaitable: Awaitable[T],
+        weight: int = 1,
+        priority: RequestPriority = RequestPriority.LOW,
+    ) -> T:
+        """
+        Wait until the request fits into the rate limit, and run it.
+        :param awaitable: Request to run (usually a ccxt coroutine)
+        :param weight: Request weight, as defined by the exchange
+        :param priority: Priority of the request
+        :return: Result of the request
+        """
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            # Asyncio primitives are bound to one event loop
+            self._condition = asyncio.Condition()
+            self._loop = loop
+            self._queue = []
+        condition = self._condition
+        entry = (int(priority), next(self._seq))
+        enqueued = time.monotonic()
+        try:
+            async with condition:
+                heapq.heappush(self._queue, entry)
+                while True:
+                    # Re-check regularly, in case the first request in the queue was cancelled.
+                    timeout = 1.0
+                    if self._queue[0] == entry:
+                        timeout = self._time_until_available(weight, time.monotonic())
+                        if timeout <= 0:
+                            heapq.heappop(self._queue)
+                            break
+                    try:
+                        await asyncio.wait_for(condition.wait(), timeout)
+                    except asyncio.TimeoutError:
+                        pass
+                self.record(weight, priority)
+                # Next request in the queue can now check the window
+                condition.notify_all()
+        except BaseException:
+            if entry in self._queue:
+                self._queue.remove(entry)
+                heapq.heapify(self._queue)
+            if asyncio.iscoroutine(awaitable):
+                awaitable.close()
+            raise
+
+        started = time.monotonic()
+        stats = self._stats[priority]
+        stats["wait_total"] += started - enqueued
+        stats["wait_max"] = max(stats["wait_max"], started - enqueued)
+        self._running += 1
+        try:
+            return await awaitable
+        finally:
+            self._running -= 1
+            stats["latency_total"] += time.monotonic() - started
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Queue depth, weight usage and wait / latency statistics per priority.
+        Latency is the duration of the request itself, wait the time spent in the queue.
+        """
+        priorities = {}
+        for priority, stats in self._stats.items():
+            requests = stats["requests"]
+            priorities[priority.name.lower()] = {
+                "requests": int(requests),
+                "weight": int(stats["weight"]),
+                "avg_wait_ms": round(stats["wait_total"] / requests * 1000, 2) if requests else 0,
+                "max_wait_ms": round(stats["wait_max"] * 1000, 2),
+                "avg_latency_ms": (
+                    round(stats["latency_total"] / requests * 1000, 2) if requests else 0
+                ),
+            }
+        return {
+            "queued": len(self._queue),
+            "running": self._running,
+            "used_weight": self._used_weight(time.monotonic()),
+            "weight_budget": self._budget,
+            "priorities": priorities,
+        }
+
+
+
+# Prefixes / names of ccxt methods sending a request.
+REQUEST_METHOD_PREFIXES = ("fetch_", "create_", "cancel_", "edit_")
+REQUEST_METHODS = {"load_markets", "set_leverage", "set_margin_mode", "set_position_mode"}
+
+
+class WeightRecordingApi:
+    """
+    Thin wrapper around a synchronous ccxt instance, recording the weight of every request
+    sent through it with the request scheduler.
+    Methods which don't send requests, and all other attributes, are passed through unchanged.
+    """
+
+    __slots__ = ("_api", "_scheduler", "_weight", "_endpoints")
+
+    def __init__(
+        self,
+        api: Any,
+        scheduler: RequestScheduler,
+        weight: Callable[[str, tuple, dict], int],
+        endpoints: Iterable[str] = (),
+    ) -> None:
+        """
+        :param api: ccxt instance to wrap
+        :param scheduler: Scheduler to record requests with
+        :param weight: Weight of a call to the given method with the given args / kwargs
+        :param endpoints: Additional methods sending requests (e.g. implicit ccxt endpoints)
+        """
+        object.__setattr__(self, "_api", api)
+        object.__setattr__(self, "_scheduler", scheduler)
+        object.__setattr__(self, "_weight", weight)
+        object.__setattr__(self, "_endpoints", frozenset(endpoints))
+
+    def _is_request(self, name: str) -> bool:
+        return (
+            name.startswith(REQUEST_METHOD_PREFIXES)
+            or name in REQUEST_METHODS
+            or name in self._endpoints
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        if name in WeightRecordingApi.__slots__:
+            # Not initialized (e.g. while unpickling)
+            raise AttributeError(name)
+        attr = getattr(self._api, name)
+        if not self._is_request(name):
+            return attr
+
+        def request(*args, **kwargs):
+            self._scheduler.record(self._weight(name, args, kwargs))
+            return attr(*args, **kwargs)
+
+        return request
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._api, name, value)
@@ -0,0 +1,58 @@
+"""
+Latest tickers of all pairs, shared by pricing and balance conversion.
+"""
+
+import logging
+import time
+from threading import Lock
+
+from freqtrade.exchange.exchange_types import Ticker, Tickers
+
+
+logger = logging.getLogger(__name__)
+
+
+class TickerSnapshot:
+    """
+    Holds the latest ticker per pair, together with the time it was received.
+    Filled by bulk ticker calls (one call for all pairs) - single tickers are added for pairs
+    missing in the bulk result. Staleness is tracked per pair.
+    """
+
+    def __init__(self, max_age: float) -> None:
+        """
+        :param max_age: Maximum age of a ticker, in seconds
+        """
+        self._max_age = max_age
+        self._tickers: dict[str, tuple[float, Ticker]] = {}
+        self._last_bulk_update = 0.0
+        self._lock = Lock()
+
+    def update(self, tickers: Tickers, bulk: bool = False) -> None:
+        """
+        Store tickers.
+        :param tickers: Tickers, by pair
+        :param bulk: tickers is the result of a bulk call (containing all pairs)
+        """
+        now = time.monotonic()
+        with self._lock:
+            for pair, ticker in tickers.items():
+                self._tickers[pair] = (now, ticker)
+            if bulk:
+                self._last_bulk_update = now
+
+    def get(self, pair: str) -> Ticker | None:
+        """
+        Get the ticker of a pair - None if it's missing or outdated.
+        """
+        with self._lock:
+            entry = self._tickers.get(pair)
+        if entry is None or time.monotonic() - entry[0] > self._max_age:
+            return None
+        return entry[1]
+
+    def bulk_expired(self) -> bool:
+        """
+        The last bulk update is older than max_age - a new bulk call should be done.
+        """
+        return time.monotonic() - self._last_bulk_update > self._max_age
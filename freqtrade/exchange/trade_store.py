@@ -0,0 +1,95 @@
+"""
+Incrementally updated public trades of one pair / timeframe / candle type.
+"""
+
+import logging
+
+import numpy as np
+from pandas import DataFrame, concat
+
+from freqtrade.exchange.exchange_utils_timeframe import timeframe_to_msecs
+
+
+logger = logging.getLogger(__name__)
+
+
+class TradeStore:
+    """
+    Keeps trades in a dataframe, and the (timestamp, id) keys of all trades in one set per
+    candle. New trades are deduplicated against these sets - so only new trades are processed -
+    with the same result as combining old and new trades with trades_df_remove_duplicates().
+    Aging out trades drops whole candles of keys at once.
+    """
+
+    def __init__(self, timeframe: str) -> None:
+        self._tf_ms = timeframe_to_msecs(timeframe)
+        # Candle start -> keys of trades in this candle, in insertion order
+        self._buckets: dict[int, set[tuple[int, str]]] = {}
+        # Trades are sorted by timestamp - allows trimming without a full scan
+        self._sorted = True
+        self.dataframe: DataFrame | None = None
+
+    def _bucket(self, timestamp: int) -> set[tuple[int, str]]:
+        start = timestamp - timestamp % self._tf_ms
+        bucket = self._buckets.get(start)
+        if bucket is None:
+            if self._buckets and start < next(reversed(self._buckets)):
+                # Candles are no longer in order - eviction has to check all candles
+                self._sorted = False
+            bucket = self._buckets[start] = set()
+        return bucket
+
+    def reset(self, df: DataFrame) -> None:
+        """
+        Replace the store content with df.
+        :param df: Trades dataframe, without duplicates
+        """
+        self._buckets = {}
+        self._sorted = bool(df["timestamp"].is_monotonic_increasing)
+        for timestamp, trade_id in zip(df["timestamp"].tolist(), df["id"].tolist(), strict=True):
+            self._bucket(timestamp).add((timestamp, trade_id))
+        self.dataframe = df
+
+    def update(self, df: DataFrame, first_required_ms: int) -> DataFrame:
+        """
+        Add new trades to the store, and remove trades older than first_required_ms.
+        :param df: New trades, as returned by trades_list_to_df()
+        :param first_required_ms: Trades at or before this timestamp are removed
+        :return: Updated trades dataframe - also available as `dataframe`
+        """
+        old = self.dataframe if self.dataframe is not None else df.iloc[0:0]
+        last_timestamp = int(old["timestamp"].iloc[-1]) if len(old) else None
+        keep = np.zeros(len(df), dtype=bool)
+        for idx, (timestamp, trade_id) in enumerate(
+            zip(df["timestamp"].tolist(), df["id"].tolist(), strict=True)
+        ):
+            bucket = self._bucket(timestamp)
+            key = (timestamp, trade_id)
+            if key in bucket:
+                continue
+            bucket.add(key)
+            keep[idx] = True
+            if last_timestamp is not None and timestamp < last_timestamp:
+                self._sorted = False
+            last_timestamp = timestamp
+
+        # Age out old trades - whole candles first
+        if self._sorted:
+            while self._buckets:
+                start = next(iter(self._buckets))
+                if start + self._tf_ms > first_required_ms:
+                    break
+                del self._buckets[start]
+            old = old.iloc[old["timestamp"].searchsorted(first_required_ms, side="right") :]
+        else:
+            for start in [s for s in self._buckets if s + self._tf_ms <= first_required_ms]:
+                del self._buckets[start]
+            old = old[old["timestamp"] > first_required_ms]
+        new = df[keep]
+        new = new[new["timestamp"] > first_required_ms]
+        logger.debug(f"Added {len(new)} of {len(df)} trades.")
+
+        frames = [frame for frame in (old, new) if not frame.empty]
+        combined = concat(frames, axis=0) if len(frames) > 1 else (frames or [old])[0]
+        self.dataframe = combined.reset_index(drop=True)
+        return self.dataframe
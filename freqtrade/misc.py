@@ -5,10 +5,12 @@ Various tool function for Freqtrade and scripts
 import gzip
 import logging
 from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
 from io import StringIO
 from pathlib import Path
 from typing import Any, TextIO
 from urllib.parse import urlparse
+from uuid import uuid4
 
 import pandas as pd
 import rapidjson
@@ -54,6 +56,23 @@ def file_dump_json(filename: Path, data: Any, is_zip: bool = False, log: bool =
     logger.debug(f'done json to "{filename}"')
 
 
+@contextmanager
+def atomic_write_file(filename: Path) -> Iterator[Path]:
+    """
+    Write a file atomically.
+    Yields a temporary file next to filename, which replaces filename once the block completes -
+    so readers (and interrupted writers) never see a partially written file.
+    The temporary file is removed if writing fails.
+    :param filename: file to create or replace
+    """
+    tmp_file = filename.with_name(f"{filename.name}.{uuid4().hex}.tmp")
+    try:
+        yield tmp_file
+        tmp_file.replace(filename)
+    finally:
+        tmp_file.unlink(missing_ok=True)
+
+
 def json_load(datafile: TextIO) -> Any:
     """
     load data with rapidjson
@@ -0,0 +1,156 @@
+"""
+Columnar storage for backtesting candle data.
+
+Alternative to the list-of-lists representation used by Backtesting.backtest().
+Keeps the candle data in contiguous, typed numpy arrays and builds rows on access,
+which behave like the rows of the list representation.
+Also contains the indexed storage for timeframe-detail candles.
+"""
+
+from collections.abc import Callable, Iterator
+from datetime import datetime
+from operator import itemgetter
+from typing import Any
+
+import numpy as np
+from pandas import DataFrame, Timestamp
+from pandas.api.types import is_datetime64_any_dtype, is_numeric_dtype
+
+
+class ColumnarPairData:
+    """
+    Candle data of one pair, stored as typed numpy arrays.
+    Indexing returns the row as tuple, mirroring `df[columns].values.tolist()[index]`.
+
+    Rows are built on access. Numeric columns share one 2D float array, so building a row
+    only takes a few calls - regardless of the number of columns.
+    """
+
+    __slots__ = ("_dates", "_numeric", "_numeric_pos", "_objects", "_order", "_length")
+
+    def __init__(self, df: DataFrame, columns: list[str]) -> None:
+        # (column position, int64 nanoseconds, timezone) per date column
+        self._dates: list[tuple[int, np.ndarray, Any]] = []
+        # (column position, object array) per non-numeric column (e.g. tags)
+        self._objects: list[tuple[int, np.ndarray]] = []
+        numeric: list[int] = []
+        for pos, col in enumerate(columns):
+            series = df[col]
+            if is_datetime64_any_dtype(series.dtype):
+                self._dates.append(
+                    (
+                        pos,
+                        series.to_numpy(dtype="datetime64[ns]").view("int64"),
+                        series.dt.tz or "UTC",
+                    )
+                )
+            elif is_numeric_dtype(series.dtype):
+                numeric.append(pos)
+            else:
+                self._objects.append((pos, series.to_numpy(dtype=object)))
+        self._numeric: np.ndarray = df[[columns[pos] for pos in numeric]].to_numpy(dtype="float64")
+        self._numeric_pos = {pos: offset for offset, pos in enumerate(numeric)}
+        self._length = len(df)
+
+        # Values are collected as dates, numeric columns, object columns.
+        # Map them back to the requested column order, unless the order is already correct.
+        collected = [d[0] for d in self._dates] + numeric + [o[0] for o in self._objects]
+        order = [collected.index(pos) for pos in range(len(columns))]
+        self._order: Callable[[list[Any]], tuple] | None = (
+            None if order == list(range(len(order))) else itemgetter(*order)
+        )
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> tuple:
+        if index < 0:
+            index += self._length
+        if index < 0 or index >= self._length:
+            raise IndexError("ColumnarPairData index out of range")
+        return self._row(index)
+
+    def __iter__(self) -> Iterator[tuple]:
+        for index in range(self._length):
+            yield self._row(index)
+
+    def _row(self, index: int) -> tuple:
+        values = [Timestamp(dates.item(index), tz=tz) for _, dates, tz in self._dates]
+        values.extend(self._numeric[index].tolist())
+        if self._objects:
+            values.extend(objects[index] for _, objects in self._objects)
+        if self._order is None:
+            return tuple(values)
+        return self._order(values)
+
+    @property
+    def width(self) -> int:
+        return len(self._dates) + self._numeric.shape[1] + len(self._objects)
+
+    def column(self, column: int) -> np.ndarray:
+        """
+        Raw (typed) numpy array for the given column.
+        Dates are returned as int64 nanoseconds, numeric columns as float64.
+        """
+        if column in self._numeric_pos:
+            return self._numeric[:, self._numeric_pos[column]]
+        for pos, dates, _ in self._dates:
+            if pos == column:
+                return dates
+        for pos, objects in self._objects:
+            if pos == column:
+                return objects
+        raise IndexError("ColumnarPairData column out of range")
+
+
+class ColumnarDetailData:
+    """
+    Detail-timeframe candles of one pair, stored as typed numpy arrays.
+    Holds an offset index mapping each main-timeframe candle start to the [start, end) range
+    of detail rows belonging to that candle, so lookups don't need to scan the dataframe.
+    """
+
+    __slots__ = ("_dates", "_ohlc", "_tz", "_timeframe_ns", "_offsets")
+
+    def __init__(self, df: DataFrame, timeframe_secs: int) -> None:
+        self._dates: np.ndarray = df["date"].to_numpy(dtype="datetime64[ns]").view("int64")
+        self._ohlc: np.ndarray = df[["open", "high", "low", "close"]].to_numpy(dtype="float64")
+        self._tz = df["date"].dt.tz or "UTC"
+        self._timeframe_ns = timeframe_secs * 1_000_000_000
+
+        # Group detail candles by the (epoch-aligned) main candle they belong to.
+        candle_starts = self._dates - self._dates % self._timeframe_ns
+        keys, starts = np.unique(candle_starts, return_index=True)
+        ends = np.append(starts[1:], len(self._dates))
+        self._offsets: dict[int, tuple[int, int]] = dict(
+            zip(keys.tolist(), zip(starts.tolist(), ends.tolist(), strict=True), strict=True)
+        )
+
+    def __len__(self) -> int:
+        return len(self._dates)
+
+    def get_range(self, candle_start: datetime) -> tuple[int, int]:
+        """
+        Get [start, end) offsets of the detail rows within the main candle starting at
+        candle_start.
+        """
+        start_ns = int(candle_start.timestamp()) * 1_000_000_000
+        offsets = self._offsets.get(start_ns)
+        if offsets is not None:
+            return offsets
+        # Main candle not aligned to the epoch (e.g. weekly candles) - search the date array.
+        start, end = np.searchsorted(self._dates, [start_ns, start_ns + self._timeframe_ns])
+        return int(start), int(end)
+
+    def get_rows(self, start: int, end: int, signals: list[Any]) -> list[tuple]:
+        """
+        Build backtest rows for the detail candles in [start, end).
+        :param signals: values appended to every row (signal and tag columns)
+        """
+        tz = self._tz
+        return [
+            (Timestamp(date, tz=tz), *ohlc, *signals)
+            for date, ohlc in zip(
+                self._dates[start:end].tolist(), self._ohlc[start:end].tolist(), strict=True
+            )
+        ]
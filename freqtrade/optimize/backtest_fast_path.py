@@ -0,0 +1,205 @@
+"""
+Fast path for the backtesting loop.
+
+For strategies without per-candle callbacks (custom_exit, custom_stoploss,
+adjust_trade_position), an open trade can only change on candles where an exit condition
+is possible - an exit / entry signal, a stoploss or ROI hit, or a move of the trailing stop.
+ExitCandidateScanner finds these candles with vectorized checks on the candle data, so the
+backtesting loop can skip the exit evaluation for all other candles.
+"""
+
+import numpy as np
+from pandas import DataFrame
+
+from freqtrade.persistence import LocalTrade
+from freqtrade.strategy.interface import IStrategy
+
+
+# Columns which may trigger an action on an open trade.
+SIGNAL_COLUMNS = ["enter_long", "exit_long", "enter_short", "exit_short"]
+
+# Relative tolerance applied to price thresholds, so float rounding can't hide a candidate.
+PRICE_TOLERANCE = 1e-6
+
+# Number of candles checked in the first scan step. Doubles with every further step.
+SCAN_CHUNK = 64
+
+
+class ExitCandidateScanner:
+    """
+    Candle data of one pair, aligned with the rows passed to the backtesting loop.
+    """
+
+    __slots__ = ("_dates", "_high", "_low", "_signal")
+
+    def __init__(self, df: DataFrame) -> None:
+        self._dates: np.ndarray = df["date"].to_numpy(dtype="datetime64[ns]").view("int64")
+        self._high: np.ndarray = df["high"].to_numpy(dtype="float64")
+        self._low: np.ndarray = df["low"].to_numpy(dtype="float64")
+        signals = df.reindex(columns=SIGNAL_COLUMNS).fillna(0)
+        self._signal: np.ndarray = (signals.to_numpy() != 0).any(axis=1)
+
+    def __len__(self) -> int:
+        return len(self._high)
+
+    def next_candidate(
+        self,
+        start: int,
+        stop_loss: float,
+        open_rate: float,
+        open_date_ns: int,
+        roi: tuple[np.ndarray, np.ndarray] | None,
+        trailing_rules: list[tuple[float, float]],
+    ) -> int:
+        """
+        Find the first candle at or after start where an exit of a long trade may happen.
+        :param start: First row index to check
+        :param stop_loss: Current stoploss price of the trade
+        :param open_rate: Open rate of the trade
+        :param open_date_ns: Open date of the trade, as nanosecond timestamp
+        :param roi: ROI table as sorted arrays of (duration in minutes, ROI level)
+        :param trailing_rules: List of (min_high, factor) - a candle with a high above
+            min_high can move the stoploss to high * factor at most.
+        :return: Row index of the candidate - or the number of rows if there's no candidate.
+        """
+        length = len(self._high)
+        trailing_limit = stop_loss * (1 - PRICE_TOLERANCE)
+        size = SCAN_CHUNK
+        while start < length:
+            end = min(start + size, length)
+            high = self._high[start:end]
+            mask = self._signal[start:end] | (self._low[start:end] <= stop_loss)
+            if roi is not None:
+                # ROI level per candle, based on the trade duration (as in min_roi_reached).
+                durations = (self._dates[start:end] - open_date_ns) // 60_000_000_000
+                level_idx = np.searchsorted(roi[0], durations, side="right") - 1
+                levels = np.where(level_idx >= 0, roi[1][np.maximum(level_idx, 0)], np.inf)
+                # Profit including fees is below the price change - so this is a lower bound.
+                mask |= high > open_rate * (1 + levels) * (1 - PRICE_TOLERANCE)
+            for min_high, factor in trailing_rules:
+                mask |= (high > min_high * (1 - PRICE_TOLERANCE)) & (high * factor > trailing_limit)
+            hits = np.flatnonzero(mask)
+            if hits.size:
+                return start + int(hits[0])
+            start = end
+            size *= 2
+        return length
+
+    def update_rates(self, trade: LocalTrade, start: int, end: int) -> None:
+        """
+        Apply the highs and lows of the (skipped) rows [start, end) to the trade's
+        max_rate / min_rate - as the regular exit evaluation would have done.
+        """
+        if start < end:
+            trade.adjust_min_max_rates(
+                float(self._high[start:end].max()), float(self._low[start:end].min())
+            )
+
+
+class BacktestFastPath:
+    """
+    Tracks, per pair, up to which row the exit evaluation of the open trade can be skipped.
+    Only valid for strategies without per-candle callbacks, in spot mode and without
+    timeframe-detail - see Backtesting._fast_path_supported().
+    """
+
+    def __init__(self, scanners: dict[str, ExitCandidateScanner], strategy: IStrategy) -> None:
+        self._scanners = scanners
+        # Row index of the next candle which must be evaluated, per pair.
+        self._next: dict[str, int] = {}
+        # Row index of the last evaluated candle, per pair.
+        self._last: dict[str, int] = {}
+
+        self._roi: tuple[np.ndarray, np.ndarray] | None = None
+        if strategy.minimal_roi:
+            roi_table = sorted(strategy.minimal_roi.items())
+            self._roi = (
+                np.array([duration for duration, _ in roi_table], dtype="int64"),
+                np.array([level for _, level in roi_table], dtype="float64"),
+            )
+        self._strategy = strategy
+
+    def can_skip(self, pair: str, index: int) -> bool:
+        """
+        Check if the candle at row index is a no-op for this pair.
+        Must only be called for candles without entry signal.
+        """
+        if not LocalTrade.bt_trades_open_pp[pair]:
+            return True
+        return index < self._next.get(pair, 0)
+
+    def before_candle(self, pair: str, index: int) -> None:
+        """
+        Catch up on skipped candles before the candle at row index is evaluated.
+        """
+        last = self._last.get(pair)
+        scanner = self._scanners.get(pair)
+        if last is None or scanner is None:
+            return
+        for trade in LocalTrade.bt_trades_open_pp[pair]:
+            scanner.update_rates(trade, last + 1, index)
+
+    def after_candle(self, pair: str, index: int) -> None:
+        """
+        Determine the next candle to evaluate after the candle at row index.
+        """
+        self._last[pair] = index
+        self._next[pair] = self._next_candidate(pair, index + 1)
+
+    def _next_candidate(self, pair: str, start: int) -> int:
+        trades = LocalTrade.bt_trades_open_pp[pair]
+        scanner = self._scanners.get(pair)
+        if scanner is None or len(trades) != 1:
+            return start
+        trade = trades[0]
+        if (
+            trade.has_open_orders
+            or trade.is_short
+            or not trade.stop_loss
+            or (trade.fee_open or 0) < 0
+            or (trade.fee_close or 0) < 0
+        ):
+            return start
+
+        return scanner.next_candidate(
+            start,
+            trade.stop_loss,
+            trade.open_rate,
+            int(trade.open_date_utc.timestamp()) * 1_000_000_000,
+            self._roi,
+            self._get_trailing_rules(trade),
+        )
+
+    def _get_trailing_rules(self, trade: LocalTrade) -> list[tuple[float, float]]:
+        """
+        Candles which may move the trailing stoploss (see IStrategy.ft_stoploss_adjust),
+        as list of (min_high, factor).
+        """
+        strategy = self._strategy
+        if not strategy.trailing_stop:
+            return []
+        leverage = trade.leverage or 1.0
+        # Profit can only reach the offset if the price change does.
+        offset_rate = trade.open_rate * (1 + strategy.trailing_stop_positive_offset)
+        rules = [
+            (
+                offset_rate if strategy.trailing_only_offset_is_reached else 0.0,
+                1 - abs(strategy.stoploss / leverage),
+            )
+        ]
+        if strategy.trailing_stop_positive is not None:
+            rules.append((offset_rate, 1 - abs(strategy.trailing_stop_positive / leverage)))
+        return rules
+
+    def finalize(self, indexes: dict[str, int]) -> None:
+        """
+        Catch up on skipped candles of trades left open at the end of the backtest.
+        :param indexes: Number of processed rows per pair
+        """
+        for pair, trades in LocalTrade.bt_trades_open_pp.items():
+            last = self._last.get(pair)
+            scanner = self._scanners.get(pair)
+            if last is None or scanner is None:
+                continue
+            for trade in trades:
+                scanner.update_rates(trade, last + 1, indexes[pair])
@@ -41,6 +41,8 @@ from freqtrade.ft_types import BacktestResultType, get_BacktestResultType_defaul
 from freqtrade.leverage.liquidation_price import update_liquidation_prices
 from freqtrade.mixins import LoggingMixin
 from freqtrade.optimize.backtest_caching import get_strategy_run_id
+from freqtrade.optimize.backtest_columnar import ColumnarDetailData, ColumnarPairData
+from freqtrade.optimize.backtest_fast_path import BacktestFastPath, ExitCandidateScanner
 from freqtrade.optimize.bt_progress import BTProgress
 from freqtrade.optimize.optimize_reports import (
     generate_backtest_stats,
@@ -70,6 +72,28 @@ from freqtrade.wallets import Wallets
 
 logger = logging.getLogger(__name__)
 
+# Converted signal data of the last backtest run with a signal cache key, in the format
+# {key: (data, analyzed dataframes, trimmed dataframes, exit candidate scanners)}.
+# Kept on module level so it survives re-sending of the backtesting object to hyperopt workers.
+_signal_cache: dict[
+    str,
+    tuple[
+        dict[str, Any],
+        dict[str, DataFrame],
+        dict[str, DataFrame],
+        dict[str, ExitCandidateScanner],
+    ],
+] = {}
+
+# Strategy methods which must not be overridden to use the backtesting fast path.
+FAST_PATH_METHODS = (
+    "custom_exit",
+    "should_exit",
+    "ft_stoploss_adjust",
+    "ft_stoploss_reached",
+    "min_roi_reached",
+)
+
 # Indexes for backtest tuples
 DATE_IDX = 0
 OPEN_IDX = 1
@@ -214,6 +238,14 @@ class Backtesting:
         self._can_short = self.trading_mode != TradingMode.SPOT
         self._position_stacking: bool = self.config.get("position_stacking", False)
         self.enable_protections: bool = self.config.get("enable_protections", False)
+        self.backtest_engine: str = self.config.get(
+            "backtest_engine", constants.BACKTEST_ENGINE_DEFAULT
+        )
+        self.backtest_fast_path: bool = self.config.get("backtest_fast_path", True)
+        self.exit_scanners: dict[str, ExitCandidateScanner] = {}
+        # Identifies the signal-relevant state of the strategy (set by hyperopt).
+        # When set, converted signal data is reused as long as the key doesn't change.
+        self.signal_cache_key: str | None = None
         migrate_data(config, self.exchange)
 
         self.init_backtest()
@@ -247,7 +279,7 @@ class Backtesting:
 
         else:
             self.timeframe_detail_td = timedelta(seconds=0)
-        self.detail_data: dict[str, DataFrame] = {}
+        self.detail_data = {}
         self.futures_data: dict[str, DataFrame] = {}
 
     def init_backtest(self):
@@ -295,6 +327,8 @@ class Backtesting:
             fail_without_data=True,
             data_format=self.config["dataformat_ohlcv"],
             candle_type=self.config.get("candle_type_def", CandleType.SPOT),
+            workers=self.config.get("data_load_workers", 1),
+            cache_size=self.config.get("ohlcv_cache_size", 0),
         )
 
         min_date, max_date = history.get_timerange(data)
@@ -326,6 +360,8 @@ class Backtesting:
                 startup_candles=0,
                 fail_without_data=True,
                 data_format=self.config["dataformat_ohlcv"],
+                workers=self.config.get("data_load_workers", 1),
+                cache_size=self.config.get("ohlcv_cache_size", 0),
                 candle_type=self.config.get("candle_type_def", CandleType.SPOT),
             )
         else:
@@ -344,6 +380,8 @@ class Backtesting:
                 startup_candles=0,
                 fail_without_data=True,
                 data_format=self.config["dataformat_ohlcv"],
+                workers=self.config.get("data_load_workers", 1),
+                cache_size=self.config.get("ohlcv_cache_size", 0),
                 candle_type=CandleType.FUNDING_RATE,
             )
 
@@ -356,6 +394,8 @@ class Backtesting:
                 startup_candles=0,
                 fail_without_data=True,
                 data_format=self.config["dataformat_ohlcv"],
+                workers=self.config.get("data_load_workers", 1),
+                cache_size=self.config.get("ohlcv_cache_size", 0),
                 candle_type=CandleType.from_string(self.exchange.get_option("mark_ohlcv_price")),
             )
             # Combine data to avoid combining the data per trade.
@@ -379,6 +419,23 @@ class Backtesting:
         else:
             self.futures_data = {}
 
+    @property
+    def detail_data(self) -> dict[str, DataFrame]:
+        return self._detail_data
+
+    @detail_data.setter
+    def detail_data(self, detail_data: dict[str, DataFrame]) -> None:
+        """
+        Set detail data and build the per-pair offset index used by the backtest loop.
+        Avoids filtering the detail dataframe for every candle in the backtest loop.
+        """
+        self._detail_data = detail_data
+        self.detail_index: dict[str, ColumnarDetailData] = {
+            pair: ColumnarDetailData(df, self.timeframe_secs)
+            for pair, df in detail_data.items()
+            if not df.empty
+        }
+
     def disable_database_use(self):
         disable_database_use(self.timeframe)
 
@@ -409,17 +466,24 @@ class Backtesting:
             self.abort = False
             raise DependencyException("Stop requested")
 
-    def _get_ohlcv_as_lists(self, processed: dict[str, DataFrame]) -> dict[str, tuple]:
+    def _get_ohlcv_as_lists(self, processed: dict[str, DataFrame]) -> dict[str, Any]:
         """
         Helper function to convert a processed dataframes into lists for performance reasons.
+        With `backtest_engine` set to "columnar", the data is stored as typed numpy arrays
+        instead (see ColumnarPairData), which builds each row as tuple when it's accessed.
 
         Used by backtest() - so keep this optimized for performance.
 
         :param processed: a processed dictionary with format {pair, data}, which gets cleared to
         optimize memory usage!
         """
+        cache_key = self.signal_cache_key
+        if cache_key is not None and cache_key in _signal_cache:
+            return self._load_signal_cache(processed, cache_key)
 
         data: dict = {}
+        analyzed: dict[str, DataFrame] = {}
+        self.exit_scanners = {}
         self.progress.init_step(BacktestState.CONVERT, len(processed))
 
         # Create dict with data
@@ -436,6 +500,7 @@ class Backtesting:
             self.dataprovider._set_cached_df(
                 pair, self.timeframe, df_analyzed, self.config["candle_type_def"]
             )
+            analyzed[pair] = df_analyzed
 
             # Trim startup period from analyzed dataframe
             df_analyzed = processed[pair] = pair_data = trim_dataframe(
@@ -461,11 +526,62 @@ class Backtesting:
 
             df_analyzed = df_analyzed.drop(df_analyzed.head(1).index)
 
-            # Convert from Pandas to list for performance reasons
-            # (Looping Pandas is slow.)
-            data[pair] = df_analyzed[HEADERS].values.tolist() if not df_analyzed.empty else []
+            if df_analyzed.empty:
+                data[pair] = []
+                continue
+            if self.backtest_fast_path:
+                self.exit_scanners[pair] = ExitCandidateScanner(df_analyzed)
+            if self.backtest_engine == "columnar":
+                data[pair] = ColumnarPairData(df_analyzed, HEADERS)
+            else:
+                # Convert from Pandas to list for performance reasons
+                # (Looping Pandas is slow.)
+                data[pair] = df_analyzed[HEADERS].values.tolist()
+
+        if cache_key is not None:
+            # Only keep the latest state to limit memory usage.
+            _signal_cache.clear()
+            _signal_cache[cache_key] = (data, analyzed, dict(processed), self.exit_scanners)
+        return data
+
+    @staticmethod
+    def has_signal_cache(cache_key: str | None) -> bool:
+        """
+        Check if converted signal data for the given signal cache key is available.
+        """
+        return cache_key is not None and cache_key in _signal_cache
+
+    def _load_signal_cache(self, processed: dict[str, DataFrame], cache_key: str) -> dict[str, Any]:
+        """
+        Restore the result of a previous _get_ohlcv_as_lists() call with identical signals.
+        Replicates its side effects - populating the dataprovider cache and trimming processed.
+        """
+        data, analyzed, trimmed, self.exit_scanners = _signal_cache[cache_key]
+        for pair, df_analyzed in analyzed.items():
+            self.dataprovider._set_cached_df(
+                pair, self.timeframe, df_analyzed, self.config["candle_type_def"]
+            )
+        processed.update(trimmed)
         return data
 
+    def _fast_path_supported(self) -> bool:
+        """
+        Check if the exit evaluation of open trades may skip candles (see backtest_fast_path).
+        Requires spot mode without timeframe-detail, and a strategy without per-candle callbacks.
+        """
+        strategy = self.strategy
+        return (
+            self.backtest_fast_path
+            and not self.timeframe_detail
+            and self.trading_mode == TradingMode.SPOT
+            and not strategy.position_adjustment_enable
+            and not strategy.use_custom_stoploss
+            and all(
+                getattr(getattr(strategy, method), "__func__", None) is getattr(IStrategy, method)
+                for method in FAST_PATH_METHODS
+            )
+        )
+
     def _get_close_rate(
         self, row: tuple, trade: LocalTrade, exit_: ExitCheckTuple, trade_dur: int
     ) -> float:
@@ -1454,6 +1570,11 @@ class Backtesting:
         # Use dict of lists with data for performance
         # (looping lists is a lot faster than pandas DataFrames)
         data: dict = self._get_ohlcv_as_lists(processed)
+        fast_path = (
+            BacktestFastPath(self.exit_scanners, self.strategy)
+            if self._fast_path_supported()
+            else None
+        )
 
         # Indexes per pair, so some pairs are allowed to have a missing start.
         indexes: dict = defaultdict(int)
@@ -1492,27 +1613,32 @@ class Backtesting:
                 # Spread out into detail timeframe.
                 # Should only happen when we are either in a trade for this pair
                 # or when we got the signal for a new trade.
-                exit_candle_end = current_detail_time + self.timeframe_td
-
-                detail_data = self.detail_data[pair]
-                detail_data = detail_data.loc[
-                    (detail_data["date"] >= current_detail_time)
-                    & (detail_data["date"] < exit_candle_end)
-                ].copy()
-                if len(detail_data) == 0:
+                detail_pair_data = self.detail_index.get(pair)
+                det_start, det_end = (
+                    detail_pair_data.get_range(current_detail_time)
+                    if detail_pair_data is not None
+                    else (0, 0)
+                )
+                if detail_pair_data is None or det_start == det_end:
                     # Fall back to "regular" data if no detail data was found for this candle
                     self.dataprovider._set_dataframe_max_date(current_time)
                     self.backtest_loop(row, pair, current_time, trade_dir, not is_last_row)
                     continue
-                detail_data.loc[:, "enter_long"] = row[LONG_IDX]
-                detail_data.loc[:, "exit_long"] = row[ELONG_IDX]
-                detail_data.loc[:, "enter_short"] = row[SHORT_IDX]
-                detail_data.loc[:, "exit_short"] = row[ESHORT_IDX]
-                detail_data.loc[:, "enter_tag"] = row[ENTER_TAG_IDX]
-                detail_data.loc[:, "exit_tag"] = row[EXIT_TAG_IDX]
+                detail_rows = detail_pair_data.get_rows(
+                    det_start,
+                    det_end,
+                    [
+                        row[LONG_IDX],
+                        row[ELONG_IDX],
+                        row[SHORT_IDX],
+                        row[ESHORT_IDX],
+                        row[ENTER_TAG_IDX],
+                        row[EXIT_TAG_IDX],
+                    ],
+                )
                 is_first = True
                 current_time_det = current_time
-                for det_row in detail_data[HEADERS].values.tolist():
+                for det_row in detail_rows:
                     self.dataprovider._set_dataframe_max_date(current_time_det)
                     self.backtest_loop(
                         det_row,
@@ -1523,10 +1649,20 @@ class Backtesting:
                     )
                     current_time_det += self.timeframe_detail_td
                     is_first = False
+            elif fast_path is not None:
+                if trade_dir is None and fast_path.can_skip(pair, row_index - 1):
+                    # Nothing can happen for this pair on this candle.
+                    continue
+                self.dataprovider._set_dataframe_max_date(current_time)
+                fast_path.before_candle(pair, row_index - 1)
+                self.backtest_loop(row, pair, current_time, trade_dir, not is_last_row)
+                fast_path.after_candle(pair, row_index - 1)
             else:
                 self.dataprovider._set_dataframe_max_date(current_time)
                 self.backtest_loop(row, pair, current_time, trade_dir, not is_last_row)
 
+        if fast_path is not None:
+            fast_path.finalize(indexes)
         self.handle_left_open(LocalTrade.bt_trades_open_pp, data=data)
         self.wallets.update()
 
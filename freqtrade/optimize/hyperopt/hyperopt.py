@@ -22,9 +22,11 @@ from freqtrade.enums import HyperoptState
 from freqtrade.exceptions import OperationalException
 from freqtrade.loggers import error_console
 from freqtrade.misc import file_dump_json, plural
+from freqtrade.optimize.hyperopt.hyperopt_data import HyperoptSharedData
 from freqtrade.optimize.hyperopt.hyperopt_logger import logging_mp_handle, logging_mp_setup
 from freqtrade.optimize.hyperopt.hyperopt_optimizer import HyperOptimizer
 from freqtrade.optimize.hyperopt.hyperopt_output import HyperoptOutput
+from freqtrade.optimize.hyperopt.hyperopt_worker_pool import HyperoptWorkerPool
 from freqtrade.optimize.hyperopt_tools import (
     HyperoptStateContainer,
     HyperoptTools,
@@ -78,6 +80,9 @@ class Hyperopt:
         self.data_pickle_file = (
             self.config["user_data_dir"] / "hyperopt_results" / "hyperopt_tickerdata.pkl"
         )
+        self.shared_data = HyperoptSharedData(
+            self.config["user_data_dir"] / "hyperopt_results" / "hyperopt_data"
+        )
         self.total_epochs = config.get("epochs", 0)
 
         self.current_best_loss = 100
@@ -96,6 +101,7 @@ class Hyperopt:
         self.print_json = self.config.get("print_json", False)
 
         self.hyperopter = HyperOptimizer(self.config)
+        self.worker_pool: HyperoptWorkerPool | None = None
 
     @staticmethod
     def get_lock_filename(config: Config) -> str:
@@ -110,6 +116,7 @@ class Hyperopt:
             if p.is_file():
                 logger.info(f"Removing `{p}`.")
                 p.unlink()
+        self.shared_data.cleanup()
 
     def hyperopt_pickle_magic(self, bases) -> None:
         """
@@ -165,6 +172,8 @@ class Hyperopt:
 
     def run_optimizer_parallel(self, parallel: Parallel, asked: list[list]) -> list[dict[str, Any]]:
         """Start optimizer in a parallel way"""
+        if self.worker_pool is not None:
+            return self.worker_pool.run(asked)
 
         def optimizer_wrapper(*args, **kwargs):
             # global log queue. This must happen in the file that initializes Parallel
@@ -280,6 +289,13 @@ class Hyperopt:
             with Parallel(n_jobs=config_jobs) as parallel:
                 jobs = parallel._effective_n_jobs()
                 logger.info(f"Effective number of parallel workers used: {jobs}")
+                if self.config.get("hyperopt_worker_pool", False):
+                    self.worker_pool = HyperoptWorkerPool(
+                        self.hyperopter,
+                        jobs,
+                        log_queue,
+                        logging.INFO if self.config["verbosity"] < 1 else logging.DEBUG,
+                    )
 
                 # Define progressbar
                 with get_progress_tracker(
@@ -321,6 +337,10 @@ class Hyperopt:
 
         except KeyboardInterrupt:
             print("User interrupted..")
+        finally:
+            if self.worker_pool is not None:
+                self.worker_pool.shutdown()
+                self.worker_pool = None
 
         logger.info(
             f"{self.num_epochs_saved} {plural(self.num_epochs_saved, 'epoch')} "
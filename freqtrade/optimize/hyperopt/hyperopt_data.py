@@ -0,0 +1,123 @@
+"""
+Memory-mapped columnar data store for hyperopt.
+The main process publishes the (preprocessed) candle data once, hyperopt worker processes
+attach to it without copying the data into their own memory.
+"""
+
+import logging
+import shutil
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from joblib import dump, load
+from pandas import DataFrame
+
+
+logger = logging.getLogger(__name__)
+
+# Alignment of each column within the data file (in bytes)
+COLUMN_ALIGNMENT = 64
+
+
+class HyperoptSharedData:
+    """
+    Stores all numeric columns of all pairs in one binary file, which is memory-mapped by all
+    hyperopt processes. The operating system shares the mapped pages between processes, so
+    memory usage does not grow with the number of hyperopt jobs.
+    Non-numeric columns are stored in a separate (small) metadata file.
+    """
+
+    DATA_FILE = "data.bin"
+    META_FILE = "meta.pkl"
+
+    def __init__(self, directory: Path) -> None:
+        self._directory = directory
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def cleanup(self) -> None:
+        if self._directory.is_dir():
+            logger.info(f"Removing `{self._directory}`.")
+            shutil.rmtree(self._directory)
+
+    def publish(self, data: dict[str, DataFrame]) -> None:
+        """
+        Write data to the store. Replaces previously published data.
+        :param data: dict of dataframes in the format {pair: dataframe}
+        """
+        self.cleanup()
+        self._directory.mkdir(parents=True)
+        meta: dict[str, dict[str, Any]] = {}
+        offset = 0
+        with (self._directory / self.DATA_FILE).open("wb") as f:
+            for pair, df in data.items():
+                columns: list[tuple[str, str, int | None]] = []
+                objects = {}
+                for col in df.columns:
+                    series = df[col]
+                    if isinstance(series.dtype, pd.DatetimeTZDtype):
+                        values = series.to_numpy(dtype="datetime64[ns]").view("int64")
+                        dtype = str(series.dtype)
+                    elif isinstance(series.dtype, np.dtype) and series.dtype.kind in "fiub":
+                        values = series.to_numpy()
+                        dtype = values.dtype.str
+                    else:
+                        objects[col] = series.array
+                        columns.append((col, "object", None))
+                        continue
+
+                    padding = -offset % COLUMN_ALIGNMENT
+                    f.write(b"\0" * padding)
+                    offset += padding
+                    f.write(np.ascontiguousarray(values).tobytes())
+                    columns.append((col, dtype, offset))
+                    offset += values.nbytes
+
+                meta[pair] = {
+                    "index": df.index,
+                    "columns": columns,
+                    "objects": objects,
+                }
+        dump(meta, self._directory / self.META_FILE)
+        logger.info(f"Published hyperopt data for {len(meta)} pairs to `{self._directory}`.")
+
+    def attach(self) -> dict[str, DataFrame]:
+        """
+        Get published data as dict of dataframes.
+        Numeric columns are backed by a fresh copy-on-write mapping of the data file -
+        modifications stay private to the returned dataframes and are not visible to later calls.
+        """
+        meta = load(self._directory / self.META_FILE)
+        data_file = self._directory / self.DATA_FILE
+        mapped = (
+            np.memmap(data_file, dtype=np.uint8, mode="c").view(np.ndarray)
+            if data_file.stat().st_size > 0
+            else np.empty(0, dtype=np.uint8)
+        )
+
+        result = {}
+        for pair, pair_meta in meta.items():
+            length = len(pair_meta["index"])
+            columns: dict[str, Any] = {}
+            for col, dtype, offset in pair_meta["columns"]:
+                if offset is None:
+                    columns[col] = pair_meta["objects"][col]
+                elif dtype.startswith("datetime64"):
+                    view = mapped[offset : offset + length * 8].view("int64")
+                    columns[col] = (
+                        pd.to_datetime(view, utc=True)
+                        .tz_convert(pd.DatetimeTZDtype.construct_from_string(dtype).tz)
+                        .array
+                    )
+                else:
+                    np_dtype = np.dtype(dtype)
+                    columns[col] = mapped[offset : offset + length * np_dtype.itemsize].view(
+                        np_dtype
+                    )
+            # copy=False keeps numeric columns as views on the mapped file.
+            result[pair] = DataFrame(columns, index=pair_meta["index"], copy=False)
+        return result
@@ -3,17 +3,19 @@ This module contains the hyperopt optimizer class, which needs to be pickled
 and will be sent to the hyperopt worker processes.
 """
 
+import hashlib
 import logging
 import sys
 import warnings
 from datetime import datetime, timezone
 from typing import Any
+from uuid import uuid4
 
 from joblib import dump, load
 from joblib.externals import cloudpickle
 from pandas import DataFrame
 
-from freqtrade.constants import DATETIME_PRINT_FORMAT, Config
+from freqtrade.constants import DATETIME_PRINT_FORMAT, HYPEROPT_DATA_FORMAT_DEFAULT, Config
 from freqtrade.data.converter import trim_dataframes
 from freqtrade.data.history import get_timerange
 from freqtrade.data.metrics import calculate_market_change
@@ -24,6 +26,7 @@ from freqtrade.optimize.backtesting import Backtesting
 
 # Import IHyperOptLoss to allow unpickling classes from these modules
 from freqtrade.optimize.hyperopt.hyperopt_auto import HyperOptAuto
+from freqtrade.optimize.hyperopt.hyperopt_data import HyperoptSharedData
 from freqtrade.optimize.hyperopt_loss.hyperopt_loss_interface import IHyperOptLoss
 from freqtrade.optimize.hyperopt_tools import HyperoptStateContainer, HyperoptTools
 from freqtrade.optimize.optimize_reports import generate_strategy_stats
@@ -88,8 +91,14 @@ class HyperOptimizer:
         self.data_pickle_file = (
             self.config["user_data_dir"] / "hyperopt_results" / "hyperopt_tickerdata.pkl"
         )
+        self.data_format = self.config.get("hyperopt_data_format", HYPEROPT_DATA_FORMAT_DEFAULT)
+        self.shared_data = HyperoptSharedData(
+            self.config["user_data_dir"] / "hyperopt_results" / "hyperopt_data"
+        )
 
         self.market_change = 0.0
+        # Identifies the data prepared for this hyperopt run (part of the signal cache key).
+        self.data_id = ""
 
         if HyperoptTools.has_space(self.config, "sell"):
             # Make sure use_exit_signal is enabled
@@ -108,6 +117,9 @@ class HyperOptimizer:
         self.backtesting.exchange.loop = None  # type: ignore
         self.backtesting.exchange._loop_lock = None  # type: ignore
         self.backtesting.exchange._cache_lock = None  # type: ignore
+        # Both hold locks, which can't be pickled
+        self.backtesting.exchange._request_scheduler = None
+        self.backtesting.exchange._ticker_snapshot = None
         # self.backtesting.exchange = None  # type: ignore
         self.backtesting.pairlists = None  # type: ignore
 
@@ -244,6 +256,28 @@ class HyperOptimizer:
                 # noinspection PyProtectedMember
                 attr.value = params_dict[attr_name]
 
+    def _get_signal_cache_key(self) -> str | None:
+        """
+        Get a key identifying the entry / exit signals of the current epoch.
+        Signals only depend on buy and sell parameters - if neither space is optimized,
+        signals are identical for all epochs and can be reused by backtesting.
+        :return: Hash of all buy and sell parameter values, None if signals change per epoch
+            or no data has been prepared.
+        """
+        if (
+            not self.data_id
+            or HyperoptTools.has_space(self.config, "buy")
+            or HyperoptTools.has_space(self.config, "sell")
+        ):
+            return None
+        params = [
+            (category, name, param.value)
+            for category in ("buy", "sell")
+            for name, param in self.backtesting.strategy.enumerate_parameters(category)
+        ]
+        key_source = repr((self.data_id, self.get_strategy_name(), params))
+        return hashlib.sha256(key_source.encode()).hexdigest()
+
     def generate_optimizer(self, raw_params: list[Any]) -> dict[str, Any]:
         """
         Used Optimize function.
@@ -300,11 +334,15 @@ class HyperOptimizer:
 
             self.backtesting.strategy.max_open_trades = updated_max_open_trades
 
-        with self.data_pickle_file.open("rb") as f:
-            processed = load(f, mmap_mode="r")
-            if self.analyze_per_epoch:
-                # Data is not yet analyzed, rerun populate_indicators.
-                processed = self.advise_and_trim(processed)
+        self.backtesting.signal_cache_key = self._get_signal_cache_key()
+        if self.backtesting.has_signal_cache(self.backtesting.signal_cache_key):
+            # Signals are unchanged - backtesting restores the trimmed data from its cache.
+            processed = {}
+        elif self.analyze_per_epoch:
+            # Data is not yet analyzed, rerun populate_indicators.
+            processed = self.advise_and_trim(self._load_data())
+        else:
+            processed = self._load_data()
 
         bt_results = self.backtesting.backtest(
             processed=processed, start_date=self.min_date, end_date=self.max_date
@@ -421,6 +459,7 @@ class HyperOptimizer:
     def prepare_hyperopt_data(self) -> None:
         HyperoptStateContainer.set_state(HyperoptState.DATALOAD)
         data, self.timerange = self.backtesting.load_bt_data()
+        self.data_id = uuid4().hex
         self.backtesting.load_bt_data_detail()
         logger.info("Dataload complete. Calculating indicators")
 
@@ -436,6 +475,21 @@ class HyperOptimizer:
                 f"({(self.max_date - self.min_date).days} days).."
             )
             # Store non-trimmed data - will be trimmed after signal generation.
-            dump(preprocessed, self.data_pickle_file)
+            self._store_data(preprocessed)
+        else:
+            self._store_data(data)
+
+    def _store_data(self, data: dict[str, DataFrame]) -> None:
+        """
+        Store data once, so hyperopt workers can load it for every epoch.
+        """
+        if self.data_format == "mmap":
+            self.shared_data.publish(data)
         else:
             dump(data, self.data_pickle_file)
+
+    def _load_data(self) -> dict[str, DataFrame]:
+        if self.data_format == "mmap":
+            return self.shared_data.attach()
+        with self.data_pickle_file.open("rb") as f:
+            return load(f, mmap_mode="r")
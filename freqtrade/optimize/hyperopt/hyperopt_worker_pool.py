@@ -0,0 +1,90 @@
+"""
+Persistent worker pool for hyperopt.
+Every worker process receives the HyperOptimizer (strategy, backtesting instance and
+configuration) once when it starts - afterwards only the raw parameters of each epoch are
+sent to the workers, and the epoch results are sent back.
+"""
+
+import logging
+from math import ceil
+from typing import Any
+
+from joblib.externals import cloudpickle
+from joblib.externals.loky import ProcessPoolExecutor
+
+from freqtrade.optimize.hyperopt.hyperopt_logger import logging_mp_setup
+from freqtrade.optimize.hyperopt.hyperopt_optimizer import HyperOptimizer
+
+
+logger = logging.getLogger(__name__)
+
+# HyperOptimizer instance of the current worker process. Set by _init_worker.
+_worker_hyperopter: HyperOptimizer | None = None
+
+
+def _init_worker(hyperopter_pickle: bytes, log_queue: Any, log_level: int) -> None:
+    """
+    Runs once in every worker process when it's started.
+    """
+    global _worker_hyperopter
+    logging_mp_setup(log_queue, log_level)
+    _worker_hyperopter = cloudpickle.loads(hyperopter_pickle)
+
+
+def _run_epochs(asked: list[list[Any]]) -> list[dict[str, Any]]:
+    """
+    Evaluate a batch of epochs with the HyperOptimizer of this worker process.
+    """
+    if _worker_hyperopter is None:
+        raise RuntimeError("Hyperopt worker has not been initialized.")
+    return [_worker_hyperopter.generate_optimizer(raw_params) for raw_params in asked]
+
+
+class HyperoptWorkerPool:
+    """
+    Long-lived pool of hyperopt worker processes.
+    Worker processes are started on the first call to run(), so the HyperOptimizer is sent in
+    its state at that point in time (e.g. with the dataprovider cache populated by a first,
+    non-parallel epoch).
+    """
+
+    def __init__(self, hyperopter: HyperOptimizer, n_jobs: int, log_queue: Any, log_level: int):
+        self._hyperopter = hyperopter
+        self._n_jobs = n_jobs
+        self._log_queue = log_queue
+        self._log_level = log_level
+        self._executor: ProcessPoolExecutor | None = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            hyperopter_pickle = cloudpickle.dumps(self._hyperopter)
+            logger.info(
+                f"Starting {self._n_jobs} hyperopt worker processes "
+                f"({len(hyperopter_pickle) / 1024 / 1024:.2f} MB per worker)."
+            )
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._n_jobs,
+                initializer=_init_worker,
+                initargs=(hyperopter_pickle, self._log_queue, self._log_level),
+            )
+        return self._executor
+
+    def run(self, asked: list[list[Any]]) -> list[dict[str, Any]]:
+        """
+        Evaluate the given points. Points are split into one batch per worker.
+        :param asked: list of raw parameter lists, as returned by the optimizer
+        :return: list of epoch results, in the same order as asked
+        """
+        executor = self._get_executor()
+        batch_size = ceil(len(asked) / self._n_jobs) if asked else 1
+        futures = [
+            executor.submit(_run_epochs, asked[i : i + batch_size])
+            for i in range(0, len(asked), batch_size)
+        ]
+        return [result for future in futures for result in future.result()]
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            # Also terminates epochs still running (e.g. after a keyboard interrupt).
+            self._executor.shutdown(wait=True, kill_workers=True)
+            self._executor = None
@@ -0,0 +1,78 @@
+"""
+Index of closed backtest trades, by close date.
+"""
+
+from bisect import bisect_right
+from collections import defaultdict
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from freqtrade.persistence.trade_model import LocalTrade
+
+
+class _SortedTrades:
+    """
+    Trades sorted by close date. Trades with identical close date keep insertion order.
+    """
+
+    def __init__(self) -> None:
+        self.dates: list[datetime] = []
+        self.trades: list[LocalTrade] = []
+        # Trades without close date - never match a close date filter
+        self.undated: list[LocalTrade] = []
+
+    def add(self, trade: "LocalTrade") -> None:
+        close_date = trade.close_date
+        if close_date is None:
+            self.undated.append(trade)
+        elif not self.dates or close_date >= self.dates[-1]:
+            # Trades are usually closed in order
+            self.dates.append(close_date)
+            self.trades.append(trade)
+        else:
+            idx = bisect_right(self.dates, close_date)
+            self.dates.insert(idx, close_date)
+            self.trades.insert(idx, trade)
+
+    def after(self, close_date: datetime | None) -> list["LocalTrade"]:
+        if close_date is None:
+            return self.trades + self.undated
+        return self.trades[bisect_right(self.dates, close_date) :]
+
+
+class ClosedTradeIndex:
+    """
+    Closed backtest trades, sorted by close date - for all pairs and per pair.
+    Answers "closed trades (for pair) closed after <date>" without scanning all trades,
+    as required by protections after every exit.
+    """
+
+    def __init__(self) -> None:
+        self._all = _SortedTrades()
+        self._per_pair: dict[str, _SortedTrades] = defaultdict(_SortedTrades)
+
+    def __len__(self) -> int:
+        return len(self._all.trades) + len(self._all.undated)
+
+    def add(self, trade: "LocalTrade") -> None:
+        """
+        Add a closed trade to the index.
+        """
+        self._all.add(trade)
+        self._per_pair[trade.pair].add(trade)
+
+    def get_trades(
+        self, *, pair: str | None = None, close_date: datetime | None = None
+    ) -> list["LocalTrade"]:
+        """
+        Get closed trades, sorted by close date.
+        :param pair: Only return trades for this pair
+        :param close_date: Only return trades closed after this date (trade.close_date > input)
+        """
+        if pair:
+            if pair not in self._per_pair:
+                return []
+            return self._per_pair[pair].after(close_date)
+        return self._all.after(close_date)
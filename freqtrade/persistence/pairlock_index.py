@@ -0,0 +1,93 @@
+"""
+Index of in-memory pair locks (used in backtesting), by pair, side and lock end time.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from datetime import datetime
+
+from freqtrade.persistence.pairlock import PairLock
+
+
+class _LocksByEnd:
+    """
+    Locks of one pair / side, sorted by lock end time.
+    """
+
+    def __init__(self) -> None:
+        self.ends: list[datetime] = []
+        # (insertion sequence, lock) - sequence restores the order locks were added in
+        self.locks: list[tuple[int, PairLock]] = []
+
+    def add(self, seq: int, lock: PairLock) -> None:
+        end = lock.lock_end_time
+        if not self.ends or end >= self.ends[-1]:
+            self.ends.append(end)
+            self.locks.append((seq, lock))
+        else:
+            idx = bisect_right(self.ends, end)
+            self.ends.insert(idx, end)
+            self.locks.insert(idx, (seq, lock))
+
+    def ending_after(self, now: datetime) -> list[tuple[int, PairLock]]:
+        """
+        Locks ending at or after now. Expired locks are skipped via bisect, but not removed,
+        as locks may be queried for an earlier point in time.
+        """
+        return self.locks[bisect_left(self.ends, now) :]
+
+
+class PairLockIndex:
+    """
+    In-memory pair locks, keyed by pair and side - each sorted by lock end time.
+    Lookups only visit the locks of the requested pair / sides which didn't end yet,
+    instead of all locks ever created.
+    """
+
+    def __init__(self) -> None:
+        self._locks: dict[str, dict[str, _LocksByEnd]] = defaultdict(
+            lambda: defaultdict(_LocksByEnd)
+        )
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, lock: PairLock) -> None:
+        self._locks[lock.pair][lock.side].add(self._count, lock)
+        self._count += 1
+
+    def get_locks(self, pair: str | None, now: datetime, side: str | None) -> list[PairLock]:
+        """
+        Get active locks - identical to filtering all locks on
+        lock_end_time >= now, active, pair (if given) and side (if given, including '*' locks).
+        :return: Locks, in the order they were added
+        """
+        if pair is None:
+            per_pair = list(self._locks.values())
+        elif pair in self._locks:
+            per_pair = [self._locks[pair]]
+        else:
+            return []
+
+        candidates: list[tuple[int, PairLock]] = []
+        for per_side in per_pair:
+            if side is None:
+                sides = list(per_side.values())
+            else:
+                sides = [per_side[s] for s in {"*", side} if s in per_side]
+            for locks in sides:
+                candidates.extend(locks.ending_after(now))
+        if len(candidates) > 1:
+            candidates.sort(key=lambda c: c[0])
+        # Lock attributes may have been modified since they were indexed - check them again.
+        return [
+            lock
+            for _, lock in candidates
+            if (
+                lock.lock_end_time >= now
+                and lock.active is True
+                and (pair is None or lock.pair == pair)
+                and (side is None or lock.side == "*" or lock.side == side)
+            )
+        ]
@@ -6,6 +6,7 @@ from sqlalchemy import select
 
 from freqtrade.exchange import timeframe_to_next_date
 from freqtrade.persistence.models import PairLock
+from freqtrade.persistence.pairlock_index import PairLockIndex
 
 
 logger = logging.getLogger(__name__)
@@ -20,6 +21,9 @@ class PairLocks:
 
     use_db = True
     locks: list[PairLock] = []
+    # Index of PairLocks.locks - only used if use_db is False
+    _locks_index: PairLockIndex = PairLockIndex()
+    _locks_indexed: list[PairLock] = locks
 
     timeframe: str = ""
 
@@ -30,6 +34,23 @@ class PairLocks:
         """
         if not PairLocks.use_db:
             PairLocks.locks = []
+            PairLocks._locks_index = PairLockIndex()
+            PairLocks._locks_indexed = PairLocks.locks
+
+    @staticmethod
+    def _get_locks_index() -> PairLockIndex:
+        """
+        Index of the in-memory locks.
+        Rebuilt if PairLocks.locks was replaced or modified without using lock_pair().
+        """
+        if PairLocks._locks_indexed is not PairLocks.locks or len(PairLocks._locks_index) != len(
+            PairLocks.locks
+        ):
+            PairLocks._locks_index = PairLockIndex()
+            PairLocks._locks_indexed = PairLocks.locks
+            for lock in PairLocks.locks:
+                PairLocks._locks_index.add(lock)
+        return PairLocks._locks_index
 
     @staticmethod
     def lock_pair(
@@ -62,6 +83,7 @@ class PairLocks:
             PairLock.session.add(lock)
             PairLock.session.commit()
         else:
+            PairLocks._get_locks_index().add(lock)
             PairLocks.locks.append(lock)
         return lock
 
@@ -82,17 +104,7 @@ class PairLocks:
         if PairLocks.use_db:
             return PairLock.query_pair_locks(pair, now, side).all()
         else:
-            locks = [
-                lock
-                for lock in PairLocks.locks
-                if (
-                    lock.lock_end_time >= now
-                    and lock.active is True
-                    and (pair is None or lock.pair == pair)
-                    and (side is None or lock.side == "*" or lock.side == side)
-                )
-            ]
-            return locks
+            return PairLocks._get_locks_index().get_locks(pair, now, side)
 
     @staticmethod
     def get_pair_longest_lock(
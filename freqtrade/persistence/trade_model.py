@@ -47,6 +47,7 @@ from freqtrade.exchange.exchange_types import CcxtOrder
 from freqtrade.leverage import interest
 from freqtrade.misc import safe_value_fallback
 from freqtrade.persistence.base import ModelBase, SessionType
+from freqtrade.persistence.closed_trade_index import ClosedTradeIndex
 from freqtrade.persistence.custom_data import CustomDataWrapper, _CustomData
 from freqtrade.util import FtPrecise, dt_from_ts, dt_now, dt_ts, dt_ts_none
 
@@ -390,6 +391,8 @@ class LocalTrade:
     bt_trades_open: list["LocalTrade"] = []
     # Copy of trades_open - but indexed by pair
     bt_trades_open_pp: dict[str, list["LocalTrade"]] = defaultdict(list)
+    # Closed trades (bt_trades) - indexed by close date
+    bt_trades_closed_index: ClosedTradeIndex = ClosedTradeIndex()
     bt_open_open_trade_count: int = 0
     bt_open_open_trade_count_candle: int = 0
     bt_total_profit: float = 0
@@ -759,6 +762,7 @@ class LocalTrade:
         LocalTrade.bt_trades = []
         LocalTrade.bt_trades_open = []
         LocalTrade.bt_trades_open_pp = defaultdict(list)
+        LocalTrade.bt_trades_closed_index = ClosedTradeIndex()
         LocalTrade.bt_open_open_trade_count = 0
         LocalTrade.bt_open_open_trade_count_candle = 0
         LocalTrade.bt_total_profit = 0
@@ -1440,7 +1444,13 @@ class LocalTrade:
             if is_open:
                 sel_trades = LocalTrade.bt_trades_open
             else:
-                sel_trades = LocalTrade.bt_trades
+                # Closed trades are indexed by pair and close_date
+                sel_trades = LocalTrade._closed_trades_index().get_trades(
+                    pair=pair, close_date=close_date
+                )
+                if open_date:
+                    sel_trades = [trade for trade in sel_trades if trade.open_date > open_date]
+                return sel_trades
 
         else:
             # Not used during backtesting, but might be used by a strategy
@@ -1457,6 +1467,18 @@ class LocalTrade:
 
         return sel_trades
 
+    @staticmethod
+    def _closed_trades_index() -> ClosedTradeIndex:
+        """
+        Index of closed backtest trades.
+        Rebuilt if bt_trades was modified without close_bt_trade() / add_bt_trade().
+        """
+        if len(LocalTrade.bt_trades_closed_index) != len(LocalTrade.bt_trades):
+            LocalTrade.bt_trades_closed_index = ClosedTradeIndex()
+            for trade in LocalTrade.bt_trades:
+                LocalTrade.bt_trades_closed_index.add(trade)
+        return LocalTrade.bt_trades_closed_index
+
     @staticmethod
     def close_bt_trade(trade):
         LocalTrade.bt_trades_open.remove(trade)
@@ -1467,6 +1489,7 @@ class LocalTrade:
             # To avoid exceeding max_open_trades.
             # Must be reset at the start of every candle during backesting.
             LocalTrade.bt_open_open_trade_count_candle -= 1
+        LocalTrade._closed_trades_index().add(trade)
         LocalTrade.bt_trades.append(trade)
         LocalTrade.bt_total_profit += trade.close_profit_abs
 
@@ -1478,6 +1501,7 @@ class LocalTrade:
             LocalTrade.bt_open_open_trade_count += 1
             LocalTrade.bt_open_open_trade_count_candle += 1
         else:
+            LocalTrade._closed_trades_index().add(trade)
             LocalTrade.bt_trades.append(trade)
 
     @staticmethod
@@ -7,6 +7,13 @@ from freqtrade.exchange import (
     timeframe_to_seconds,
 )
 from freqtrade.persistence import Order, PairLocks, Trade
+from freqtrade.strategy.incremental_indicators import (
+    IncrementalATR,
+    IncrementalBollingerBands,
+    IncrementalEMA,
+    IncrementalRSI,
+    IncrementalSMA,
+)
 from freqtrade.strategy.informative_decorator import informative
 from freqtrade.strategy.interface import IStrategy
 from freqtrade.strategy.parameters import (
@@ -44,4 +51,10 @@ __all__ = [
     "merge_informative_pair",
     "stoploss_from_absolute",
     "stoploss_from_open",
+    # Incremental indicators
+    "IncrementalATR",
+    "IncrementalBollingerBands",
+    "IncrementalEMA",
+    "IncrementalRSI",
+    "IncrementalSMA",
 ]
@@ -0,0 +1,252 @@
+"""
+Indicators which can be continued for new candles, for use in populate_indicators_incremental().
+Results match the corresponding TA-Lib functions.
+"""
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from freqtrade.exceptions import IncrementalStateError
+
+
+class _History:
+    """
+    Inputs to prepend to the next candles - for indicators which don't carry a running value
+    (or didn't see enough candles to do so yet).
+    """
+
+    def __init__(self, inputs: list[np.ndarray]) -> None:
+        self.inputs = inputs
+
+
+def _ewm_continue(values: np.ndarray, alpha: float, last: float) -> np.ndarray:
+    """
+    Exponential smoothing of values, continuing from the last smoothed value.
+    """
+    series = pd.Series(np.concatenate(([last], values)))
+    return series.ewm(alpha=alpha, adjust=False).mean().to_numpy()[1:]
+
+
+def _ewm_seeded(values: np.ndarray, alpha: float, period: int, start: int = 0) -> np.ndarray:
+    """
+    Exponential smoothing seeded with the mean of the first period values (after start).
+    The first smoothed value is at index start + period - 1, NaN before.
+    """
+    out = np.full(len(values), np.nan)
+    seed_idx = start + period - 1
+    out[seed_idx] = values[start : seed_idx + 1].mean()
+    out[seed_idx + 1 :] = _ewm_continue(values[seed_idx + 1 :], alpha, out[seed_idx])
+    return out
+
+
+class IncrementalIndicator:
+    """
+    Base class of incremental indicators.
+    calculate() computes the indicator for a full dataframe, update() continues it for new candles
+    only. State is kept per pair, so one instance can be used for all pairs.
+    """
+
+    # Dataframe columns used as input
+    inputs: tuple[str, ...] = ("close",)
+    # Names of output columns - indicators with a single output return a Series
+    outputs: tuple[str, ...] = ()
+
+    def __init__(self, period: int) -> None:
+        if period < 1:
+            raise ValueError("period must be positive.")
+        self.period = period
+        self._state: dict[str, Any] = {}
+
+    def calculate(self, dataframe: pd.DataFrame, metadata: dict) -> pd.Series | pd.DataFrame:
+        """
+        Calculate the indicator for all candles of dataframe.
+        To be used in populate_indicators().
+        """
+        out, self._state[metadata["pair"]] = self._full(self._get_inputs(dataframe))
+        return self._to_pandas(out, dataframe.index)
+
+    def update(self, new_candles: pd.DataFrame, metadata: dict) -> pd.Series | pd.DataFrame:
+        """
+        Continue the indicator for candles following the candles of the previous call.
+        To be used in populate_indicators_incremental().
+        :raises IncrementalStateError: if the indicator wasn't calculated for this pair yet.
+            Calculating it from the new candles only would not match the full calculation.
+        """
+        pair = metadata["pair"]
+        if pair not in self._state:
+            raise IncrementalStateError(
+                f"{self.__class__.__name__} was not calculated for {pair} yet. "
+                "Please use calculate() in populate_indicators()."
+            )
+        inputs = self._get_inputs(new_candles)
+        state = self._state[pair]
+        if isinstance(state, _History):
+            count = len(new_candles)
+            out, self._state[pair] = self._full(
+                [
+                    np.concatenate((hist, new))
+                    for hist, new in zip(state.inputs, inputs, strict=True)
+                ]
+            )
+            out = tuple(values[len(values) - count :] for values in out)
+        else:
+            out, self._state[pair] = self._continue(inputs, state)
+        return self._to_pandas(out, new_candles.index)
+
+    def _get_inputs(self, dataframe: pd.DataFrame) -> list[np.ndarray]:
+        return [dataframe[column].to_numpy(dtype=float) for column in self.inputs]
+
+    def _to_pandas(self, out: tuple[np.ndarray, ...], index: pd.Index) -> pd.Series | pd.DataFrame:
+        if not self.outputs:
+            return pd.Series(out[0], index=index)
+        return pd.DataFrame(dict(zip(self.outputs, out, strict=True)), index=index)
+
+    def _full(self, inputs: list[np.ndarray]) -> tuple[tuple[np.ndarray, ...], Any]:
+        """
+        Calculate the indicator for all inputs.
+        :return: Tuple of outputs, and the state to continue from
+        """
+        raise NotImplementedError()
+
+    def _continue(self, inputs: list[np.ndarray], state: Any) -> tuple[tuple[np.ndarray, ...], Any]:
+        """
+        Continue the indicator from state (as returned by _full() or _continue()).
+        Only called for states other than _History.
+        """
+        raise NotImplementedError()
+
+
+class IncrementalSMA(IncrementalIndicator):
+    """
+    Simple moving average, like ta.SMA().
+    """
+
+    def __init__(self, period: int, source: str = "close") -> None:
+        super().__init__(period)
+        self.inputs = (source,)
+
+    def _full(self, inputs: list[np.ndarray]) -> tuple[tuple[np.ndarray, ...], Any]:
+        values = inputs[0]
+        out = pd.Series(values).rolling(self.period).mean().to_numpy()
+        return (out,), _History([values[max(len(values) - self.period + 1, 0) :]])
+
+
+class IncrementalBollingerBands(IncrementalIndicator):
+    """
+    Bollinger bands, like ta.BBANDS() (using the population standard deviation).
+    Returns a dataframe with the columns lower, mid and upper.
+    """
+
+    outputs = ("lower", "mid", "upper")
+
+    def __init__(self, period: int = 20, stds: float = 2.0, source: str = "close") -> None:
+        super().__init__(period)
+        self.stds = stds
+        self.inputs = (source,)
+
+    def _full(self, inputs: list[np.ndarray]) -> tuple[tuple[np.ndarray, ...], Any]:
+        values = inputs[0]
+        rolling = pd.Series(values).rolling(self.period)
+        mid = rolling.mean().to_numpy()
+        std = rolling.std(ddof=0).to_numpy()
+        return (
+            (mid - self.stds * std, mid, mid + self.stds * std),
+            _History([values[max(len(values) - self.period + 1, 0) :]]),
+        )
+
+
+class IncrementalEMA(IncrementalIndicator):
+    """
+    Exponential moving average, like ta.EMA().
+    """
+
+    def __init__(self, period: int, source: str = "close") -> None:
+        super().__init__(period)
+        self.inputs = (source,)
+        self._alpha = 2 / (period + 1)
+
+    def _full(self, inputs: list[np.ndarray]) -> tuple[tuple[np.ndarray, ...], Any]:
+        values = inputs[0]
+        if len(values) < self.period:
+            return (np.full(len(values), np.nan),), _History(inputs)
+        out = _ewm_seeded(values, self._alpha, self.period)
+        return (out,), out[-1]
+
+    def _continue(self, inputs: list[np.ndarray], state: Any) -> tuple[tuple[np.ndarray, ...], Any]:
+        out = _ewm_continue(inputs[0], self._alpha, state)
+        return (out,), out[-1] if len(out) else state
+
+
+class IncrementalRSI(IncrementalIndicator):
+    """
+    Relative strength index (using Wilder's smoothing), like ta.RSI().
+    """
+
+    def __init__(self, period: int = 14, source: str = "close") -> None:
+        super().__init__(period)
+        self.inputs = (source,)
+
+    @staticmethod
+    def _rsi(avg_gain: np.ndarray, avg_loss: np.ndarray) -> np.ndarray:
+        total = avg_gain + avg_loss
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(total == 0, 0.0, 100 * avg_gain / total)
+
+    def _full(self, inputs: list[np.ndarray]) -> tuple[tuple[np.ndarray, ...], Any]:
+        values = inputs[0]
+        if len(values) <= self.period:
+            return (np.full(len(values), np.nan),), _History(inputs)
+        diff = np.diff(values, prepend=np.nan)
+        alpha = 1 / self.period
+        avg_gain = _ewm_seeded(np.clip(diff, 0, None), alpha, self.period, start=1)
+        avg_loss = _ewm_seeded(np.clip(-diff, 0, None), alpha, self.period, start=1)
+        return (self._rsi(avg_gain, avg_loss),), (avg_gain[-1], avg_loss[-1], values[-1])
+
+    def _continue(self, inputs: list[np.ndarray], state: Any) -> tuple[tuple[np.ndarray, ...], Any]:
+        values = inputs[0]
+        if not len(values):
+            return (values,), state
+        last_gain, last_loss, last_value = state
+        diff = np.diff(values, prepend=last_value)
+        alpha = 1 / self.period
+        avg_gain = _ewm_continue(np.clip(diff, 0, None), alpha, last_gain)
+        avg_loss = _ewm_continue(np.clip(-diff, 0, None), alpha, last_loss)
+        return (self._rsi(avg_gain, avg_loss),), (avg_gain[-1], avg_loss[-1], values[-1])
+
+
+class IncrementalATR(IncrementalIndicator):
+    """
+    Average true range (using Wilder's smoothing), like ta.ATR().
+    """
+
+    inputs = ("high", "low", "close")
+
+    def __init__(self, period: int = 14) -> None:
+        super().__init__(period)
+
+    @staticmethod
+    def _true_range(
+        high: np.ndarray, low: np.ndarray, close: np.ndarray, prev_close: np.ndarray
+    ) -> np.ndarray:
+        return np.maximum(high - low, np.maximum(abs(high - prev_close), abs(low - prev_close)))
+
+    def _full(self, inputs: list[np.ndarray]) -> tuple[tuple[np.ndarray, ...], Any]:
+        high, low, close = inputs
+        if len(close) <= self.period:
+            return (np.full(len(close), np.nan),), _History(inputs)
+        true_range = self._true_range(high, low, close, np.roll(close, 1))
+        out = _ewm_seeded(true_range, 1 / self.period, self.period, start=1)
+        return (out,), (out[-1], close[-1])
+
+    def _continue(self, inputs: list[np.ndarray], state: Any) -> tuple[tuple[np.ndarray, ...], Any]:
+        high, low, close = inputs
+        if not len(close):
+            return (close,), state
+        last_atr, last_close = state
+        prev_close = np.concatenate(([last_close], close[:-1]))
+        out = _ewm_continue(
+            self._true_range(high, low, close, prev_close), 1 / self.period, last_atr
+        )
+        return (out,), (out[-1], close[-1])
@@ -1,12 +1,16 @@
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
-from pandas import DataFrame
+import numpy as np
+from pandas import DataFrame, concat
 
 from freqtrade.enums import CandleType
 from freqtrade.exceptions import OperationalException
-from freqtrade.strategy.strategy_helper import merge_informative_pair
+from freqtrade.strategy.strategy_helper import (
+    _merge_prepared_informative_pair,
+    _prepare_informative_pair,
+)
 
 
 PopulateIndicators = Callable[[Any, DataFrame, dict], DataFrame]
@@ -21,6 +25,85 @@ class InformativeData:
     candle_type: CandleType | None
 
 
+@dataclass
+class _CachedInformative:
+    """
+    Populated informative dataframe, ready to be merged to the dataframes of all pairs.
+    """
+
+    # Prepared informative dataframe (including the date_merge column)
+    dataframe: DataFrame
+    date_merge: str
+    # Informative columns and merge dates - only set if dates are unique and sorted
+    columns: DataFrame | None = None
+    dates: np.ndarray | None = None
+    # Informative row positions merged to each candle, by (candle dates, ffill)
+    alignments: dict[tuple[bytes, bool], np.ndarray | None] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        dates = self.dataframe[self.date_merge].to_numpy(dtype="datetime64[ns]")
+        if _is_strictly_increasing(dates):
+            self.columns = self.dataframe.drop(columns=self.date_merge).reset_index(drop=True)
+            self.dates = dates
+
+
+def _is_strictly_increasing(dates: np.ndarray) -> bool:
+    return not np.isnat(dates).any() and bool((dates[1:] > dates[:-1]).all())
+
+
+def _align_informative(dates: np.ndarray, inf_dates: np.ndarray, ffill: bool) -> np.ndarray:
+    """
+    Position of the informative row merged to each candle (-1 for none) -
+    identical to merging on the candle date, and forward filling rows if ffill is set.
+    """
+    positions = np.searchsorted(inf_dates, dates)
+    found = positions < len(inf_dates)
+    found[found] = inf_dates[positions[found]] == dates[found]
+    positions = np.where(found, positions, -1)
+    if ffill:
+        last_found = np.maximum.accumulate(np.where(found, np.arange(len(dates)), -1))
+        positions = np.where(last_found >= 0, positions[last_found], -1)
+    return positions
+
+
+def _merge_cached_informative(
+    dataframe: DataFrame, cached: _CachedInformative, ffill: bool
+) -> DataFrame:
+    """
+    Merge a cached informative dataframe, reusing the alignment of identical candle dates.
+    Falls back to a regular merge where the result could differ from it.
+    """
+    if (
+        cached.columns is None
+        or cached.dates is None
+        or any(column in dataframe.columns for column in cached.dataframe.columns)
+    ):
+        return _merge_prepared_informative_pair(
+            dataframe, cached.dataframe, cached.date_merge, ffill
+        )
+
+    dates = dataframe["date"].to_numpy(dtype="datetime64[ns]")
+    key = (dates.tobytes(), ffill)
+    if key not in cached.alignments:
+        cached.alignments[key] = (
+            _align_informative(dates, cached.dates, ffill)
+            if _is_strictly_increasing(dates)
+            else None
+        )
+    positions = cached.alignments[key]
+    if positions is None:
+        return _merge_prepared_informative_pair(
+            dataframe, cached.dataframe, cached.date_merge, ffill
+        )
+    return concat(
+        [
+            dataframe.reset_index(drop=True),
+            cached.columns.reindex(positions).reset_index(drop=True),
+        ],
+        axis=1,
+    )
+
+
 def informative(
     timeframe: str,
     asset: str = "",
@@ -131,10 +214,6 @@ def _create_and_merge_informative_pair(
         if inf_data.asset:
             fmt = "{base}_{quote}_" + fmt  # Informatives of other pairs
 
-    inf_metadata = {"pair": asset, "timeframe": timeframe}
-    inf_dataframe = strategy.dp.get_pair_dataframe(asset, timeframe, candle_type)
-    inf_dataframe = populate_indicators(strategy, inf_dataframe, inf_metadata)
-
     formatter: Any = None
     if callable(fmt):
         formatter = fmt  # A custom user-specified formatter function.
@@ -146,21 +225,45 @@ def _create_and_merge_informative_pair(
         "asset": asset,
         "timeframe": timeframe,
     }
-    inf_dataframe.rename(columns=lambda column: formatter(column=column, **fmt_args), inplace=True)
-
     date_column = formatter(column="date", **fmt_args)
     if date_column in dataframe.columns:
         raise OperationalException(
             f"Duplicate column name {date_column} exists in "
             f"dataframe! Ensure column names are unique!"
         )
-    dataframe = merge_informative_pair(
-        dataframe,
+
+    inf_dataframe = strategy.dp.get_pair_dataframe(asset, timeframe, candle_type)
+    # Informative dataframes are shared by all pairs while a cache is active (see
+    # IStrategy._informative_cache()) - populated once per informative candle.
+    cache: dict[tuple, _CachedInformative] | None = strategy._ft_informative_cache
+    cache_key: tuple | None = None
+    if cache is not None and not inf_dataframe.empty:
+        cache_key = (
+            asset,
+            timeframe,
+            candle_type,
+            populate_indicators,
+            fmt,
+            len(inf_dataframe),
+            inf_dataframe["date"].iloc[-1],
+        )
+        if cache_key in cache:
+            return _merge_cached_informative(dataframe, cache[cache_key], inf_data.ffill)
+
+    inf_metadata = {"pair": asset, "timeframe": timeframe}
+    inf_dataframe = populate_indicators(strategy, inf_dataframe, inf_metadata)
+    inf_dataframe.rename(columns=lambda column: formatter(column=column, **fmt_args), inplace=True)
+
+    inf_dataframe, date_merge = _prepare_informative_pair(
         inf_dataframe,
         strategy.timeframe,
         timeframe,
-        ffill=inf_data.ffill,
         append_timeframe=False,
         date_column=date_column,
+        suffix=None,
     )
-    return dataframe
+    if cache is not None and cache_key is not None:
+        cached = _CachedInformative(inf_dataframe, date_merge)
+        cache[cache_key] = cached
+        return _merge_cached_informative(dataframe, cached, inf_data.ffill)
+    return _merge_prepared_informative_pair(dataframe, inf_dataframe, date_merge, inf_data.ffill)
@@ -5,10 +5,13 @@ This module defines the interface to apply for strategies
 
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from math import isinf, isnan
 
-from pandas import DataFrame
+from pandas import DataFrame, concat
 
 from freqtrade.constants import CUSTOM_TAG_MAX_LENGTH, Config, IntOrInf, ListPairsWithTimeframes
 from freqtrade.data.converter import populate_dataframe_with_trades
@@ -24,7 +27,7 @@ from freqtrade.enums import (
     SignalType,
     TradingMode,
 )
-from freqtrade.exceptions import OperationalException, StrategyError
+from freqtrade.exceptions import IncrementalStateError, OperationalException, StrategyError
 from freqtrade.exchange import timeframe_to_minutes, timeframe_to_next_date, timeframe_to_seconds
 from freqtrade.misc import remove_entry_exit_signals
 from freqtrade.persistence import Order, PairLocks, Trade
@@ -32,6 +35,7 @@ from freqtrade.strategy.hyper import HyperStrategyMixin
 from freqtrade.strategy.informative_decorator import (
     InformativeData,
     PopulateIndicators,
+    _CachedInformative,
     _create_and_merge_informative_pair,
     _format_pair_name,
 )
@@ -101,6 +105,8 @@ class IStrategy(ABC, HyperStrategyMixin):
 
     # run "populate_indicators" only for new candle
     process_only_new_candles: bool = True
+    # analyze new candles only, using "populate_indicators_incremental" (dry / live only)
+    incremental_analysis: bool = False
 
     use_exit_signal: bool
     exit_profit_only: bool
@@ -146,6 +152,10 @@ class IStrategy(ABC, HyperStrategyMixin):
         self.config = config
         # Dict to determine if analysis is necessary
         self._last_candle_seen_per_pair: dict[str, datetime] = {}
+        # Last analyzed dataframe per pair, to continue from with incremental_analysis
+        self._analyzed_df_per_pair: dict[str, DataFrame] = {}
+        # Populated informative dataframes, shared by all pairs - see _informative_cache()
+        self._ft_informative_cache: dict[tuple, _CachedInformative] | None = None
         super().__init__(config)
 
         # Gather informative pairs from @informative-decorated methods.
@@ -227,6 +237,20 @@ class IStrategy(ABC, HyperStrategyMixin):
         """
         return dataframe
 
+    def populate_indicators_incremental(
+        self, previous: DataFrame, new_candles: DataFrame, metadata: dict
+    ) -> DataFrame | None:
+        """
+        Populate indicators for new candles only, continuing from the previously analyzed dataframe.
+        Only used if incremental_analysis is enabled (together with process_only_new_candles).
+        :param previous: Dataframe analyzed in the previous iteration, including indicators
+        :param new_candles: Candles (OHLCV) received since the previous iteration
+        :param metadata: Additional information, like the currently traded pair
+        :return: new_candles with all indicators populated,
+            or None to analyze the full dataframe via populate_indicators()
+        """
+        return None
+
     def populate_buy_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         """
         DEPRECATED - please migrate to populate_entry_trend
@@ -1046,6 +1070,57 @@ class IStrategy(ABC, HyperStrategyMixin):
         logger.debug("TA Analysis Ended")
         return dataframe
 
+    def _analyze_ticker_incremental(self, dataframe: DataFrame, metadata: dict) -> DataFrame | None:
+        """
+        Analyze only the candles which are new since the previous analysis of this pair,
+        using populate_indicators_incremental().
+        Entry and exit signals are populated for the new candles, based on a window of
+        startup_candle_count candles.
+        :return: Analyzed dataframe - or None if the full dataframe must be analyzed
+        """
+        pair = metadata["pair"]
+        previous = self._analyzed_df_per_pair.get(pair)
+        if (
+            previous is None
+            or previous.empty
+            or self._ft_informative
+            or self.config.get("exchange", {}).get("use_public_trades", False)
+        ):
+            return None
+        new_start = int(dataframe["date"].searchsorted(previous["date"].iloc[-1], side="right"))
+        if (
+            new_start == 0
+            or new_start == len(dataframe)
+            or len(previous) < new_start
+            # Previous candles must be unchanged
+            or dataframe["date"].iloc[0] != previous["date"].iloc[-new_start]
+            or dataframe["close"].iloc[new_start - 1] != previous["close"].iloc[-1]
+        ):
+            return None
+
+        new_candles = dataframe.iloc[new_start:].reset_index(drop=True)
+        logger.debug("Incremental TA Analysis Launched")
+        try:
+            indicators = self.populate_indicators_incremental(previous, new_candles, metadata)
+        except IncrementalStateError as e:
+            logger.warning(f"{e} Analyzing the full dataframe.")
+            return None
+        except Exception:
+            # Some indicators may have been continued already - start over with a full analysis.
+            self._analyzed_df_per_pair.pop(pair, None)
+            raise
+        if indicators is None:
+            return None
+
+        count = len(new_candles)
+        analyzed = concat([previous, indicators], ignore_index=True).iloc[-len(dataframe) :]
+        signal_columns = [s.value for s in SignalType] + [s.value for s in SignalTagType]
+        window = analyzed.iloc[-(max(self.startup_candle_count, 1) + count) :]
+        window = window.drop(columns=signal_columns, errors="ignore").reset_index(drop=True)
+        window = self.advise_entry(window, metadata)
+        window = self.advise_exit(window, metadata)
+        return concat([analyzed.iloc[:-count], window.iloc[-count:]], ignore_index=True)
+
     def _analyze_ticker_internal(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         """
         Parses the given candle (OHLCV) data and returns a populated DataFrame
@@ -1062,7 +1137,14 @@ class IStrategy(ABC, HyperStrategyMixin):
         # always run if process_only_new_candles is set to false
         if not self.process_only_new_candles or new_candle:
             # Defs that only make change on new candle data.
-            dataframe = self.analyze_ticker(dataframe, metadata)
+            analyzed = None
+            if self.incremental_analysis and self.process_only_new_candles:
+                analyzed = self._analyze_ticker_incremental(dataframe, metadata)
+            dataframe = (
+                analyzed if analyzed is not None else self.analyze_ticker(dataframe, metadata)
+            )
+            if self.incremental_analysis:
+                self._analyzed_df_per_pair[pair] = dataframe
 
             self._last_candle_seen_per_pair[pair] = dataframe.iloc[-1]["date"]
 
@@ -1108,13 +1190,50 @@ class IStrategy(ABC, HyperStrategyMixin):
             logger.warning("Empty dataframe for pair %s", pair)
             return
 
+    @contextmanager
+    def _informative_cache(self) -> Iterator[None]:
+        """
+        Populate informative pairs (@informative decorator) only once while analyzing
+        multiple pairs, instead of once per pair referencing them.
+        """
+        if self._ft_informative_cache is not None:
+            # Already active
+            yield
+            return
+        self._ft_informative_cache = {}
+        try:
+            yield
+        finally:
+            self._ft_informative_cache = None
+
     def analyze(self, pairs: list[str]) -> None:
         """
         Analyze all pairs using analyze_pair().
+        Pairs are analyzed in a thread pool if `analyze_workers` is configured.
+        Analyzed dataframes are sent to RPC in the order of pairs in both cases.
         :param pairs: List of pairs to analyze
         """
-        for pair in pairs:
-            self.analyze_pair(pair)
+        # Forget analyzed dataframes of pairs no longer analyzed (e.g. removed from whitelist)
+        for pair in self._analyzed_df_per_pair.keys() - set(pairs):
+            self._analyzed_df_per_pair.pop(pair, None)
+
+        workers = self.config.get("analyze_workers", 1)
+        if workers <= 1 or len(pairs) < 2 or self.config.get("freqai", {}).get("enabled", False):
+            with self._informative_cache():
+                for pair in pairs:
+                    self.analyze_pair(pair)
+            return
+
+        with (
+            self._informative_cache(),
+            self.dp._buffer_emitted_dfs(pairs),
+            ThreadPoolExecutor(
+                max_workers=min(workers, len(pairs)), thread_name_prefix="analyze"
+            ) as executor,
+        ):
+            # Consume results to re-raise exceptions
+            for _ in executor.map(self.analyze_pair, pairs):
+                pass
 
     @staticmethod
     def preserve_df(dataframe: DataFrame) -> tuple[int, float, datetime]:
@@ -1577,10 +1696,11 @@ class IStrategy(ABC, HyperStrategyMixin):
         Has positive effects on memory usage for whatever reason - also when
         using only one strategy.
         """
-        return {
-            pair: self.advise_indicators(pair_data.copy(), {"pair": pair}).copy()
-            for pair, pair_data in data.items()
-        }
+        with self._informative_cache():
+            return {
+                pair: self.advise_indicators(pair_data.copy(), {"pair": pair}).copy()
+                for pair, pair_data in data.items()
+            }
 
     def ft_advise_signals(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         """
@@ -39,6 +39,25 @@ def merge_informative_pair(
     :return: Merged dataframe
     :raise: ValueError if the secondary timeframe is shorter than the dataframe timeframe
     """
+    informative, date_merge = _prepare_informative_pair(
+        informative, timeframe, timeframe_inf, append_timeframe, date_column, suffix
+    )
+    return _merge_prepared_informative_pair(dataframe, informative, date_merge, ffill)
+
+
+def _prepare_informative_pair(
+    informative: pd.DataFrame,
+    timeframe: str,
+    timeframe_inf: str,
+    append_timeframe: bool,
+    date_column: str,
+    suffix: str | None,
+) -> tuple[pd.DataFrame, str]:
+    """
+    Copy informative, adding the date to merge on and renaming columns.
+    Parameters as for merge_informative_pair().
+    :return: Tuple of the prepared informative dataframe and the name of the merge date column
+    """
     informative = informative.copy()
     minutes_inf = timeframe_to_minutes(timeframe_inf)
     minutes = timeframe_to_minutes(timeframe)
@@ -79,6 +98,15 @@ def merge_informative_pair(
         date_merge = f"date_merge_{suffix}"
         informative.columns = [f"{col}_{suffix}" for col in informative.columns]
 
+    return informative, date_merge
+
+
+def _merge_prepared_informative_pair(
+    dataframe: pd.DataFrame, informative: pd.DataFrame, date_merge: str, ffill: bool
+) -> pd.DataFrame:
+    """
+    Merge an informative dataframe prepared via _prepare_informative_pair() to dataframe.
+    """
     # Combine the 2 dataframes
     # all indicators on the informative sample MUST be calculated before this point
     if ffill:
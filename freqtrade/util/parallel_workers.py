@@ -0,0 +1,79 @@
+"""
+Run per-pair functions in worker processes, forwarding their log messages to the main process.
+"""
+
+import logging
+from collections.abc import Callable
+from copy import copy
+from typing import Any, TypeVar
+
+
+T = TypeVar("T")
+
+
+class LogRecordCollector(logging.Handler):
+    """
+    Collects log records, to re-emit them later (e.g. in the main process).
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Format the message now - arguments and exceptions are not necessarily picklable.
+        record = copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            # Keep the traceback as text - handlers print exc_text if exc_info is not set.
+            if not record.exc_text:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        # stack_info is already rendered as text by the logger, and kept as is.
+        self.records.append(record)
+
+
+def _run_collecting_logs(
+    func: Callable[..., T], log_level: int, **kwargs: Any
+) -> tuple[T, list[logging.LogRecord]]:
+    """
+    Run func in a worker process.
+    :return: Result of func and the log records emitted while running it
+    """
+    root_logger = logging.getLogger()
+    root_logger.setLevel(log_level)
+    collector = LogRecordCollector()
+    root_logger.addHandler(collector)
+    try:
+        return func(**kwargs), collector.records
+    finally:
+        root_logger.removeHandler(collector)
+
+
+def run_pairs_in_workers(
+    func: Callable[..., T], pairs: list[str], workers: int, **kwargs: Any
+) -> list[T]:
+    """
+    Call func(pair=pair, **kwargs) for all pairs in worker processes.
+    Log messages of the workers are re-emitted in pair order, so output doesn't depend
+    on scheduling.
+    :param func: Module level (picklable) function to call
+    :param pairs: Pairs to call func for
+    :param workers: Number of worker processes - -1 uses all CPUs
+    :return: Results of func, in the order of pairs
+    """
+    from joblib import Parallel, delayed
+
+    log_level = logging.getLogger().getEffectiveLevel()
+    results = Parallel(n_jobs=workers, backend="loky")(
+        delayed(_run_collecting_logs)(func, log_level, pair=pair, **kwargs) for pair in pairs
+    )
+    data = []
+    for result, records in results:
+        for record in records:
+            record_logger = logging.getLogger(record.name)
+            if record_logger.isEnabledFor(record.levelno):
+                record_logger.handle(record)
+        data.append(result)
+    return data
@@ -122,6 +122,7 @@ class Worker:
                 throttle_secs=self._throttle_secs,
                 timeframe=self._config["timeframe"] if self._config else None,
                 timeframe_offset=1,
+                wait_for_candle=self.freqtrade.exchange.wait_for_candle_close,
             )
 
         if self._heartbeat_interval:
@@ -144,6 +145,7 @@ class Worker:
         throttle_secs: float,
         timeframe: str | None = None,
         timeframe_offset: float = 1.0,
+        wait_for_candle: Callable[[str, float], bool] | None = None,
         *args,
         **kwargs,
     ) -> Any:
@@ -154,6 +156,8 @@ class Worker:
         :param throttle_secs: throttling iteration execution time limit in seconds
         :param timeframe: ensure iteration is executed at the beginning of the next candle.
         :param timeframe_offset: offset in seconds to apply to the next candle time.
+        :param wait_for_candle: Callable waiting (up to timeframe_offset) for the new candle.
+            Returns False if it can't wait - in which case the full offset is slept.
         :return: Any (result of execution of func)
         """
         last_throttle_start_time = time.time()
@@ -161,6 +165,7 @@ class Worker:
         result = func(*args, **kwargs)
         time_passed = time.time() - last_throttle_start_time
         sleep_duration = throttle_secs - time_passed
+        until_candle = False
         if timeframe:
             next_tf = timeframe_to_next_date(timeframe)
             # Maximum throttling should be until new candle arrives
@@ -170,6 +175,7 @@ class Worker:
             if next_tft < sleep_duration and sleep_duration < next_tf_with_offset:
                 # Avoid hitting a new loop between the new candle and the candle with offset
                 sleep_duration = next_tf_with_offset
+            until_candle = next_tft > 0 and sleep_duration >= next_tf_with_offset
             sleep_duration = min(sleep_duration, next_tf_with_offset)
         sleep_duration = max(sleep_duration, 0.0)
         # next_iter = datetime.now(timezone.utc) + timedelta(seconds=sleep_duration)
@@ -179,6 +185,12 @@ class Worker:
             f"last iteration took {time_passed:.2f} s."
             #  f"next: {next_iter}"
         )
+        if until_candle and timeframe and wait_for_candle:
+            # Sleep until the candle closes - and start as soon as the new candle arrived.
+            self._sleep(next_tft)
+            if wait_for_candle(timeframe, timeframe_offset):
+                return result
+            sleep_duration = timeframe_offset
         self._sleep(sleep_duration)
         return result
 
@@ -15,6 +15,7 @@ from freqtrade.data.converter import (
     ohlcv_fill_up_missing_data,
     ohlcv_to_dataframe,
     reduce_dataframe_footprint,
+    trades_batches_to_ohlcv,
     trades_df_remove_duplicates,
     trades_dict_to_list,
     trades_to_ohlcv,
@@ -109,6 +110,30 @@ def test_trades_to_ohlcv_multi(timeframe, rows, days, candles, start, end, weekd
         assert df.iloc[-1, :]["date"].day_name() == weekday
 
 
+@pytest.mark.parametrize("shuffle", [False, True])
+def test_trades_batches_to_ohlcv(shuffle):
+    trades_history = generate_trades_history(n_rows=20_000, days=37)
+    trades_history = trades_history.sort_values("timestamp").reset_index(drop=True)
+    timeframes = ["1m", "5m", "1h", "1d", "1w", "1M"]
+    batches = [trades_history.iloc[i : i + 3_000] for i in range(0, len(trades_history), 3_000)]
+    if shuffle:
+        # Batches out of order
+        batches = batches[::-1]
+        expected_trades = pd.concat(batches)
+    else:
+        expected_trades = trades_history
+
+    result = trades_batches_to_ohlcv(batches, timeframes)
+    assert list(result) == timeframes
+    for timeframe in timeframes:
+        expected = trades_to_ohlcv(expected_trades, timeframe)
+        if shuffle:
+            expected = expected.sort_index()
+        assert_frame_equal(result[timeframe], expected, check_freq=False)
+
+    assert trades_batches_to_ohlcv([trades_history.iloc[0:0]], timeframes) == {}
+
+
 def test_ohlcv_fill_up_missing_data(testdatadir, caplog):
     data = load_pair_history(
         datadir=testdatadir, timeframe="1m", pair="UNITTEST/BTC", fill_up_missing=False
@@ -542,7 +567,8 @@ def test_reduce_dataframe_footprint():
     assert df2["close_copy"].dtype == np.float32
 
 
-def test_convert_trades_to_ohlcv(testdatadir, tmp_path, caplog):
+@pytest.mark.parametrize("workers", [1, 2])
+def test_convert_trades_to_ohlcv(testdatadir, tmp_path, caplog, workers):
     pair = "XRP/ETH"
     file1 = tmp_path / "XRP_ETH-1m.feather"
     file5 = tmp_path / "XRP_ETH-5m.feather"
@@ -566,6 +592,7 @@ def test_convert_trades_to_ohlcv(testdatadir, tmp_path, caplog):
         erase=True,
         data_format_ohlcv="feather",
         candle_type=CandleType.SPOT,
+        workers=workers,
     )
 
     assert log_has("Deleting existing data for pair XRP/ETH, interval 1m.", caplog)
@@ -579,7 +606,7 @@ def test_convert_trades_to_ohlcv(testdatadir, tmp_path, caplog):
     assert not log_has(msg, caplog)
 
     convert_trades_to_ohlcv(
-        ["NoDatapair"],
+        ["NoDatapair", pair],
         timeframes=["1m", "5m"],
         data_format_trades="jsongz",
         datadir=tmp_path,
@@ -587,5 +614,6 @@ def test_convert_trades_to_ohlcv(testdatadir, tmp_path, caplog):
         erase=True,
         data_format_ohlcv="feather",
         candle_type=CandleType.SPOT,
+        workers=workers,
     )
     assert log_has(msg, caplog)
@@ -6,7 +6,10 @@ from freqtrade.constants import DEFAULT_TRADES_COLUMNS
 from freqtrade.data.converter import populate_dataframe_with_trades
 from freqtrade.data.converter.orderflow import (
     ORDERFLOW_ADDED_COLUMNS,
+    stacked_imbalance_ask,
+    stacked_imbalance_bid,
     timeframe_to_DateOffset,
+    trades_orderflow_to_imbalances,
     trades_to_volumeprofile_with_total_delta_bid_ask,
 )
 from freqtrade.data.converter.trade_converter import trades_list_to_df
@@ -104,6 +107,7 @@ def test_public_trades_mock_populate_dataframe_with_trades__check_orderflow(
             "imbalance_volume": 0,
             "imbalance_ratio": 3,
             "stacked_imbalance_range": 3,
+            "include_details": True,
         },
     }
     # Apply the function to populate the data frame with order flow data
@@ -244,6 +248,7 @@ def test_public_trades_trades_mock_populate_dataframe_with_trades__check_trades(
             "imbalance_volume": 0,
             "imbalance_ratio": 3,
             "stacked_imbalance_range": 3,
+            "include_details": True,
         },
     }
 
@@ -277,8 +282,8 @@ def test_public_trades_trades_mock_populate_dataframe_with_trades__check_trades(
     ]
     # Assert delta, bid, and ask values
     assert pytest.approx(row["delta"]) == -50.519
-    assert row["bid"] == 219.961
-    assert row["ask"] == 169.442
+    assert pytest.approx(row["bid"]) == 219.961
+    assert pytest.approx(row["ask"]) == 169.442
 
     # Assert the number of trades
     assert len(row["trades"]) == 151
@@ -501,7 +506,7 @@ def test_analyze_with_orderflow(
     mocker.patch.object(strategy.dp, "trades", return_value=populate_dataframe_with_trades_trades)
     import freqtrade.data.converter.orderflow as orderflow_module
 
-    spy = mocker.spy(orderflow_module, "trades_to_volumeprofile_with_total_delta_bid_ask")
+    spy = mocker.spy(orderflow_module, "_calculate_orderflow_columns")
 
     pair = "ETH/BTC"
     df = strategy.advise_indicators(ohlcv_history, {"pair:": pair})
@@ -521,6 +526,7 @@ def test_analyze_with_orderflow(
         "imbalance_volume": 0,
         "imbalance_ratio": 3,
         "stacked_imbalance_range": 3,
+        "include_details": True,
     }
 
     strategy.config = default_conf_usdt
@@ -528,7 +534,8 @@ def test_analyze_with_orderflow(
     df1 = strategy.advise_indicators(ohlcv_history, {"pair": pair})
     assert len(df1) == len(ohlcv_history)
     assert "open" in df1.columns
-    assert spy.call_count == 5
+    # All candles are calculated at once
+    assert spy.call_count == 1
 
     for col in ORDERFLOW_ADDED_COLUMNS:
         assert col in df1.columns, f"Column {col} not found in df.columns"
@@ -567,6 +574,64 @@ def test_analyze_with_orderflow(
     assert isinstance(lastval_of2, dict)
 
 
+@pytest.mark.parametrize("stacked_imbalance_range", [0, 2])
+def test_populate_dataframe_with_trades_per_candle_parity(stacked_imbalance_range):
+    rng = np.random.default_rng(42)
+    start = pd.Timestamp("2024-01-01", tz="UTC")
+    timestamps = np.sort(rng.integers(0, 50 * 300_000, 5000)) + start.value // 1_000_000
+    prices = 100 + np.cumsum(rng.normal(0, 0.05, len(timestamps)))
+    trades = trades_list_to_df(
+        [
+            [int(ts), str(i), None, rng.choice(["buy", "sell"]), price, amount, price * amount]
+            for i, (ts, price, amount) in enumerate(
+                zip(timestamps, prices, rng.exponential(2, len(timestamps)), strict=True)
+            )
+        ]
+    )
+    # Leave out a few candles - trades of these candles are ignored
+    dates = pd.date_range(start, periods=50, freq="5min")
+    dataframe = pd.DataFrame({"date": dates.delete([3, 20])})
+    orderflow_config = {
+        "cache_size": 1000,
+        "max_candles": 1500,
+        "scale": 0.05,
+        "imbalance_volume": 1,
+        "imbalance_ratio": 2,
+        "stacked_imbalance_range": stacked_imbalance_range,
+    }
+    config = {"timeframe": "5m", "orderflow": orderflow_config}
+
+    df, _ = populate_dataframe_with_trades(None, config, dataframe.copy(), trades.copy())
+    for col in ("trades", "orderflow", "imbalances"):
+        assert df[col].isna().all()
+
+    orderflow_config["include_details"] = True
+    df, _ = populate_dataframe_with_trades(None, config, dataframe.copy(), trades.copy())
+    trades["candle_start"] = trades["date"].dt.floor("5min")
+    for row in df.itertuples():
+        candle_trades = trades[trades["candle_start"] == row.date].reset_index(drop=True)
+        orderflow = trades_to_volumeprofile_with_total_delta_bid_ask(candle_trades, scale=0.05)
+        imbalances = trades_orderflow_to_imbalances(orderflow, 2, 1)
+        bid = np.where(candle_trades["side"] == "sell", candle_trades["amount"], 0)
+        ask = np.where(candle_trades["side"] == "buy", candle_trades["amount"], 0)
+
+        assert len(row.trades) == len(candle_trades)
+        assert row.orderflow == orderflow.to_dict(orient="index")
+        assert row.imbalances == imbalances.to_dict(orient="index")
+        assert row.total_trades == len(candle_trades)
+        assert pytest.approx(row.bid) == bid.sum()
+        assert pytest.approx(row.ask) == ask.sum()
+        assert pytest.approx(row.delta) == ask.sum() - bid.sum()
+        assert pytest.approx(row.max_delta) == (ask - bid).cumsum().max()
+        assert pytest.approx(row.min_delta) == (ask - bid).cumsum().min()
+        assert row.stacked_imbalances_bid == pytest.approx(
+            stacked_imbalance_bid(imbalances, stacked_imbalance_range), nan_ok=True
+        )
+        assert row.stacked_imbalances_ask == pytest.approx(
+            stacked_imbalance_ask(imbalances, stacked_imbalance_range), nan_ok=True
+        )
+
+
 def test_timeframe_to_DateOffset():
     assert timeframe_to_DateOffset("1s") == pd.DateOffset(seconds=1)
     assert timeframe_to_DateOffset("1m") == pd.DateOffset(minutes=1)
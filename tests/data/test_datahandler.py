@@ -5,12 +5,15 @@ from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import pyarrow as pa
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
 import pytest
-from pandas import DataFrame, Timestamp
+from pandas import DataFrame, Timestamp, concat
 from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration import TimeRange
-from freqtrade.constants import AVAILABLE_DATAHANDLERS
+from freqtrade.constants import AVAILABLE_DATAHANDLERS, DEFAULT_TRADES_COLUMNS
 from freqtrade.data.history.datahandlers.featherdatahandler import FeatherDataHandler
 from freqtrade.data.history.datahandlers.hdf5datahandler import HDF5DataHandler
 from freqtrade.data.history.datahandlers.idatahandler import (
@@ -298,8 +301,8 @@ def test_jsondatahandler_trades_load(testdatadir, caplog):
     assert log_has(logmsg, caplog)
 
 
-@pytest.mark.parametrize("datahandler", AVAILABLE_DATAHANDLERS)
-def test_datahandler_ohlcv_append(
+@pytest.mark.parametrize("datahandler", ["json", "jsongz", "parquet"])
+def test_datahandler_ohlcv_append_not_supported(
     datahandler,
     testdatadir,
 ):
@@ -310,6 +313,69 @@ def test_datahandler_ohlcv_append(
         dh.ohlcv_append("UNITTEST/ETH", "5m", DataFrame(), CandleType.MARK)
 
 
+@pytest.mark.parametrize("candle_type", [CandleType.SPOT, CandleType.MARK])
+@pytest.mark.parametrize("datahandler", ["hdf5", "feather"])
+def test_datahandler_ohlcv_append(datahandler, testdatadir, tmp_path, candle_type):
+    ohlcv = get_datahandler(testdatadir, "feather")._ohlcv_load(
+        "UNITTEST/BTC", "5m", None, candle_type=CandleType.SPOT
+    )
+    dh = get_datahandler(tmp_path, datahandler)
+    dh.ohlcv_append("UNITTEST/NEW", "5m", ohlcv.iloc[:1000], candle_type)
+    # Overlapping candles are replaced
+    changed = ohlcv.iloc[990:2000].copy()
+    changed.loc[changed.index[0], "close"] = 42.0
+    dh.ohlcv_append("UNITTEST/NEW", "5m", changed, candle_type)
+    dh.ohlcv_append("UNITTEST/NEW", "5m", ohlcv.iloc[1999:], candle_type)
+    dh.ohlcv_append("UNITTEST/NEW", "5m", DataFrame(), candle_type)
+
+    expected = ohlcv.copy()
+    expected.loc[990, "close"] = 42.0
+    loaded = dh._ohlcv_load("UNITTEST/NEW", "5m", None, candle_type=candle_type)
+    assert_frame_equal(loaded, expected, check_index_type=False)
+
+    timerange = TimeRange.parse_timerange("20180112-20180120")
+    loaded = dh.ohlcv_load("UNITTEST/NEW", "5m", timerange=timerange, candle_type=candle_type)
+    assert loaded.iloc[0]["date"] == Timestamp("2018-01-12", tz="UTC")
+    assert loaded.iloc[-1]["date"] == Timestamp("2018-01-20", tz="UTC")
+    assert len(loaded) == 8 * 288 + 1
+
+    if datahandler == "feather":
+        filename = dh._pair_data_filename(tmp_path, "UNITTEST/NEW", "5m", candle_type)
+        assert len(dh._ohlcv_segments(filename)) == 2
+        # Storing the full data removes the segments
+        dh.ohlcv_store("UNITTEST/NEW", "5m", loaded, candle_type)
+        assert dh._ohlcv_segments(filename) == []
+
+        dh.ohlcv_append("UNITTEST/NEW", "5m", ohlcv.iloc[-10:], candle_type)
+        assert len(dh._ohlcv_segments(filename)) == 1
+        assert dh.ohlcv_purge("UNITTEST/NEW", "5m", candle_type)
+        assert dh._ohlcv_segments(filename) == []
+        assert not filename.exists()
+
+
+def test_featherdatahandler_ohlcv_append_merge(mocker, testdatadir, tmp_path):
+    mocker.patch("freqtrade.data.history.datahandlers.featherdatahandler.MAX_APPEND_SEGMENTS", 2)
+    ohlcv = get_datahandler(testdatadir, "feather")._ohlcv_load(
+        "UNITTEST/BTC", "5m", None, candle_type=CandleType.SPOT
+    )
+    dh = get_datahandler(tmp_path, "feather")
+    filename = dh._pair_data_filename(tmp_path, "UNITTEST/NEW", "5m", CandleType.SPOT)
+    for start in range(0, 500, 100):
+        dh.ohlcv_append("UNITTEST/NEW", "5m", ohlcv.iloc[start : start + 100], CandleType.SPOT)
+        assert len(dh._ohlcv_segments(filename)) <= 2
+
+    loaded = dh._ohlcv_load("UNITTEST/NEW", "5m", None, candle_type=CandleType.SPOT)
+    assert_frame_equal(loaded, ohlcv.iloc[:500])
+
+    # Segments move with the main file
+    new_file = dh._pair_data_filename(tmp_path, "UNITTEST/NEW2", "5m", CandleType.SPOT)
+    dh._ohlcv_rename(filename, new_file)
+    assert not filename.exists()
+    assert dh._ohlcv_segments(filename) == []
+    loaded = dh._ohlcv_load("UNITTEST/NEW2", "5m", None, candle_type=CandleType.SPOT)
+    assert_frame_equal(loaded, ohlcv.iloc[:500])
+
+
 @pytest.mark.parametrize("datahandler", AVAILABLE_DATAHANDLERS)
 def test_datahandler_trades_append(datahandler, testdatadir):
     dh = get_datahandler(testdatadir, datahandler)
@@ -494,6 +560,44 @@ def test_generic_datahandler_ohlcv_load_and_resave(
     assert log_has_re("Error loading data from", caplog)
 
 
+@pytest.mark.parametrize("datahandler", ["feather", "parquet"])
+def test_datahandler_ohlcv_load_timerange_chunked(datahandler, testdatadir, tmp_path):
+    ohlcv = get_datahandler(testdatadir, "feather")._ohlcv_load(
+        "UNITTEST/BTC", "5m", None, candle_type=CandleType.SPOT
+    )
+    dh = get_datahandler(tmp_path, datahandler)
+    file = dh._pair_data_filename(tmp_path, "UNITTEST/NEW", "5m", CandleType.SPOT)
+    # Write small record batches / row groups, so only parts of the file are read.
+    if datahandler == "feather":
+        ohlcv.to_feather(file, chunksize=100)
+    else:
+        ohlcv.to_parquet(file, row_group_size=100)
+
+    timerange = TimeRange.parse_timerange("20180112-20180113")
+    start = Timestamp(timerange.startts, unit="s", tz="UTC")
+    stop = Timestamp(timerange.stopts, unit="s", tz="UTC")
+
+    loaded = dh._ohlcv_load("UNITTEST/NEW", "5m", timerange, candle_type=CandleType.SPOT)
+    expected = ohlcv[ohlcv["date"] >= start].reset_index(drop=True)
+    # Rows within the timerange - and the first row after it.
+    expected = expected.iloc[: len(expected[expected["date"] <= stop]) + 1]
+    assert_frame_equal(loaded, expected, check_dtype=False)
+
+    loaded = dh.ohlcv_load("UNITTEST/NEW", "5m", timerange=timerange, candle_type=CandleType.SPOT)
+    full = dh.ohlcv_load("UNITTEST/NEW", "5m", timerange=None, candle_type=CandleType.SPOT)
+    full = full[(full["date"] >= start) & (full["date"] <= stop)].reset_index(drop=True)
+    assert_frame_equal(loaded, full)
+
+    # Unsorted data falls back to loading the whole file
+    shuffled = ohlcv.sample(frac=1, random_state=42).reset_index(drop=True)
+    if datahandler == "feather":
+        shuffled.to_feather(file, chunksize=100)
+    else:
+        shuffled.to_parquet(file, row_group_size=100)
+    loaded = dh._ohlcv_load("UNITTEST/NEW", "5m", timerange, candle_type=CandleType.SPOT)
+    assert len(loaded) == len(ohlcv)
+
+
 def test_hdf5datahandler_ohlcv_purge(mocker, testdatadir):
     mocker.patch.object(Path, "exists", MagicMock(return_value=False))
     unlinkmock = mocker.patch.object(Path, "unlink", MagicMock())
@@ -522,6 +626,34 @@ def test_datahandler_trades_load(testdatadir, datahandler):
     assert trades1.empty
 
 
+@pytest.mark.parametrize("datahandler", ["jsongz", "hdf5", "feather", "parquet"])
+def test_datahandler_trades_load_batches(testdatadir, tmp_path, datahandler):
+    dh = get_datahandler(testdatadir, datahandler)
+    trades = dh.trades_load("XRP/ETH", TradingMode.SPOT)
+    # Duplicate trades, split by the batch boundary
+    stored = concat([trades, trades.iloc[4995:5006]]).sort_values("timestamp", kind="stable")
+    stored = stored[DEFAULT_TRADES_COLUMNS].reset_index(drop=True)
+
+    dh1 = get_datahandler(tmp_path, datahandler)
+    file = tmp_path / f"XRP_NEW-trades.{dh1._get_file_extension()}"
+    if datahandler == "feather":
+        # Multiple record batches
+        stored.to_feather(file, chunksize=1000)
+    else:
+        dh1.trades_store("XRP/NEW", stored, TradingMode.SPOT)
+
+    batches = list(dh1.trades_load_batches("XRP/NEW", TradingMode.SPOT, batch_size=5000))
+    assert len(batches) == (1 if datahandler == "jsongz" else 3)
+    assert_frame_equal(
+        concat(batches, ignore_index=True),
+        dh1.trades_load("XRP/NEW", TradingMode.SPOT).reset_index(drop=True),
+        check_exact=True,
+    )
+    assert len(concat(batches)) == len(trades)
+
+    assert list(dh1.trades_load_batches("UNITTEST/NONEXIST", TradingMode.SPOT)) == []
+
+
 @pytest.mark.parametrize("datahandler", ["jsongz", "hdf5", "feather", "parquet"])
 def test_datahandler_trades_store(testdatadir, tmp_path, datahandler):
     dh = get_datahandler(testdatadir, datahandler)
@@ -538,6 +670,53 @@ def test_datahandler_trades_store(testdatadir, tmp_path, datahandler):
     assert len(trades_new) == len(trades)
 
 
+@pytest.mark.parametrize("datahandler", ["jsongz", "hdf5", "feather", "parquet"])
+@pytest.mark.parametrize("legacy", [False, True])
+def test_datahandler_trades_load_timerange(testdatadir, tmp_path, datahandler, legacy):
+    dh = get_datahandler(testdatadir, datahandler)
+    trades = dh.trades_load("XRP/ETH", TradingMode.SPOT)
+    # data goes from 2019-10-11 - 2019-10-13
+    days = trades["date"].dt.floor("D").nunique()
+    assert days == 3
+
+    dh1 = get_datahandler(tmp_path, datahandler)
+    file = tmp_path / f"XRP_NEW-trades.{dh1._get_file_extension()}"
+    if legacy and datahandler in ("feather", "parquet"):
+        # Files written before trades were partitioned
+        getattr(trades[DEFAULT_TRADES_COLUMNS], f"to_{datahandler}")(file)
+    else:
+        dh1.trades_store("XRP/NEW", trades, TradingMode.SPOT)
+        if datahandler == "feather":
+            # One record batch per day
+            with pa.memory_map(str(file)) as source:
+                assert ipc.open_file(source).num_record_batches == days
+        if datahandler == "parquet":
+            # One row group per day
+            assert pq.ParquetFile(file).metadata.num_row_groups == days
+
+    for timerange in [
+        TimeRange.parse_timerange("20191012-20191013"),
+        TimeRange.parse_timerange("20191012-"),
+        TimeRange.parse_timerange("-20191012"),
+        TimeRange.parse_timerange("1570870000-1570880000"),
+        TimeRange.parse_timerange("20191020-"),
+    ]:
+        expected = trades
+        if timerange.starttype == "date":
+            expected = expected[expected["timestamp"] >= timerange.startts * 1000]
+        if timerange.stoptype == "date":
+            expected = expected[expected["timestamp"] < timerange.stopts * 1000]
+
+        result = dh1.trades_load("XRP/NEW", TradingMode.SPOT, timerange=timerange)
+        assert_frame_equal(
+            result.reset_index(drop=True), expected.reset_index(drop=True), check_exact=True
+        )
+        if not legacy and datahandler in ("feather", "parquet"):
+            # Only partitions overlapping the timerange are read
+            partial = dh1._trades_load("XRP/NEW", TradingMode.SPOT, timerange=timerange)
+            assert len(partial) < len(trades)
+
+
 @pytest.mark.parametrize("datahandler", ["jsongz", "hdf5", "feather", "parquet"])
 def test_datahandler_trades_purge(mocker, testdatadir, datahandler):
     mocker.patch.object(Path, "exists", MagicMock(return_value=False))
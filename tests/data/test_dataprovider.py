@@ -1,3 +1,4 @@
+from copy import deepcopy
 from datetime import datetime, timezone
 from unittest.mock import MagicMock
 
@@ -5,7 +6,7 @@ import pytest
 from pandas import DataFrame, Timestamp
 
 from freqtrade.data.dataprovider import DataProvider
-from freqtrade.enums import CandleType, RunMode
+from freqtrade.enums import CandleType, RPCMessageType, RunMode
 from freqtrade.exceptions import ExchangeError, OperationalException
 from freqtrade.plugins.pairlistmanager import PairListManager
 from tests.conftest import EXMS, generate_test_data, get_patched_exchange
@@ -89,6 +90,16 @@ def test_historic_trades(mocker, default_conf, trades_history_df):
     data = dp.trades("UNITTEST/BTC", "5m")
     assert isinstance(data, DataFrame)
     assert len(data) == len(trades_history_df)
+    assert historymock.call_args[1]["timerange"].starttype is None
+
+    # Only trades within the backtest timerange (including startup candles) are loaded
+    default_conf["timerange"] = "20191011-20191012"
+    default_conf["startup_candle_count"] = 10
+    dp = DataProvider(default_conf, exchange)
+    dp.trades("UNITTEST/BTC", "5m")
+    timerange = historymock.call_args[1]["timerange"]
+    assert timerange.startts == 1570752000 - 10 * 300
+    assert timerange.stopts == 1570838400
 
 
 def test_historic_ohlcv_dataformat(mocker, default_conf, ohlcv_history):
@@ -275,6 +286,41 @@ def test_emit_df(mocker, default_conf, ohlcv_history):
     assert send_mock.call_count == 0
 
 
+def test_buffer_emitted_dfs(default_conf, ohlcv_history):
+    rpc_mock = MagicMock()
+    dataprovider = DataProvider(default_conf, exchange=None, rpc=rpc_mock)
+    pairs = ["ETH/USDT", "BTC/USDT"]
+
+    with dataprovider._buffer_emitted_dfs(pairs):
+        dataprovider._emit_df(("BTC/USDT", "5m", CandleType.SPOT), ohlcv_history, True)
+        dataprovider._emit_df(("ETH/USDT", "5m", CandleType.SPOT), ohlcv_history, False)
+        assert rpc_mock.send_msg.call_count == 0
+
+    sent = [call.args[0] for call in rpc_mock.send_msg.call_args_list]
+    assert [msg["type"] for msg in sent] == [
+        RPCMessageType.ANALYZED_DF,
+        RPCMessageType.ANALYZED_DF,
+        RPCMessageType.NEW_CANDLE,
+    ]
+    assert sent[0]["data"]["key"][0] == "ETH/USDT"
+    assert sent[1]["data"]["key"][0] == "BTC/USDT"
+
+    # Not buffered anymore
+    dataprovider._emit_df(("ETH/USDT", "5m", CandleType.SPOT), ohlcv_history, False)
+    assert rpc_mock.send_msg.call_count == 4
+
+
+def test_dataprovider_pickle(default_conf, ohlcv_history):
+    dataprovider = DataProvider(default_conf, exchange=None)
+    dataprovider._set_cached_df("ETH/USDT", "5m", ohlcv_history, CandleType.SPOT)
+
+    # Same as pickling - used to send the dataprovider to hyperopt workers
+    restored = deepcopy(dataprovider)
+    df, _ = restored.get_analyzed_dataframe("ETH/USDT", "5m")
+    assert len(df) == len(ohlcv_history)
+    restored._set_cached_df("XRP/USDT", "5m", ohlcv_history, CandleType.SPOT)
+
+
 def test_refresh(mocker, default_conf):
     refresh_mock = mocker.patch(f"{EXMS}.refresh_latest_ohlcv")
     mock_refresh_trades = mocker.patch(f"{EXMS}.refresh_latest_trades")
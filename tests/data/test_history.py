@@ -1,7 +1,9 @@
 # pragma pylint: disable=missing-docstring, protected-access, C0103
 
+import asyncio
 import json
 import logging
+import threading
 import uuid
 from datetime import timedelta
 from pathlib import Path
@@ -15,7 +17,7 @@ from pandas.testing import assert_frame_equal
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import DATETIME_PRINT_FORMAT
 from freqtrade.data.converter import ohlcv_to_dataframe
-from freqtrade.data.history import get_datahandler
+from freqtrade.data.history import get_datahandler, history_utils
 from freqtrade.data.history.datahandlers.jsondatahandler import JsonDataHandler, JsonGzDataHandler
 from freqtrade.data.history.history_utils import (
     _download_pair_history,
@@ -37,6 +39,7 @@ from freqtrade.util import dt_ts, dt_utc
 from tests.conftest import (
     CURRENT_TEST_STRATEGY,
     EXMS,
+    generate_test_data,
     get_patched_exchange,
     log_has,
     log_has_re,
@@ -357,6 +360,10 @@ def test_download_pair_history2(mocker, default_conf, testdatadir, ohlcv_history
         "freqtrade.data.history.datahandlers.featherdatahandler.FeatherDataHandler.ohlcv_store",
         return_value=None,
     )
+    append_mock = mocker.patch(
+        "freqtrade.data.history.datahandlers.featherdatahandler.FeatherDataHandler.ohlcv_append",
+        return_value=None,
+    )
     exchange = get_patched_exchange(mocker, default_conf)
     mocker.patch.object(exchange, "get_historic_ohlcv", return_value=ohlcv_history)
     _download_pair_history(
@@ -380,7 +387,43 @@ def test_download_pair_history2(mocker, default_conf, testdatadir, ohlcv_history
         timeframe="1h",
         candle_type="mark",
     )
-    assert json_dump_mock.call_count == 3
+    # Existing data is appended to
+    assert append_mock.call_count == 1
+    assert json_dump_mock.call_count == 2
+
+
+@pytest.mark.parametrize("datahandler", ["feather", "hdf5", "json"])
+def test_download_pair_history_append(mocker, default_conf, tmp_path, datahandler) -> None:
+    exchange = get_patched_exchange(mocker, default_conf)
+    ohlcv = generate_test_data("5m", 300, "2024-01-01 00:00:00+00:00")
+    dh = get_datahandler(tmp_path, datahandler)
+    mocker.patch.object(exchange, "get_historic_ohlcv", return_value=ohlcv.iloc[:200])
+    assert _download_pair_history(
+        datadir=tmp_path,
+        exchange=exchange,
+        pair="UNITTEST/BTC",
+        timeframe="5m",
+        candle_type="spot",
+        data_handler=dh,
+    )
+    store_mock = mocker.spy(dh, "ohlcv_store")
+    append_mock = mocker.spy(dh, "ohlcv_append")
+    # Downloads restart at the last stored candle
+    mocker.patch.object(exchange, "get_historic_ohlcv", return_value=ohlcv.iloc[199:])
+    assert _download_pair_history(
+        datadir=tmp_path,
+        exchange=exchange,
+        pair="UNITTEST/BTC",
+        timeframe="5m",
+        candle_type="spot",
+        data_handler=dh,
+    )
+    assert append_mock.call_count == 1
+    # json doesn't support appending - the full data is rewritten
+    assert store_mock.call_count == (1 if datahandler == "json" else 0)
+
+    loaded = dh.ohlcv_load("UNITTEST/BTC", "5m", candle_type="spot", drop_incomplete=False)
+    assert_frame_equal(loaded, ohlcv, check_dtype=False)
 
 
 def test_download_backtesting_data_exception(mocker, caplog, default_conf, tmp_path) -> None:
@@ -435,6 +478,45 @@ def test_load_partial_missing(testdatadir, caplog) -> None:
     )
 
 
+def test_load_data_parallel(testdatadir, caplog) -> None:
+    caplog.set_level(logging.INFO)
+    pairs = ["UNITTEST/BTC", "ETH/BTC", "XRP/ETH", "NOPAIR/XXX"]
+    timerange = TimeRange.parse_timerange("20180101-20180115")
+
+    def handler_messages():
+        return [r.getMessage() for r in caplog.records if r.name.endswith("idatahandler")]
+
+    data = load_data(testdatadir, "5m", pairs, timerange=timerange, startup_candles=20)
+    messages = handler_messages()
+    assert len(messages) == 5
+    caplog.clear()
+
+    data_parallel = load_data(
+        testdatadir, "5m", pairs, timerange=timerange, startup_candles=20, workers=2
+    )
+    assert log_has("Loading data for 4 pairs using 2 workers.", caplog)
+    assert list(data_parallel) == list(data)
+    for pair in data:
+        assert_frame_equal(data_parallel[pair], data[pair])
+    # Worker log messages are re-emitted in pair order
+    assert handler_messages() == messages
+
+
+def test_load_data_parallel_exception(testdatadir, tmp_path, caplog) -> None:
+    caplog.set_level(logging.INFO)
+    copyfile(testdatadir / "UNITTEST_BTC-5m.feather", tmp_path / "UNITTEST_BTC-5m.feather")
+    (tmp_path / "ETH_BTC-5m.feather").write_text("not a feather file")
+
+    data = load_data(tmp_path, "5m", ["UNITTEST/BTC", "ETH/BTC"], workers=2)
+    assert list(data) == ["UNITTEST/BTC"]
+    records = [r for r in caplog.records if r.getMessage().startswith("Error loading data")]
+    assert len(records) == 1
+    # The traceback of the worker is re-emitted alongside the message
+    assert records[0].exc_text
+    assert "Traceback (most recent call last)" in records[0].exc_text
+    assert "Traceback (most recent call last)" in caplog.text
+
+
 def test_init(default_conf) -> None:
     assert {} == load_data(datadir=Path(), pairs=[], timeframe=default_conf["timeframe"])
 
@@ -540,7 +622,7 @@ def test_validate_backtest_data(default_conf, mocker, caplog, testdatadir) -> No
     ],
 )
 def test_refresh_backtest_ohlcv_data(
-    mocker, default_conf, markets, caplog, testdatadir, trademode, callcount
+    mocker, default_conf, markets, caplog, tmp_path, trademode, callcount
 ):
     caplog.set_level(logging.DEBUG)
     dl_mock = mocker.patch("freqtrade.data.history.history_utils._download_pair_history")
@@ -556,7 +638,7 @@ def test_refresh_backtest_ohlcv_data(
         exchange=ex,
         pairs=["ETH/BTC", "XRP/BTC"],
         timeframes=["1m", "5m"],
-        datadir=testdatadir,
+        datadir=tmp_path,
         timerange=timerange,
         erase=True,
         trading_mode=trademode,
@@ -571,6 +653,150 @@ def test_refresh_backtest_ohlcv_data(
         assert log_has_re(r"Downloading pair ETH/BTC, mark, interval 4h\.", caplog)
 
 
+def test_refresh_backtest_ohlcv_data_resume(mocker, default_conf, markets, tmp_path, time_machine):
+    time_machine.move_to("2024-01-01 00:00:00 +00:00", tick=False)
+    interrupt = {("XRP/BTC", "1m")}
+    failing = {("ETH/BTC", "5m")}
+
+    def download(pair, timeframe, **kwargs):
+        if (pair, timeframe) in interrupt:
+            raise KeyboardInterrupt()
+        return (pair, timeframe) not in failing
+
+    dl_mock = mocker.patch(
+        "freqtrade.data.history.history_utils._download_pair_history", side_effect=download
+    )
+    mocker.patch(f"{EXMS}.markets", PropertyMock(return_value=markets))
+    ex = get_patched_exchange(mocker, default_conf, exchange="bybit")
+    manifest_file = tmp_path / ".download_manifest.json"
+    kwargs = {
+        "exchange": ex,
+        "pairs": ["ETH/BTC", "XRP/BTC"],
+        "timeframes": ["1m", "5m"],
+        "datadir": tmp_path,
+        "timerange": TimeRange.parse_timerange("20190101-"),
+        "trading_mode": "spot",
+    }
+    with pytest.raises(KeyboardInterrupt):
+        refresh_backtest_ohlcv_data(**kwargs)
+    assert dl_mock.call_count == 3
+    assert manifest_file.is_file()
+
+    # Interrupted run resumes - skipping completed downloads only
+    dl_mock.reset_mock()
+    interrupt.clear()
+    time_machine.move_to("2024-01-01 01:00:00 +00:00", tick=False)
+    refresh_backtest_ohlcv_data(**kwargs)
+    assert [(c[1]["pair"], c[1]["timeframe"]) for c in dl_mock.call_args_list] == [
+        ("ETH/BTC", "5m"),
+        ("XRP/BTC", "1m"),
+        ("XRP/BTC", "5m"),
+    ]
+    # Run finished - even though a download failed
+    assert not manifest_file.exists()
+
+    # A later run updates all pairs again
+    dl_mock.reset_mock()
+    refresh_backtest_ohlcv_data(**kwargs)
+    assert dl_mock.call_count == 4
+
+    # Outdated manifests are ignored
+    interrupt.add(("XRP/BTC", "5m"))
+    with pytest.raises(KeyboardInterrupt):
+        refresh_backtest_ohlcv_data(**kwargs)
+    assert manifest_file.is_file()
+    dl_mock.reset_mock()
+    interrupt.clear()
+    time_machine.move_to("2024-01-01 08:00:00 +00:00", tick=False)
+    refresh_backtest_ohlcv_data(**kwargs)
+    assert dl_mock.call_count == 4
+
+    # Different parameters start from scratch
+    interrupt.add(("XRP/BTC", "5m"))
+    with pytest.raises(KeyboardInterrupt):
+        refresh_backtest_ohlcv_data(**kwargs)
+    dl_mock.reset_mock()
+    interrupt.clear()
+    refresh_backtest_ohlcv_data(**(kwargs | {"erase": True}))
+    assert dl_mock.call_count == 4
+
+
+@pytest.mark.parametrize("data_format", ["feather", "json"])
+def test_refresh_backtest_ohlcv_data_concurrent(
+    mocker, default_conf, markets, tmp_path, data_format
+):
+    tf_ms = {"5m": 300_000, "1h": 3_600_000}
+    start = dt_ts(dt_utc(2024, 1, 1))
+    end = dt_ts(dt_utc(2024, 1, 8))
+    running: dict[tuple[str, str], int] = {}
+    max_running = 0
+
+    async def fetch_ohlcv(pair, timeframe, since=None, limit=None, params=None):
+        # Stand-in for the exchange - serves candles from start to end
+        nonlocal max_running
+        running[(pair, timeframe)] = running.get((pair, timeframe), 0) + 1
+        max_running = max(max_running, len(running))
+        await asyncio.sleep(0.02)
+        running[(pair, timeframe)] -= 1
+        if not running[(pair, timeframe)]:
+            del running[(pair, timeframe)]
+        first = max(since, start)
+        stop = min(since + limit * tf_ms[timeframe], end)
+        return [[ts, 1.0, 2.0, 0.5, 1.5, 10.0] for ts in range(first, stop, tf_ms[timeframe])]
+
+    mocker.patch(f"{EXMS}.markets", PropertyMock(return_value=markets))
+    default_conf["dataformat_ohlcv"] = data_format
+    ex = get_patched_exchange(mocker, default_conf, exchange="bybit")
+    ex._api_async.fetch_ohlcv = fetch_ohlcv
+    ex._api_async.has = {"fetchOHLCV": True}
+    dhc = get_datahandler(tmp_path, data_format)
+    # Existing data is extended
+    dhc.ohlcv_store(
+        "ETH/BTC",
+        "5m",
+        ohlcv_to_dataframe(
+            [[ts, 1.0, 2.0, 0.5, 1.5, 10.0] for ts in range(start, start + 86_400_000, 300_000)],
+            "5m",
+            "ETH/BTC",
+            fill_missing=False,
+            drop_incomplete=False,
+        ),
+        CandleType.SPOT,
+    )
+    store_threads = set()
+    store_pair_download = history_utils._store_pair_download
+
+    def store(*args, **kwargs):
+        store_threads.add(threading.current_thread())
+        return store_pair_download(*args, **kwargs)
+
+    mocker.patch("freqtrade.data.history.history_utils._store_pair_download", side_effect=store)
+    pairs = ["ETH/BTC", "XRP/BTC", "LTC/BTC"]
+    unavailable = refresh_backtest_ohlcv_data(
+        exchange=ex,
+        pairs=pairs + ["NOPE/BTC"],
+        timeframes=["5m", "1h"],
+        datadir=tmp_path,
+        timerange=TimeRange.parse_timerange("20240101-20240108"),
+        data_format=data_format,
+        trading_mode="spot",
+        concurrency=3,
+    )
+    assert unavailable == ["NOPE/BTC: Pair not available on exchange."]
+    # Downloads of different pairs / timeframes overlap, limited by concurrency
+    assert 1 < max_running <= 3
+    assert not (tmp_path / ".download_manifest.json").exists()
+    # Disk I/O doesn't run on the event loop
+    assert threading.main_thread() not in store_threads
+
+    for pair in pairs:
+        for timeframe in ("5m", "1h"):
+            df = dhc.ohlcv_load(pair, timeframe, CandleType.SPOT, fill_missing=False)
+            # Last candle is dropped as incomplete
+            expected = range(start, end - tf_ms[timeframe], tf_ms[timeframe])
+            assert [dt_ts(d) for d in df["date"]] == list(expected)
+
+
 def test_download_data_no_markets(mocker, default_conf, caplog, testdatadir):
     dl_mock = mocker.patch(
         "freqtrade.data.history.history_utils._download_pair_history", MagicMock()
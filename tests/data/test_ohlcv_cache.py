@@ -0,0 +1,132 @@
+import logging
+import os
+import shutil
+import threading
+
+from pandas.testing import assert_frame_equal
+
+from freqtrade.configuration import TimeRange
+from freqtrade.data.history import load_pair_history
+from freqtrade.data.history.datahandlers.featherdatahandler import FeatherDataHandler
+from freqtrade.data.history.ohlcv_cache import OHLCV_CACHE_DIR, OhlcvCache
+from tests.conftest import generate_test_data, log_has, log_has_re
+
+
+def test_ohlcv_cache_get_key(tmp_path):
+    file = tmp_path / "UNITTEST_BTC-5m.feather"
+    assert OhlcvCache.get_key([file], "5m") is None
+
+    file.write_bytes(b"test")
+    key = OhlcvCache.get_key([file], "5m")
+    assert key is not None
+    assert OhlcvCache.get_key([file], "5m") == key
+    assert OhlcvCache.get_key([file], "1h") != key
+
+    file.write_bytes(b"changed")
+    assert OhlcvCache.get_key([file], "5m") != key
+
+
+def test_ohlcv_cache_get_put_evict(tmp_path):
+    # Each entry is roughly 10kB
+    cache = OhlcvCache(tmp_path, 0)
+    cache._max_size = 25 * 1024
+    df = generate_test_data("5m", 200)
+
+    assert cache.get("a") is None
+    cache.put("a", df, [(logging.INFO, "freqtrade.test", "Message a")])
+    data, messages = cache.get("a")
+    assert_frame_equal(data, df)
+    assert messages == [(logging.INFO, "freqtrade.test", "Message a")]
+
+    cache.put("b", df, [])
+    # Use "a" - "b" is now least recently used
+    os.utime(tmp_path / "a.feather", ns=(1, 1))
+    os.utime(tmp_path / "b.feather", ns=(0, 0))
+    cache.put("c", df, [])
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_ohlcv_cache_put_failure(tmp_path, caplog, mocker):
+    cache = OhlcvCache(tmp_path, 10)
+    df = generate_test_data("5m", 200)
+
+    def write_feather(table, dest, **kwargs):
+        dest.write_bytes(b"partial")
+        raise OSError("No space left on device")
+
+    mocker.patch("freqtrade.data.history.ohlcv_cache.feather.write_feather", write_feather)
+    cache.put("a", df, [])
+    assert log_has_re(r"Could not write OHLCV cache entry .*No space left on device", caplog)
+    assert cache.get("a") is None
+    assert list(tmp_path.iterdir()) == []
+
+    # Read-only / inaccessible cache directory
+    mocker.patch("freqtrade.data.history.ohlcv_cache.Path.mkdir", side_effect=PermissionError)
+    cache = OhlcvCache(tmp_path / "cache", 10)
+    cache.put("a", df, [])
+    assert cache.get("a") is None
+
+
+def test_load_pair_history_cache_other_threads(testdatadir, tmp_path, caplog, mocker):
+    shutil.copy(testdatadir / "UNITTEST_BTC-5m.feather", tmp_path)
+    ohlcv_load = FeatherDataHandler._ohlcv_load
+
+    def load_with_other_thread(*args, **kwargs):
+        # Simulate another thread (e.g. the API server) logging during the load
+        thread = threading.Thread(
+            target=logging.getLogger("freqtrade.test").warning, args=("Other thread",)
+        )
+        thread.start()
+        thread.join()
+        return ohlcv_load(*args, **kwargs)
+
+    mocker.patch.object(FeatherDataHandler, "_ohlcv_load", load_with_other_thread)
+    kwargs = {"pair": "UNITTEST/BTC", "timeframe": "5m", "datadir": tmp_path}
+    load_pair_history(**kwargs, cache_size=10)
+    assert log_has("Other thread", caplog)
+    caplog.clear()
+
+    cache = OhlcvCache(tmp_path / OHLCV_CACHE_DIR, 10)
+    (entry,) = (tmp_path / OHLCV_CACHE_DIR).glob("*.feather")
+    _, messages = cache.get(entry.stem)
+    assert not any(msg == "Other thread" for _, _, msg in messages)
+
+
+def test_load_pair_history_cache(testdatadir, tmp_path, caplog, mocker):
+    shutil.copy(testdatadir / "UNITTEST_BTC-5m.feather", tmp_path)
+    timerange = TimeRange.parse_timerange("20180101-20180115")
+    kwargs = {
+        "pair": "UNITTEST/BTC",
+        "timeframe": "5m",
+        "datadir": tmp_path,
+        "timerange": timerange,
+        "startup_candles": 20,
+    }
+    expected = load_pair_history(**kwargs)
+    assert not (tmp_path / OHLCV_CACHE_DIR).exists()
+
+    data = load_pair_history(**kwargs, cache_size=10)
+    assert_frame_equal(data, expected)
+    assert len(list((tmp_path / OHLCV_CACHE_DIR).glob("*.feather"))) == 1
+    caplog.clear()
+
+    load_mock = mocker.spy(FeatherDataHandler, "_ohlcv_load")
+    data = load_pair_history(**kwargs, cache_size=10)
+    assert load_mock.call_count == 0
+    assert_frame_equal(data, expected)
+    # Messages of the initial load are repeated
+    assert log_has("UNITTEST/BTC, spot, 5m, data starts at 2018-01-10 04:55:00", caplog)
+
+    # Different parameters
+    load_pair_history(**kwargs | {"startup_candles": 0}, cache_size=10)
+    assert load_mock.call_count == 1
+
+    # Changed source data
+    data_file = tmp_path / "UNITTEST_BTC-5m.feather"
+    stat = data_file.stat()
+    os.utime(data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    load_pair_history(**kwargs, cache_size=10)
+    assert load_mock.call_count == 2
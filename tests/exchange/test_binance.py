@@ -682,6 +682,25 @@ def test_fill_leverage_tiers_binance_dryrun(default_conf, mocker, leverage_tiers
         assert len(v) >= len(value)
 
 
+@pytest.mark.parametrize(
+    "trading_mode,limit,expected",
+    [
+        ("spot", 1000, 2),
+        ("futures", 99, 1),
+        ("futures", 499, 2),
+        ("futures", 1000, 5),
+        ("futures", 1500, 10),
+    ],
+)
+def test_ohlcv_request_weight_binance(default_conf, mocker, trading_mode, limit, expected):
+    default_conf["trading_mode"] = trading_mode
+    default_conf["margin_mode"] = "isolated"
+    exchange = get_patched_exchange(mocker, default_conf, exchange="binance")
+    assert exchange.ohlcv_request_weight("1h", CandleType.SPOT, limit) == expected
+    assert exchange.request_weight("fetch_tickers") == (80 if trading_mode == "spot" else 40)
+    assert exchange._request_scheduler is not None
+
+
 def test_additional_exchange_init_binance(default_conf, mocker):
     api_mock = MagicMock()
     api_mock.fapiPrivateGetPositionSideDual = MagicMock(return_value={"dualSidePosition": True})
@@ -781,7 +800,7 @@ def patch_binance_vision_ohlcv(mocker, start, archive_end, api_end, timeframe):
         ]
 
     candle_mock = mocker.patch(f"{EXMS}._async_get_candle_history", return_value=candle_history)
-    api_mock = mocker.patch(f"{EXMS}.get_historic_ohlcv", side_effect=get_historic_ohlcv)
+    api_mock = mocker.patch(f"{EXMS}._async_get_historic_ohlcv_df", side_effect=get_historic_ohlcv)
     archive_mock = mocker.patch(
         "freqtrade.exchange.binance.download_archive_ohlcv", side_effect=download_archive_ohlcv
     )
@@ -3,14 +3,16 @@ import logging
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
 from random import randint
-from unittest.mock import MagicMock, Mock, PropertyMock, patch
+from unittest.mock import ANY, MagicMock, Mock, PropertyMock, patch
 
 import ccxt
 import pytest
 from numpy import nan
 from pandas import DataFrame, to_datetime
 
-from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS
+from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, DEFAULT_TRADES_COLUMNS
+from freqtrade.data.converter import trades_list_to_df
+from freqtrade.data.history import get_datahandler
 from freqtrade.enums import CandleType, MarginMode, RunMode, TradingMode
 from freqtrade.exceptions import (
     ConfigurationError,
@@ -37,6 +39,7 @@ from freqtrade.exchange.common import (
     calculate_backoff,
     remove_exchange_credentials,
 )
+from freqtrade.exchange.exchange_metadata_cache import ExchangeMetadataCache
 from freqtrade.resolvers.exchange_resolver import ExchangeResolver
 from freqtrade.util import dt_now, dt_ts
 from tests.conftest import (
@@ -651,6 +654,81 @@ def test_reload_markets(default_conf, mocker, caplog, time_machine):
     assert exchange.markets == updated_markets
 
 
+def test_reload_markets_metadata_cache(default_conf, mocker, caplog, time_machine, tmp_path):
+    start_dt = dt_now()
+    time_machine.move_to(start_dt, tick=False)
+    markets = {"ETH/BTC": {"symbol": "ETH/BTC"}}
+    default_conf["datadir"] = tmp_path
+    default_conf["exchange"]["metadata_cache_ttl"] = 60
+    default_conf["exchange"]["markets_refresh_interval"] = 10
+    api_mock = MagicMock()
+    api_mock.load_markets = get_mock_coro(return_value=markets)
+    api_mock.markets = markets
+    api_mock.currencies = {"ETH": {"id": "ETH"}}
+    api_mock.options = {"defaultType": "spot"}
+    api_mock.set_markets = MagicMock(side_effect=lambda m, c: m)
+    exchange = get_patched_exchange(
+        mocker, default_conf, api_mock, exchange="binance", mock_markets=False
+    )
+    assert exchange.markets == markets
+    assert (tmp_path / "exchange_metadata_binance_spot.json").is_file()
+    assert not log_has("Using cached markets.", caplog)
+
+    time_machine.move_to(start_dt + timedelta(minutes=30), tick=False)
+    api_mock.load_markets = get_mock_coro(side_effect=ccxt.NetworkError("LoadError"))
+    api_mock.options = {}
+    exchange = get_patched_exchange(
+        mocker, default_conf, api_mock, exchange="binance", mock_markets=False
+    )
+    lam_spy = mocker.spy(exchange, "_load_async_markets")
+    assert log_has("Using cached markets.", caplog)
+    assert exchange.markets == markets
+    assert api_mock.options == {"defaultType": "spot"}
+    api_mock.set_markets.assert_any_call(markets, {"ETH": {"id": "ETH"}})
+    # Regular reload happens based on the age of the cached markets
+    assert exchange._last_markets_refresh == dt_ts(start_dt)
+    exchange.reload_markets()
+    assert lam_spy.call_count == 1
+
+    # Cache is outdated
+    caplog.clear()
+    time_machine.move_to(start_dt + timedelta(minutes=61), tick=False)
+    api_mock.load_markets = get_mock_coro(return_value=markets)
+    exchange = get_patched_exchange(
+        mocker, default_conf, api_mock, exchange="binance", mock_markets=False
+    )
+    assert not log_has("Using cached markets.", caplog)
+    assert exchange._last_markets_refresh == dt_ts()
+
+
+def test_exchange_metadata_cache(tmp_path, mocker, time_machine):
+    start_dt = dt_now()
+    time_machine.move_to(start_dt, tick=False)
+    filename = tmp_path / "exchange_metadata_binance_futures.json"
+    cache = ExchangeMetadataCache(filename, 10, "binance", "key1")
+    assert cache.get("leverage_tiers") is None
+    cache.set(leverage_tiers={"ETH/USDT:USDT": [{"maxLeverage": 10}]})
+    assert cache.get("leverage_tiers") == ({"ETH/USDT:USDT": [{"maxLeverage": 10}]}, dt_ts())
+    assert not list(tmp_path.glob("*.tmp"))
+
+    # Loaded from disk
+    cache = ExchangeMetadataCache(filename, 10, "binance", "key1")
+    assert cache.get("leverage_tiers") is not None
+    assert "key1" not in filename.read_text()
+    # Written for a different exchange or account
+    assert ExchangeMetadataCache(filename, 10, "bybit", "key1").get("leverage_tiers") is None
+    assert ExchangeMetadataCache(filename, 10, "binance", "key2").get("leverage_tiers") is None
+    assert ExchangeMetadataCache(filename, 10, "binance").get("leverage_tiers") is None
+    time_machine.move_to(start_dt + timedelta(minutes=11), tick=False)
+    assert cache.get("leverage_tiers") is None
+
+    # Written by a different ccxt version
+    time_machine.move_to(start_dt, tick=False)
+    mocker.patch("freqtrade.exchange.exchange_metadata_cache.ccxt.__version__", "0.0.1")
+    cache = ExchangeMetadataCache(filename, 10, "binance", "key1")
+    assert cache.get("leverage_tiers") is None
+
+
 def test_reload_markets_exception(default_conf, mocker, caplog):
     caplog.set_level(logging.DEBUG)
 
@@ -2100,6 +2178,73 @@ def test_fetch_ticker(default_conf, mocker, exchange_name):
         exchange.fetch_ticker(pair="XRP/ETH")
 
 
+def test_get_ticker_snapshot(default_conf, mocker, time_machine):
+    time_machine.move_to("2024-05-01 10:00:00 +00:00", tick=False)
+    mocker.patch("freqtrade.exchange.ticker_snapshot.time.monotonic", lambda: dt_ts() / 1000)
+    api_mock = MagicMock()
+    api_mock.fetch_tickers = MagicMock(
+        return_value={
+            "ETH/BTC": {"symbol": "ETH/BTC", "bid": 0.05, "ask": 0.051, "last": 0.0505},
+            "LTC/BTC": {"symbol": "LTC/BTC", "bid": 0.002, "ask": 0.0021, "last": 0.00205},
+        }
+    )
+    api_mock.fetch_ticker = MagicMock(
+        return_value={"symbol": "XRP/BTC", "bid": 0.1, "ask": 0.11, "last": 0.105}
+    )
+    api_mock.markets = {p: {"active": True} for p in ("ETH/BTC", "LTC/BTC", "XRP/BTC")}
+    mocker.patch(f"{EXMS}.exchange_has", return_value=True)
+    default_conf["exit_pricing"]["price_side"] = "other"
+
+    # Disabled - one call per pair
+    exchange = get_patched_exchange(mocker, default_conf, api_mock, exchange="kraken")
+    assert exchange._ticker_snapshot is None
+    assert exchange.get_ticker("ETH/BTC")["symbol"] == "XRP/BTC"
+    assert api_mock.fetch_ticker.call_count == 1
+    assert api_mock.fetch_tickers.call_count == 0
+
+    api_mock.fetch_ticker.reset_mock()
+    default_conf["exchange"]["ticker_snapshot_ttl"] = 5
+    exchange = get_patched_exchange(mocker, default_conf, api_mock, exchange="kraken")
+    assert exchange.get_ticker("ETH/BTC")["bid"] == 0.05
+    assert exchange.get_ticker("LTC/BTC")["bid"] == 0.002
+    assert exchange.get_rate("LTC/BTC", refresh=True, side="exit", is_short=False) == 0.002
+    assert api_mock.fetch_tickers.call_count == 1
+    assert api_mock.fetch_ticker.call_count == 0
+
+    # Missing in the bulk result
+    assert exchange.get_ticker("XRP/BTC")["bid"] == 0.1
+    assert exchange.get_ticker("XRP/BTC")["bid"] == 0.1
+    assert api_mock.fetch_ticker.call_count == 1
+    assert api_mock.fetch_tickers.call_count == 1
+    assert exchange.get_conversion_rate("LTC", "BTC") == 0.00205
+
+    assert api_mock.fetch_tickers.call_count == 1
+
+    # Snapshot expired - one bulk call serves conversion and pricing
+    time_machine.shift(6)
+    assert exchange.get_conversion_rate("LTC", "BTC") == 0.00205
+    exchange.get_ticker("ETH/BTC")
+    assert api_mock.fetch_tickers.call_count == 2
+
+    # Bulk calls (e.g. from pairlists) refresh the snapshot
+    time_machine.shift(6)
+    exchange.get_tickers()
+    assert api_mock.fetch_tickers.call_count == 3
+    exchange.get_ticker("ETH/BTC")
+    assert exchange.get_conversion_rate("LTC", "BTC") == 0.00205
+    assert api_mock.fetch_tickers.call_count == 3
+    # Tickers of other market types are not used for the snapshot
+    time_machine.shift(6)
+    exchange.get_tickers(market_type=TradingMode.FUTURES)
+    exchange.get_ticker("ETH/BTC")
+    assert api_mock.fetch_tickers.call_count == 5
+
+    # Bulk tickers without bid / ask can't be used for pricing
+    default_conf["exchange"]["_ft_has_params"] = {"tickers_have_bid_ask": False}
+    exchange = get_patched_exchange(mocker, default_conf, api_mock, exchange="kraken")
+    assert exchange._ticker_snapshot is None
+
+
 @pytest.mark.parametrize("exchange_name", EXCHANGES)
 def test___now_is_time_to_refresh(default_conf, mocker, exchange_name, time_machine):
     exchange = get_patched_exchange(mocker, default_conf, exchange=exchange_name)
@@ -2399,6 +2544,7 @@ def test_refresh_latest_trades(
         assert exchange.trades(pair) is not exchange.trades(pair, copy=True)
         assert exchange.trades(pair, copy=True) is not exchange.trades(pair, copy=True)
         assert exchange.trades(pair, copy=False) is exchange.trades(pair, copy=False)
+        assert exchange.trades(pair, copy=False) is exchange._trade_stores[pair].dataframe
 
         # test caching
         ohlcv = [
@@ -2483,6 +2629,55 @@ def test_refresh_latest_trades(
     caplog.clear()
 
 
+@pytest.mark.parametrize("data_format", ["feather", "parquet", "json"])
+def test_build_trades_dl_jobs_cached_illiquid(
+    mocker, default_conf, tmp_path, time_machine, data_format
+) -> None:
+    time_machine.move_to(dt_now(), tick=False)
+    default_conf["exchange"]["use_public_trades"] = True
+    default_conf["datadir"] = tmp_path
+    default_conf["dataformat_trades"] = data_format
+    default_conf["orderflow"] = {"max_candles": 100}
+    exchange = get_patched_exchange(mocker, default_conf)
+    pairwt = ("ETH/USDT", "5m", CandleType.SPOT)
+    first_candle_ms = exchange.needed_candle_for_trades_ms("5m", CandleType.SPOT)
+    data_handler = get_datahandler(tmp_path, data_format)
+    # Illiquid pair - no trades in the candles right before the first required candle
+    cached = [
+        [first_candle_ms - 20 * 300_000, "1", None, "buy", 1.0, 2.0, 2.0],
+        [first_candle_ms + 10 * 300_000, "2", None, "sell", 1.1, 2.0, 2.2],
+    ]
+    data_handler.trades_store(
+        "ETH/USDT-cached", trades_list_to_df(cached)[DEFAULT_TRADES_COLUMNS], TradingMode.SPOT
+    )
+    new_trade = [dt_ts() - 60_000, "3", None, "buy", 1.2, 1.0, 1.2]
+    history_mock = mocker.patch.object(
+        exchange, "_async_get_trade_history", return_value=("ETH/USDT", [new_trade])
+    )
+
+    _, trades = exchange.loop.run_until_complete(
+        exchange._build_trades_dl_jobs(pairwt, data_handler, cache=True)
+    )
+    # Cache is used - only trades after the last cached trade are fetched
+    history_mock.assert_called_once_with(
+        "ETH/USDT", since=first_candle_ms + 10 * 300_000, until=ANY, from_id="2"
+    )
+    assert trades is not None
+    assert trades["id"].tolist() == ["1", "2", "3"]
+
+    # Cache doesn't cover the first required candle
+    exchange._trades.clear()
+    exchange._trade_stores.clear()
+    history_mock.reset_mock()
+    data_handler.trades_store(
+        "ETH/USDT-cached", trades_list_to_df(cached[1:])[DEFAULT_TRADES_COLUMNS], TradingMode.SPOT
+    )
+    exchange.loop.run_until_complete(
+        exchange._build_trades_dl_jobs(pairwt, data_handler, cache=True)
+    )
+    history_mock.assert_called_once_with("ETH/USDT", since=first_candle_ms, until=ANY, from_id=None)
+
+
 @pytest.mark.parametrize("candle_type", [CandleType.FUTURES, CandleType.MARK, CandleType.SPOT])
 def test_refresh_latest_ohlcv_cache(mocker, default_conf, candle_type, time_machine) -> None:
     start = datetime(2021, 8, 1, 0, 0, 0, 0, tzinfo=timezone.utc)
@@ -2551,6 +2746,8 @@ def test_refresh_latest_ohlcv_cache(mocker, default_conf, candle_type, time_mach
     # Verify index starts at 0
     assert res[pair2].at[0, "open"]
     assert refresh_pior != exchange._pairs_last_refresh_time[pair1]
+    # Merged through the kline buffer
+    assert res[pair1] is exchange._kline_buffers[pair1].dataframe
 
     assert exchange._pairs_last_refresh_time[pair1] == ohlcv[-2][0] // 1000
     assert exchange._pairs_last_refresh_time[pair2] == ohlcv[-2][0] // 1000
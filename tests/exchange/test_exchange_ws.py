@@ -1,10 +1,17 @@
 import asyncio
 import threading
+import time
 from time import sleep
 from unittest.mock import AsyncMock, MagicMock
 
+import pytest
+import time_machine
+
 from freqtrade.enums import CandleType
+from freqtrade.exchange import timeframe_to_prev_date
 from freqtrade.exchange.exchange_ws import ExchangeWS
+from freqtrade.util import dt_ts
+from tests.conftest import get_patched_exchange
 
 
 def test_exchangews_init(mocker):
@@ -67,3 +74,95 @@ async def test_exchangews_ohlcv(mocker):
     finally:
         # Cleanup
         exchange_ws.cleanup()
+
+
+def test_exchangews_wait_for_candles(mocker):
+    config = MagicMock()
+    ccxt_object = MagicMock()
+    mocker.patch("freqtrade.exchange.exchange_ws.ExchangeWS._start_forever", MagicMock())
+
+    exchange_ws = ExchangeWS(config, ccxt_object)
+    try:
+        pair1 = ("ETH/BTC", "5m", CandleType.SPOT)
+        pair2 = ("XRP/BTC", "5m", CandleType.SPOT)
+        exchange_ws._klines_watching = {pair1, pair2, ("ETH/BTC", "1h", CandleType.SPOT)}
+        exchange_ws._candle_received(pair1, 1_000)
+        exchange_ws._candle_received(pair2, 1_000)
+        # Older updates are ignored
+        exchange_ws._candle_received(pair2, 500)
+        assert exchange_ws.klines_last_candle == {pair1: 1_000, pair2: 1_000}
+
+        assert exchange_ws.wait_for_candles("5m", 1_000, 0.01) is True
+        start = time.monotonic()
+        assert exchange_ws.wait_for_candles("5m", 2_000, 0.1) is False
+        assert time.monotonic() - start >= 0.09
+
+        def deliver():
+            sleep(0.05)
+            exchange_ws._candle_received(pair1, 2_000)
+            exchange_ws._candle_received(pair2, 2_000)
+
+        threading.Thread(target=deliver).start()
+        start = time.monotonic()
+        # Wakes up as soon as all 5m pairs have the new candle
+        assert exchange_ws.wait_for_candles("5m", 2_000, 5) is True
+        assert time.monotonic() - start < 2
+    finally:
+        exchange_ws.cleanup()
+
+
+@pytest.mark.parametrize(
+    "first_candle,last_candle,last_refresh,reuse",
+    [
+        # Continuous with the cache, current candle received
+        (-20, 0, 0, True),
+        # Previous candle was updated after it closed
+        (-20, -1, 0, True),
+        # Gap to the cached candles - backfill via REST
+        (-3, 0, 0, False),
+        # Previous candle may be incomplete
+        (-20, -1, -1, False),
+    ],
+)
+def test_exchangews_reuse_continuity(
+    mocker, default_conf, first_candle, last_candle, last_refresh, reuse
+):
+    exchange = get_patched_exchange(mocker, default_conf)
+    pair = ("ETH/BTC", "5m", CandleType.SPOT)
+    tf_ms = 5 * 60 * 1000
+    with time_machine.travel("2024-05-01 10:02:00 +00:00", tick=False):
+        candle_date = dt_ts(timeframe_to_prev_date("5m"))
+        exchange_ws = MagicMock()
+        exchange_ws.ccxt_object.ohlcvs = {
+            "ETH/BTC": {
+                "5m": [
+                    [candle_date + i * tf_ms, 1, 2, 0.5, 1.5, 10]
+                    for i in range(first_candle, last_candle + 1)
+                ]
+            }
+        }
+        exchange_ws.klines_last_refresh = {pair: candle_date + last_refresh * tf_ms + 1}
+        exchange._exchange_ws = exchange_ws
+        exchange._klines[pair] = MagicMock()
+        # Last complete cached candle closed 4 candles ago
+        exchange._pairs_last_refresh_time[pair] = (candle_date - 5 * tf_ms) // 1000
+
+        coro = exchange._build_coroutine(*pair, since_ms=None, cache=True)
+        assert (coro is exchange_ws.get_ohlcv.return_value) is reuse
+        if not reuse:
+            coro.close()
+        exchange._exchange_ws = None
+
+
+def test_exchange_wait_for_candle_close(mocker, default_conf):
+    exchange = get_patched_exchange(mocker, default_conf)
+    assert exchange.wait_for_candle_close("5m", 1) is False
+
+    exchange._exchange_ws = MagicMock()
+    exchange._exchange_ws.wait_for_candles.return_value = False
+    with time_machine.travel("2024-05-01 10:05:00 +00:00", tick=False):
+        assert exchange.wait_for_candle_close("5m", 1) is True
+        exchange._exchange_ws.wait_for_candles.assert_called_once_with(
+            "5m", dt_ts(timeframe_to_prev_date("5m")), 1
+        )
+    exchange._exchange_ws = None
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+from pandas import Timedelta, concat
+from pandas.testing import assert_frame_equal
+
+from freqtrade.data.converter import clean_ohlcv_dataframe, ohlcv_to_dataframe
+from freqtrade.exchange.kline_buffer import KlineBuffer
+
+
+def _ticks(start: int, count: int, timeframe_ms: int, rng) -> list[list]:
+    prices = 100 + rng.normal(0, 1, count).cumsum()
+    return [
+        [
+            start + i * timeframe_ms,
+            price,
+            price + rng.uniform(0, 1),
+            price - rng.uniform(0, 1),
+            price + rng.uniform(-0.5, 0.5),
+            rng.uniform(0, 100),
+        ]
+        for i, price in enumerate(prices)
+    ]
+
+
+def _merge_reference(old, new, capacity):
+    merged = clean_ohlcv_dataframe(
+        concat([old, new], axis=0), "5m", "UNITTEST/BTC", fill_missing=True, drop_incomplete=False
+    )
+    return merged.tail(capacity).reset_index(drop=True)
+
+
+@pytest.mark.parametrize("capacity", [50, 200])
+def test_kline_buffer_parity(capacity):
+    rng = np.random.default_rng(42)
+    tf_ms = 5 * 60 * 1000
+    start = 1_700_000_100_000 - 1_700_000_100_000 % tf_ms
+
+    initial = ohlcv_to_dataframe(
+        _ticks(start, 120, tf_ms, rng), "5m", "UNITTEST/BTC", drop_incomplete=False
+    )
+    buffer = KlineBuffer("5m", capacity)
+    assert buffer.reset(initial)
+    expected = initial.tail(capacity).reset_index(drop=True)
+    assert_frame_equal(buffer.to_dataframe(), expected)
+
+    last = start + 119 * tf_ms
+    # Regular refreshes (overlapping the last candle), gaps and large jumps
+    for offset, count in [(0, 2), (0, 1), (1, 3), (-2, 5), (4, 2), (0, 30), (-10, 3), (1, 400)]:
+        new_start = last + offset * tf_ms
+        new = ohlcv_to_dataframe(
+            _ticks(new_start, count, tf_ms, rng), "5m", "UNITTEST/BTC", drop_incomplete=False
+        )
+        expected = _merge_reference(expected, new, capacity)
+        assert buffer.update(new)
+        result = buffer.to_dataframe()
+        assert_frame_equal(result, expected)
+        assert buffer.to_dataframe() is result
+        last = result["date"].iloc[-1].value // 1_000_000
+
+
+def test_kline_buffer_unsupported():
+    rng = np.random.default_rng(42)
+    tf_ms = 5 * 60 * 1000
+    initial = ohlcv_to_dataframe(
+        _ticks(1_700_000_100_000 // tf_ms * tf_ms, 20, tf_ms, rng),
+        "5m",
+        "UNITTEST/BTC",
+        drop_incomplete=False,
+    )
+    buffer = KlineBuffer("5m", 50)
+    assert buffer.reset(initial)
+    before = buffer.to_dataframe()
+
+    # Data before the buffer start
+    shifted = initial.iloc[:5].assign(date=initial["date"].iloc[:5] - Timedelta(minutes=50))
+    assert not buffer.update(shifted)
+    # Not aligned
+    shifted = initial.iloc[-2:].assign(date=initial["date"].iloc[-2:] + Timedelta(seconds=1))
+    assert not buffer.update(shifted)
+    # Gaps
+    assert not buffer.update(initial.iloc[[10, 12]])
+    assert buffer.to_dataframe() is before
+
+    assert KlineBuffer.supports_timeframe("5m")
+    assert KlineBuffer.supports_timeframe("1d")
+    assert not KlineBuffer.supports_timeframe("1w")
+    assert not KlineBuffer.supports_timeframe("1M")
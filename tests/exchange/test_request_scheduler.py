@@ -0,0 +1,202 @@
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from freqtrade.enums import CandleType
+from freqtrade.exchange.request_scheduler import (
+    RequestPriority,
+    RequestScheduler,
+    WeightRecordingApi,
+)
+from tests.conftest import EXMS, get_mock_coro, get_patched_exchange
+
+
+async def _request(name: str, order: list[str]) -> str:
+    order.append(name)
+    return name
+
+
+async def test_request_scheduler_priority():
+    scheduler = RequestScheduler(10, interval=0.2, headroom=1)
+    order: list[str] = []
+    # Fill the window, so all following requests have to queue
+    scheduler.record(10)
+
+    results = await asyncio.gather(
+        scheduler.run(_request("low", order), 1, RequestPriority.LOW),
+        scheduler.run(_request("normal", order), 1, RequestPriority.NORMAL),
+        scheduler.run(_request("low2", order), 1, RequestPriority.LOW),
+    )
+    assert results == ["low", "normal", "low2"]
+    assert order == ["normal", "low", "low2"]
+
+    stats = scheduler.get_stats()
+    assert stats["queued"] == 0
+    assert stats["running"] == 0
+    assert stats["weight_budget"] == 10
+    assert stats["priorities"]["high"]["requests"] == 1
+    assert stats["priorities"]["high"]["weight"] == 10
+    assert stats["priorities"]["normal"]["requests"] == 1
+    assert stats["priorities"]["low"]["requests"] == 2
+    assert stats["priorities"]["low"]["max_wait_ms"] > 0
+
+
+async def test_request_scheduler_weight_limit():
+    scheduler = RequestScheduler(10, interval=0.3, headroom=1)
+    order: list[str] = []
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    await asyncio.gather(
+        *[scheduler.run(_request(str(i), order), 4, RequestPriority.LOW) for i in range(3)]
+    )
+    # Third request only fits once the first two left the window
+    assert loop.time() - start >= 0.25
+    assert order == ["0", "1", "2"]
+    assert scheduler.get_stats()["used_weight"] == 4
+
+    # Requests heavier than the budget still run
+    assert await scheduler.run(_request("heavy", order), 50) == "heavy"
+
+
+async def test_request_scheduler_exception():
+    scheduler = RequestScheduler(10, interval=0.1, headroom=1)
+
+    async def failing():
+        raise ValueError("Failed")
+
+    with pytest.raises(ValueError, match="Failed"):
+        await scheduler.run(failing(), 2, RequestPriority.NORMAL)
+    stats = scheduler.get_stats()
+    assert stats["running"] == 0
+    assert stats["priorities"]["normal"]["requests"] == 1
+
+    scheduler.record(10)
+    order: list[str] = []
+    task = asyncio.create_task(scheduler.run(_request("cancelled", order), 1))
+    await asyncio.sleep(0.01)
+    assert scheduler.get_stats()["queued"] == 1
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert scheduler.get_stats()["queued"] == 0
+    assert order == []
+
+
+async def test_exchange_request_scheduler(default_conf, mocker):
+    exchange = get_patched_exchange(mocker, default_conf, exchange="kraken")
+    assert exchange._request_scheduler is None
+    assert exchange.get_request_stats() == {}
+
+    default_conf["exchange"]["_ft_has_params"] = {
+        "request_weight_limit": 100,
+        "request_weights": {"fetch_ohlcv": 3, "fetch_ticker": 2},
+    }
+    api_mock = MagicMock()
+    api_mock.fetch_ticker = MagicMock(return_value={"symbol": "ETH/BTC", "last": 1.0})
+    exchange = get_patched_exchange(mocker, default_conf, api_mock, exchange="kraken")
+    assert isinstance(exchange._request_scheduler, RequestScheduler)
+    exchange._api_async.fetch_ohlcv = get_mock_coro([])
+
+    await exchange._async_get_candle_history("ETH/BTC", "5m", CandleType.SPOT)
+    await exchange._async_get_candle_history("ETH/BTC", "5m", CandleType.SPOT, since_ms=1000)
+    exchange.fetch_ticker("ETH/BTC")
+
+    stats = exchange.get_request_stats()
+    assert stats["used_weight"] == 8
+    assert stats["priorities"]["high"]["weight"] == 2
+    assert stats["priorities"]["normal"]["weight"] == 3
+    assert stats["priorities"]["low"]["weight"] == 3
+    exchange.close()
+
+
+def test_exchange_request_scheduler_sync_endpoints(default_conf, mocker):
+    default_conf["dry_run"] = False
+    default_conf["exchange"]["_ft_has_params"] = {
+        "request_weight_limit": 1000,
+        "request_weights": {"fetch_balance": 10, "fetch_my_trades": 5},
+    }
+    api_mock = MagicMock()
+    api_mock.fetch_balance = MagicMock(return_value={"info": {}, "free": {}})
+    api_mock.fetch_open_orders = MagicMock(return_value=[])
+    api_mock.fetch_l2_order_book = MagicMock(return_value={"bids": [], "asks": []})
+    api_mock.fetch_my_trades = MagicMock(return_value=[])
+    api_mock.fetch_leverage_tiers = MagicMock(return_value={})
+    api_mock.fetch_funding_history = MagicMock(return_value=[])
+    exchange = get_patched_exchange(mocker, default_conf, api_mock, exchange="kraken")
+    mocker.patch(f"{EXMS}.exchange_has", return_value=True)
+
+    exchange.get_balances()
+    exchange.fetch_l2_order_book("ETH/BTC", 20)
+    exchange.get_trades_for_order("123", "ETH/BTC", datetime.now(timezone.utc))
+    exchange.get_leverage_tiers()
+    exchange._get_funding_fees_from_exchange("ETH/BTC", 0)
+
+    stats = exchange.get_request_stats()
+    # Kraken's get_balances() also fetches open orders.
+    # Endpoints without configured weight count as 1
+    assert stats["used_weight"] == 10 + 1 + 1 + 5 + 1 + 1
+    assert stats["priorities"]["high"]["requests"] == 6
+
+
+@pytest.mark.parametrize(
+    "trading_mode,limit,expected",
+    [
+        ("spot", None, 5),
+        ("spot", 100, 5),
+        ("spot", 500, 25),
+        ("spot", 1000, 50),
+        ("spot", 5000, 250),
+        ("futures", 20, 2),
+        ("futures", 100, 5),
+        ("futures", 500, 10),
+        ("futures", 1000, 20),
+    ],
+)
+def test_l2_order_book_request_weight_binance(default_conf, mocker, trading_mode, limit, expected):
+    default_conf["trading_mode"] = trading_mode
+    default_conf["margin_mode"] = "isolated"
+    exchange = get_patched_exchange(mocker, default_conf, exchange="binance")
+    assert exchange.l2_order_book_request_weight(limit) == expected
+    assert exchange.request_weight("fetch_balance") == (20 if trading_mode == "spot" else 5)
+
+
+def test_weight_recording_api():
+    scheduler = RequestScheduler(100)
+    api = MagicMock()
+    api.markets = {"ETH/BTC": {}}
+    weights = {"fetch_balance": 10, "fapiPrivateGetPositionSideDual": 30}
+    wrapped = WeightRecordingApi(
+        api, scheduler, lambda name, args, kwargs: weights.get(name, 1), weights
+    )
+
+    assert wrapped.markets == {"ETH/BTC": {}}
+    wrapped.price_to_precision("ETH/BTC", 1.0)
+    wrapped.set_markets({})
+    assert scheduler.get_stats()["used_weight"] == 0
+
+    wrapped.fetch_balance()
+    wrapped.create_order("ETH/BTC", "limit", "buy", 1, 1)
+    wrapped.fapiPrivateGetPositionSideDual()
+    wrapped.set_leverage(2, "ETH/BTC")
+    assert api.fetch_balance.call_count == 1
+    assert api.create_order.call_args[0] == ("ETH/BTC", "limit", "buy", 1, 1)
+    stats = scheduler.get_stats()
+    assert stats["used_weight"] == 10 + 1 + 30 + 1
+    assert stats["priorities"]["high"]["requests"] == 4
+
+    # Attributes are set on the wrapped instance
+    wrapped.options = {"defaultType": "swap"}
+    assert api.options == {"defaultType": "swap"}
+
+
+def test_exchange_request_weight_l2_order_book(default_conf, mocker):
+    api_mock = MagicMock()
+    api_mock.fetch_l2_order_book = MagicMock(return_value={"bids": [], "asks": []})
+    exchange = get_patched_exchange(mocker, default_conf, api_mock, exchange="binance")
+    assert isinstance(exchange._api, WeightRecordingApi)
+
+    exchange.fetch_l2_order_book("ETH/BTC", 500)
+    assert exchange.get_request_stats()["used_weight"] == 25
+    assert api_mock.fetch_l2_order_book.call_count == 1
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+from pandas import DataFrame, concat
+from pandas.testing import assert_frame_equal
+
+from freqtrade.data.converter import trades_df_remove_duplicates, trades_list_to_df
+from freqtrade.exchange.trade_store import TradeStore
+
+
+def _trades(start: int, count: int, rng, first_id: int) -> list[list]:
+    timestamps = start + np.cumsum(rng.integers(0, 5_000, count))
+    return [
+        [int(ts), str(first_id + i), None, rng.choice(["buy", "sell"]), 100.0 + i, 1.0, 100.0 + i]
+        for i, ts in enumerate(timestamps)
+    ]
+
+
+def _merge_reference(old: DataFrame, new: DataFrame, first_required_ms: int) -> DataFrame:
+    combined = concat([old, new], axis=0)
+    trades_df = DataFrame(trades_df_remove_duplicates(combined), columns=combined.columns)
+    trades_df = trades_df[first_required_ms < trades_df["timestamp"]]
+    return trades_df.reset_index(drop=True)
+
+
+@pytest.mark.parametrize("shuffle", [False, True])
+def test_trade_store_parity(shuffle):
+    rng = np.random.default_rng(42)
+    tf_ms = 5 * 60 * 1000
+    start = 1_700_000_100_000 // tf_ms * tf_ms
+    ticks = _trades(start, 2000, rng, 1000)
+
+    expected = trades_list_to_df(ticks[:500])
+    store = TradeStore("5m")
+    store.reset(expected)
+    cutoff = start
+    # Overlapping refreshes, moving the required start forward
+    for first, last in [(400, 700), (700, 700), (650, 1200), (1150, 2000)]:
+        batch = ticks[first:last]
+        if shuffle:
+            batch = [batch[i] for i in rng.permutation(len(batch))]
+        new = trades_list_to_df(batch)
+        cutoff += 20 * 60 * 1000
+        expected = _merge_reference(expected, new, cutoff)
+        result = store.update(new, cutoff)
+        assert_frame_equal(result, expected)
+        assert store.dataframe is result
+
+    # Keys of aged out candles are dropped
+    assert min(store._buckets) + tf_ms > cutoff
+    assert sum(len(keys) for keys in store._buckets.values()) >= len(result)
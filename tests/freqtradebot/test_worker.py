@@ -132,6 +132,53 @@ def test_throttle_sleep_time(mocker, default_conf, caplog) -> None:
         assert 11.1 < sleep_mock.call_args[0][0] < 13.2
 
 
+def test_throttle_wait_for_candle(mocker, default_conf) -> None:
+    worker = get_patched_worker(mocker, default_conf)
+    sleep_mock = mocker.patch("freqtrade.worker.Worker._sleep")
+    wait_mock = MagicMock(return_value=True)
+    with time_machine.travel("2022-09-01 05:01:00 +00:00", tick=False):
+        assert (
+            worker._throttle(
+                lambda: 42,
+                throttle_secs=400,
+                timeframe="5m",
+                timeframe_offset=1,
+                wait_for_candle=wait_mock,
+            )
+            == 42
+        )
+        # Sleeps until the candle closes, then waits for the websocket candle
+        assert sleep_mock.call_count == 1
+        assert sleep_mock.call_args[0][0] == 240
+        wait_mock.assert_called_once_with("5m", 1)
+
+        # Candles are not streamed - sleep for the offset
+        sleep_mock.reset_mock()
+        wait_mock.return_value = False
+        worker._throttle(
+            lambda: 42,
+            throttle_secs=400,
+            timeframe="5m",
+            timeframe_offset=1,
+            wait_for_candle=wait_mock,
+        )
+        assert [c[0][0] for c in sleep_mock.call_args_list] == [240, 1]
+
+        # Iteration ends before the candle closes - no waiting
+        sleep_mock.reset_mock()
+        wait_mock.reset_mock()
+        worker._throttle(
+            lambda: 42,
+            throttle_secs=5,
+            timeframe="5m",
+            timeframe_offset=1,
+            wait_for_candle=wait_mock,
+        )
+        assert sleep_mock.call_count == 1
+        assert sleep_mock.call_args[0][0] == 5
+        assert wait_mock.call_count == 0
+
+
 def test_throttle_with_assets(mocker, default_conf) -> None:
     def throttled_func(nb_assets=-1):
         return nb_assets
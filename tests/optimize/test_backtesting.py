@@ -23,6 +23,7 @@ from freqtrade.enums import CandleType, ExitType, RunMode
 from freqtrade.exceptions import DependencyException, OperationalException
 from freqtrade.exchange import timeframe_to_next_date, timeframe_to_prev_date
 from freqtrade.optimize.backtest_caching import get_backtest_metadata_filename, get_strategy_run_id
+from freqtrade.optimize.backtest_columnar import ColumnarDetailData, ColumnarPairData
 from freqtrade.optimize.backtesting import Backtesting
 from freqtrade.persistence import LocalTrade, Trade
 from freqtrade.resolvers import StrategyResolver
@@ -1557,6 +1558,240 @@ def test_backtest_multi_pair(default_conf, fee, mocker, tres, pair, testdatadir)
     assert len(evaluate_result_multi(results["results"], "5m", 1)) == 0
 
 
+@pytest.mark.parametrize("use_detail", [True, False])
+def test_backtest_columnar_engine(default_conf_usdt, fee, mocker, use_detail):
+    def _trend_alternate_hold(dataframe=None, metadata=None):
+        multi = 20 if metadata["pair"] == "LTC/USDT" else 18
+        dataframe["enter_long"] = np.where(dataframe.index % multi == 0, 1, 0)
+        dataframe["exit_long"] = np.where((dataframe.index + multi - 2) % multi == 0, 1, 0)
+        dataframe["enter_short"] = 0
+        dataframe["exit_short"] = 0
+        dataframe["enter_tag"] = np.where(dataframe.index % multi == 0, "tag", None)
+        return dataframe
+
+    default_conf_usdt["runmode"] = "backtest"
+    default_conf_usdt["timeframe"] = "5m"
+    default_conf_usdt["max_open_trades"] = 2
+    if use_detail:
+        default_conf_usdt["timeframe_detail"] = "1m"
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    patch_exchange(mocker)
+
+    raw_candles_1m = generate_test_data("1m", 2500, "2022-01-03 12:00:00+00:00")
+    raw_candles = ohlcv_fill_up_missing_data(raw_candles_1m, "5m", "dummy")
+
+    pairs = ["ADA/USDT", "DASH/USDT", "ETH/USDT", "LTC/USDT", "NXT/USDT"]
+    data = {pair: raw_candles for pair in pairs}
+    detail_data = {pair: raw_candles_1m for pair in pairs}
+    data["LTC/USDT"] = data["LTC/USDT"][20:].reset_index()
+
+    all_results = {}
+    for engine in constants.BACKTEST_ENGINES:
+        default_conf_usdt["backtest_engine"] = engine
+        backtesting = Backtesting(default_conf_usdt)
+        assert backtesting.backtest_engine == engine
+        backtesting._set_strategy(backtesting.strategylist[0])
+        backtesting.detail_data = detail_data if use_detail else {}
+        backtesting.strategy.advise_entry = _trend_alternate_hold  # Override
+        backtesting.strategy.advise_exit = _trend_alternate_hold  # Override
+
+        processed = backtesting.strategy.advise_all_indicators(data)
+        min_date, max_date = get_timerange(processed)
+        all_results[engine] = backtesting.backtest(
+            processed=deepcopy(processed), start_date=min_date, end_date=max_date
+        )
+
+    assert len(all_results["columnar"]["results"]) > 0
+    pd.testing.assert_frame_equal(
+        all_results["list"]["results"], all_results["columnar"]["results"]
+    )
+    assert all_results["list"]["final_balance"] == all_results["columnar"]["final_balance"]
+    assert all_results["list"]["rejected_signals"] == all_results["columnar"]["rejected_signals"]
+
+
+@pytest.mark.parametrize(
+    "strategy_params",
+    [
+        {"stoploss": -0.01, "minimal_roi": {0: 0.02, 30: 0.01, 90: 0}},
+        {
+            "stoploss": -0.02,
+            "minimal_roi": {0: 0.05},
+            "trailing_stop": True,
+            "trailing_stop_positive": 0.005,
+            "trailing_stop_positive_offset": 0.01,
+            "trailing_only_offset_is_reached": True,
+        },
+        {"stoploss": -0.1, "minimal_roi": {}, "trailing_stop": True},
+    ],
+)
+def test_backtest_fast_path_parity(default_conf_usdt, fee, mocker, strategy_params):
+    def _sparse_signals(dataframe=None, metadata=None):
+        multi = 40 if metadata["pair"] == "LTC/USDT" else 37
+        dataframe["enter_long"] = np.where(dataframe.index % multi == 0, 1, 0)
+        dataframe["exit_long"] = np.where((dataframe.index + multi - 25) % multi == 0, 1, 0)
+        dataframe["enter_short"] = 0
+        dataframe["exit_short"] = 0
+        dataframe["enter_tag"] = np.where(dataframe.index % multi == 0, "tag", None)
+        return dataframe
+
+    default_conf_usdt["runmode"] = "backtest"
+    default_conf_usdt["timeframe"] = "5m"
+    default_conf_usdt["max_open_trades"] = 2
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    patch_exchange(mocker)
+
+    # Random walk - so trades stay open for a while.
+    rng = np.random.default_rng(42)
+    pairs = ["ADA/USDT", "DASH/USDT", "ETH/USDT", "LTC/USDT", "NXT/USDT"]
+    data = {}
+    for pair in pairs:
+        close = 20 * np.exp(np.cumsum(rng.normal(0, 0.003, 3000)))
+        open_ = np.append(20, close[:-1])
+        data[pair] = pd.DataFrame(
+            {
+                "date": pd.date_range("2022-01-03 12:00:00", periods=3000, freq="5min", tz="UTC"),
+                "open": open_,
+                "high": np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.002, 3000))),
+                "low": np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.002, 3000))),
+                "close": close,
+                "volume": rng.normal(200, 10, 3000),
+            }
+        )
+    data["LTC/USDT"] = data["LTC/USDT"][20:].reset_index()
+
+    all_results = {}
+    exit_checks = {}
+    for fast_path in (False, True):
+        default_conf_usdt["backtest_fast_path"] = fast_path
+        backtesting = Backtesting(default_conf_usdt)
+        backtesting._set_strategy(backtesting.strategylist[0])
+        for key, value in strategy_params.items():
+            setattr(backtesting.strategy, key, value)
+        backtesting.strategy.advise_entry = _sparse_signals  # Override
+        backtesting.strategy.advise_exit = _sparse_signals  # Override
+        assert backtesting._fast_path_supported() is fast_path
+        check_exit = mocker.spy(backtesting, "_check_trade_exit")
+
+        processed = backtesting.strategy.advise_all_indicators(data)
+        min_date, max_date = get_timerange(processed)
+        all_results[fast_path] = backtesting.backtest(
+            processed=deepcopy(processed), start_date=min_date, end_date=max_date
+        )
+        exit_checks[fast_path] = check_exit.call_count
+
+    regular, fast = all_results[False], all_results[True]
+    assert len(regular["results"]) > 10
+    # Exit evaluation was skipped for some candles
+    assert exit_checks[True] < exit_checks[False]
+    pd.testing.assert_frame_equal(regular["results"], fast["results"])
+    assert regular["final_balance"] == fast["final_balance"]
+    assert regular["rejected_signals"] == fast["rejected_signals"]
+
+
+def test_backtest_fast_path_supported(default_conf, mocker) -> None:
+    patch_exchange(mocker)
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    assert backtesting._fast_path_supported() is True
+
+    backtesting.strategy.use_custom_stoploss = True
+    assert backtesting._fast_path_supported() is False
+    backtesting.strategy.use_custom_stoploss = False
+
+    backtesting.strategy.custom_exit = MagicMock(return_value=None)
+    assert backtesting._fast_path_supported() is False
+    del backtesting.strategy.custom_exit
+    assert backtesting._fast_path_supported() is True
+
+    backtesting.timeframe_detail = "1m"
+    assert backtesting._fast_path_supported() is False
+    backtesting.timeframe_detail = ""
+
+    backtesting.backtest_fast_path = False
+    assert backtesting._fast_path_supported() is False
+
+
+def test_columnar_pair_data(default_conf, mocker, testdatadir) -> None:
+    patch_exchange(mocker)
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    data = history.load_data(datadir=testdatadir, timeframe="5m", pairs=["UNITTEST/BTC"])
+    data = trim_dictlist(data, -100)
+    processed = backtesting.strategy.advise_all_indicators(data)
+    backtesting.timerange = TimeRange(None, None, 0, 0)
+    backtesting.required_startup = 0
+
+    list_data = backtesting._get_ohlcv_as_lists(deepcopy(processed))["UNITTEST/BTC"]
+    backtesting.backtest_engine = "columnar"
+    col_data = backtesting._get_ohlcv_as_lists(deepcopy(processed))["UNITTEST/BTC"]
+
+    assert isinstance(col_data, ColumnarPairData)
+    assert len(col_data) == len(list_data) == 99
+    assert list(col_data[0]) == list_data[0]
+    assert list(col_data[-1]) == list_data[-1]
+    assert [list(r) for r in col_data] == list_data
+    row = col_data[5]
+    assert isinstance(row, tuple)
+    assert len(row) == len(list_data[5]) == col_data.width
+    assert isinstance(row[0], pd.Timestamp)
+    assert row[0] == list_data[5][0]
+    assert isinstance(row[1], float)
+    assert col_data.column(0).dtype == np.int64
+    assert col_data.column(1).dtype == np.float64
+    assert col_data.column(1)[5] == row[1]
+    assert col_data.column(9).dtype == object
+    with pytest.raises(IndexError):
+        col_data.column(20)
+
+    # Columns not in "date, numeric, tags" order are returned in the requested order.
+    df = processed["UNITTEST/BTC"].assign(enter_tag="tag")
+    columns = ["open", "date", "enter_tag", "close"]
+    mixed = ColumnarPairData(df, columns)
+    assert list(mixed[3]) == df[columns].values.tolist()[3]
+    assert mixed.column(1).dtype == np.int64
+    with pytest.raises(IndexError):
+        col_data[99]
+    with pytest.raises(IndexError):
+        col_data[-100]
+
+
+def test_columnar_detail_data(default_conf_usdt, mocker) -> None:
+    patch_exchange(mocker)
+    default_conf_usdt["timeframe"] = "1h"
+    default_conf_usdt["timeframe_detail"] = "5m"
+    # Start mid-candle - first hourly candle is incomplete
+    detail = generate_test_data("5m", 50, "2022-01-03 12:30:00+00:00")
+
+    backtesting = Backtesting(default_conf_usdt)
+    backtesting.detail_data = {"ETH/USDT": detail, "XRP/USDT": detail.iloc[0:0]}
+    # Empty dataframes are not indexed
+    assert list(backtesting.detail_index.keys()) == ["ETH/USDT"]
+    detail_pair_data = backtesting.detail_index["ETH/USDT"]
+    assert isinstance(detail_pair_data, ColumnarDetailData)
+    assert len(detail_pair_data) == 50
+
+    assert detail_pair_data.get_range(dt_utc(2022, 1, 3, 12)) == (0, 6)
+    assert detail_pair_data.get_range(dt_utc(2022, 1, 3, 13)) == (6, 18)
+    assert detail_pair_data.get_range(dt_utc(2022, 1, 3, 16)) == (42, 50)
+    assert detail_pair_data.get_range(dt_utc(2022, 1, 3, 17)) == (50, 50)
+    # Not aligned to the timeframe - falls back to searching the dates
+    assert detail_pair_data.get_range(dt_utc(2022, 1, 3, 12, 40)) == (2, 14)
+
+    signals = [1.0, 0.0, 0.0, 0.0, "tag", None]
+    rows = detail_pair_data.get_rows(6, 18, signals)
+    assert len(rows) == 12
+    expected = detail.iloc[6:18]
+    for det_row, (_, candle) in zip(rows, expected.iterrows(), strict=True):
+        assert det_row[0] == candle["date"]
+        assert isinstance(det_row[0], pd.Timestamp)
+        assert det_row[1:5] == (candle["open"], candle["high"], candle["low"], candle["close"])
+        assert list(det_row[5:]) == signals
+
+
 @pytest.mark.parametrize("use_detail", [True, False])
 @pytest.mark.parametrize("pair", ["ADA/USDT", "LTC/USDT"])
 @pytest.mark.parametrize("tres", [0, 20, 30])
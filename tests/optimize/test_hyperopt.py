@@ -15,6 +15,8 @@ from freqtrade.enums import ExitType, RunMode
 from freqtrade.exceptions import OperationalException
 from freqtrade.optimize.hyperopt import Hyperopt
 from freqtrade.optimize.hyperopt.hyperopt_auto import HyperOptAuto
+from freqtrade.optimize.hyperopt.hyperopt_data import HyperoptSharedData
+from freqtrade.optimize.hyperopt.hyperopt_worker_pool import HyperoptWorkerPool
 from freqtrade.optimize.hyperopt_tools import HyperoptTools
 from freqtrade.optimize.optimize_reports import generate_strategy_stats
 from freqtrade.optimize.space import SKDecimal
@@ -1092,8 +1094,88 @@ def test_in_strategy_auto_hyperopt(mocker, hyperopt_conf, tmp_path, fee) -> None
         opt.get_optimizer(2, 42, 2, 2)
 
 
+@pytest.mark.parametrize("spaces,cached", [(["roi", "stoploss"], True), (["buy", "roi"], False)])
+def test_hyperopt_signal_cache(mocker, hyperopt_conf, tmp_path, fee, spaces, cached) -> None:
+    patch_exchange(mocker)
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    (tmp_path / "hyperopt_results").mkdir(parents=True)
+    hyperopt_conf.update(
+        {
+            "strategy": "HyperoptableStrategy",
+            "user_data_dir": tmp_path,
+            "spaces": spaces,
+        }
+    )
+    hyperopt = Hyperopt(hyperopt_conf)
+    opt = hyperopt.hyperopter
+    opt.backtesting.exchange.get_max_leverage = MagicMock(return_value=1.0)
+    opt.prepare_hyperopt()
+    advise_mock = mocker.spy(opt.backtesting.strategy, "ft_advise_signals")
+    load_mock = mocker.spy(opt, "_load_data")
+
+    point = [d.low if hasattr(d, "low") else d.categories[0] for d in opt.dimensions]
+    res1 = opt.generate_optimizer(point)
+    calls = advise_mock.call_count
+    assert calls > 0
+    key = opt.backtesting.signal_cache_key
+    assert (key is not None) is cached
+
+    res2 = opt.generate_optimizer(point)
+    assert res1["loss"] == res2["loss"]
+    assert res1["results_metrics"]["total_trades"] == res2["results_metrics"]["total_trades"]
+    if cached:
+        # Signals and data are reused in the 2nd epoch.
+        assert advise_mock.call_count == calls
+        assert load_mock.call_count == 1
+        assert opt.backtesting.signal_cache_key == key
+        # Changed signal parameters invalidate the cache
+        opt.backtesting.strategy.buy_rsi.value += 1
+        opt.generate_optimizer(point)
+        assert opt.backtesting.signal_cache_key != key
+        assert advise_mock.call_count == calls * 2
+    else:
+        assert advise_mock.call_count == calls * 2
+        assert load_mock.call_count == 2
+
+
+@pytest.mark.parametrize("spaces", [["roi"], ["stoploss"]])
+def test_hyperopt_signal_cache_per_epoch(mocker, hyperopt_conf, tmp_path, fee, spaces) -> None:
+    patch_exchange(mocker)
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    (tmp_path / "hyperopt_results").mkdir(parents=True)
+    hyperopt_conf.update(
+        {
+            "strategy": "HyperoptableStrategy",
+            "user_data_dir": tmp_path,
+            "spaces": spaces,
+            "analyze_per_epoch": True,
+        }
+    )
+    hyperopt = Hyperopt(hyperopt_conf)
+    opt = hyperopt.hyperopter
+    opt.backtesting.exchange.get_max_leverage = MagicMock(return_value=1.0)
+    opt.prepare_hyperopt()
+    indicators_mock = mocker.spy(opt.backtesting.strategy, "advise_all_indicators")
+    load_mock = mocker.spy(opt, "_load_data")
+
+    point = [d.low if hasattr(d, "low") else d.categories[0] for d in opt.dimensions]
+    res1 = opt.generate_optimizer(point)
+    assert opt.backtesting.signal_cache_key is not None
+    res2 = opt.generate_optimizer(point)
+    res3 = opt.generate_optimizer(point)
+    assert res1["loss"] == res2["loss"] == res3["loss"]
+    # Indicators are only calculated for the first epoch.
+    assert indicators_mock.call_count == 1
+    assert load_mock.call_count == 1
+
+
 @pytest.mark.filterwarnings("ignore::DeprecationWarning")
-def test_in_strategy_auto_hyperopt_with_parallel(mocker, hyperopt_conf, tmp_path, fee) -> None:
+@pytest.mark.parametrize(
+    "data_format,worker_pool", [("joblib", False), ("mmap", False), ("joblib", True)]
+)
+def test_in_strategy_auto_hyperopt_with_parallel(
+    mocker, hyperopt_conf, tmp_path, fee, data_format, worker_pool
+) -> None:
     mocker.patch(f"{EXMS}.validate_config", MagicMock())
     mocker.patch(f"{EXMS}.get_fee", fee)
     mocker.patch(f"{EXMS}.reload_markets")
@@ -1109,9 +1191,11 @@ def test_in_strategy_auto_hyperopt_with_parallel(mocker, hyperopt_conf, tmp_path
             "hyperopt_random_state": 42,
             "spaces": ["all"],
             # Enforce parallelity
-            "epochs": 2,
+            "epochs": 4 if worker_pool else 2,
             "hyperopt_jobs": 2,
             "fee": fee.return_value,
+            "hyperopt_data_format": data_format,
+            "hyperopt_worker_pool": worker_pool,
         }
     )
     hyperopt = Hyperopt(hyperopt_conf)
@@ -1135,7 +1219,13 @@ def test_in_strategy_auto_hyperopt_with_parallel(mocker, hyperopt_conf, tmp_path
     # Range from 0 - 50 (inclusive)
     assert len(list(buy_rsi_range)) == 51
 
+    pool_run_mock = mocker.spy(HyperoptWorkerPool, "run")
     hyperopt.start()
+    assert hyperopt.num_epochs_saved == (4 if worker_pool else 2)
+    # Workers are reused for all batches of epochs
+    assert pool_run_mock.call_count == (2 if worker_pool else 0)
+    assert hyperopt.worker_pool is None
+    assert opt.shared_data.directory.is_dir() == (data_format == "mmap")
 
 
 def test_in_strategy_auto_hyperopt_per_epoch(mocker, hyperopt_conf, tmp_path, fee) -> None:
@@ -1184,6 +1274,40 @@ def test_in_strategy_auto_hyperopt_per_epoch(mocker, hyperopt_conf, tmp_path, fe
     assert go.call_count == 3
 
 
+def test_hyperopt_shared_data(tmp_path, testdatadir) -> None:
+    data = load_data(testdatadir, "5m", ["UNITTEST/BTC", "XRP/ETH"])
+    data["UNITTEST/BTC"]["enter_tag"] = "tag"
+    data["UNITTEST/BTC"]["is_green"] = data["UNITTEST/BTC"]["close"] > data["UNITTEST/BTC"]["open"]
+    data["UNITTEST/BTC"]["counter"] = range(len(data["UNITTEST/BTC"]))
+    data["XRP/ETH"] = data["XRP/ETH"].iloc[0:0]
+
+    shared = HyperoptSharedData(tmp_path / "hyperopt_data")
+    shared.publish(data)
+    assert (tmp_path / "hyperopt_data" / "data.bin").is_file()
+
+    attached = shared.attach()
+    assert list(attached.keys()) == ["UNITTEST/BTC", "XRP/ETH"]
+    for pair, df in data.items():
+        pd.testing.assert_frame_equal(attached[pair], df)
+
+    # Numeric columns are backed by the data file
+    close = attached["UNITTEST/BTC"]["close"].to_numpy()
+    assert not close.flags.owndata
+    assert close.flags.writeable
+    # Modifications are private to the attached dataframes
+    attached["UNITTEST/BTC"].loc[0, "close"] = 5
+    assert close[0] == 5
+    pd.testing.assert_frame_equal(shared.attach()["UNITTEST/BTC"], data["UNITTEST/BTC"])
+
+    # Publishing again replaces the data
+    shared.publish({"ETH/BTC": data["UNITTEST/BTC"].iloc[:10]})
+    assert list(shared.attach().keys()) == ["ETH/BTC"]
+    assert len(shared.attach()["ETH/BTC"]) == 10
+
+    shared.cleanup()
+    assert not (tmp_path / "hyperopt_data").exists()
+
+
 def test_SKDecimal():
     space = SKDecimal(1, 2, decimals=2)
     assert 1.5 in space
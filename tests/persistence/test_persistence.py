@@ -1889,6 +1889,54 @@ def test_get_trades_proxy(fee, use_db, is_short):
     Trade.use_db = True
 
 
+def test_get_trades_proxy_closed_index():
+    Trade.use_db = False
+    Trade.reset_trades()
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    pairs = ["ETH/USDT", "XRP/USDT", "LTC/USDT"]
+    # Mostly in close order - with some trades closing out of order, and identical close dates
+    minutes = [5, 10, 10, 7, 20, 30, 25, 30, 40, 41]
+    for idx, minute in enumerate(minutes):
+        trade = LocalTrade(
+            id=idx,
+            pair=pairs[idx % 3],
+            open_date=start + timedelta(minutes=idx),
+            close_date=start + timedelta(minutes=minute),
+            is_open=False,
+        )
+        LocalTrade.add_bt_trade(trade)
+
+    def expected(pair=None, close_date=None, open_date=None):
+        return [
+            t
+            for t in LocalTrade.bt_trades
+            if (not pair or t.pair == pair)
+            and (not close_date or t.close_date > close_date)
+            and (not open_date or t.open_date > open_date)
+        ]
+
+    for pair in [None, *pairs, "NONEXIST/USDT"]:
+        for close_date in [None, *(start + timedelta(minutes=m) for m in (0, 7, 10, 30, 45))]:
+            for open_date in [None, start + timedelta(minutes=4)]:
+                result = Trade.get_trades_proxy(
+                    pair=pair, is_open=False, close_date=close_date, open_date=open_date
+                )
+                assert sorted(t.id for t in result) == sorted(
+                    t.id for t in expected(pair, close_date, open_date)
+                )
+                # Sorted by close date
+                assert [t.close_date for t in result] == sorted(t.close_date for t in result)
+
+    # Modifying bt_trades directly rebuilds the index
+    LocalTrade.bt_trades = LocalTrade.bt_trades[:4]
+    assert len(Trade.get_trades_proxy(is_open=False)) == 4
+    assert len(Trade.get_trades_proxy(is_open=False, close_date=start)) == 4
+
+    Trade.reset_trades()
+    assert Trade.get_trades_proxy(is_open=False) == []
+    Trade.use_db = True
+
+
 @pytest.mark.usefixtures("init_persistence")
 @pytest.mark.parametrize("is_short", [True, False])
 def test_get_trades__query(fee, is_short):
@@ -2144,6 +2192,7 @@ def test_Trade_object_idem():
         "bt_trades",
         "bt_trades_open",
         "bt_trades_open_pp",
+        "bt_trades_closed_index",
         "bt_open_open_trade_count",
         "bt_open_open_trade_count_candle",
         "bt_total_profit",
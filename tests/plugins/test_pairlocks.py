@@ -158,3 +158,56 @@ def test_PairLocks_reason(use_db):
 
     PairLocks.reset_locks()
     PairLocks.use_db = True
+
+
+@pytest.mark.usefixtures("init_persistence")
+def test_PairLocks_index():
+    PairLocks.timeframe = "5m"
+    PairLocks.use_db = False
+    PairLocks.reset_locks()
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    pairs = ["XRP/USDT", "ETH/USDT", "*"]
+    sides = ["*", "long", "short"]
+    # Locks out of end time order, for multiple pairs and sides
+    for i in range(60):
+        PairLocks.lock_pair(
+            pairs[i % 3],
+            start + timedelta(minutes=(i * 37) % 300),
+            f"reason{i % 4}",
+            now=start,
+            side=sides[(i // 3) % 3],
+        )
+    PairLocks.unlock_reason("reason1", now=start + timedelta(minutes=60))
+
+    def brute_force(pair, now, side):
+        return [
+            lock
+            for lock in PairLocks.locks
+            if lock.lock_end_time >= now
+            and lock.active is True
+            and (pair is None or lock.pair == pair)
+            and (side is None or lock.side == "*" or lock.side == side)
+        ]
+
+    for minutes in range(0, 320, 5):
+        now = start + timedelta(minutes=minutes)
+        for pair in [None, "XRP/USDT", "*", "BTC/USDT"]:
+            for side in [None, "*", "long", "short"]:
+                assert PairLocks.get_pair_locks(pair, now, side) == brute_force(pair, now, side)
+
+    # Locks added directly to the list are picked up
+    PairLocks.locks.append(
+        PairLock(
+            pair="BTC/USDT",
+            lock_time=start,
+            lock_end_time=start + timedelta(minutes=30),
+            side="*",
+            active=True,
+        )
+    )
+    assert len(PairLocks.get_pair_locks("BTC/USDT", start)) == 1
+    assert len(PairLocks.get_pair_locks("BTC/USDT", start + timedelta(minutes=35))) == 0
+
+    PairLocks.reset_locks()
+    assert PairLocks.get_pair_locks(None, start) == []
+    PairLocks.use_db = True
@@ -1,10 +1,12 @@
 # pragma pylint: disable=missing-docstring, C0103
 import logging
 import math
+import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 from pandas import DataFrame
 
@@ -12,12 +14,19 @@ from freqtrade.configuration import TimeRange
 from freqtrade.constants import CUSTOM_TAG_MAX_LENGTH
 from freqtrade.data.dataprovider import DataProvider
 from freqtrade.data.history import load_data
-from freqtrade.enums import ExitCheckTuple, ExitType, HyperoptState, SignalDirection
+from freqtrade.enums import (
+    ExitCheckTuple,
+    ExitType,
+    HyperoptState,
+    RPCMessageType,
+    SignalDirection,
+)
 from freqtrade.exceptions import OperationalException, StrategyError
 from freqtrade.optimize.hyperopt_tools import HyperoptStateContainer
 from freqtrade.optimize.space import SKDecimal
 from freqtrade.persistence import PairLocks, Trade
 from freqtrade.resolvers import StrategyResolver
+from freqtrade.strategy import IncrementalEMA, IncrementalRSI
 from freqtrade.strategy.hyper import detect_parameters
 from freqtrade.strategy.parameters import (
     BaseParameter,
@@ -28,7 +37,13 @@ from freqtrade.strategy.parameters import (
     RealParameter,
 )
 from freqtrade.util import dt_now
-from tests.conftest import CURRENT_TEST_STRATEGY, TRADE_SIDES, log_has, log_has_re
+from tests.conftest import (
+    CURRENT_TEST_STRATEGY,
+    TRADE_SIDES,
+    generate_test_data,
+    log_has,
+    log_has_re,
+)
 
 from .strats.strategy_test_v3 import StrategyTestV3
 
@@ -825,6 +840,154 @@ def test__analyze_ticker_internal_skip_analyze(ohlcv_history, mocker, caplog) ->
     assert log_has("Skipping TA Analysis for already analyzed candle", caplog)
 
 
+class IncrementalTestStrategy(StrategyTestV3):
+    incremental_analysis = True
+    startup_candle_count = 20
+    ema = IncrementalEMA(10)
+    rsi = IncrementalRSI(14)
+
+    def populate_indicators(self, dataframe, metadata):
+        dataframe["ema"] = self.ema.calculate(dataframe, metadata)
+        dataframe["rsi"] = self.rsi.calculate(dataframe, metadata)
+        return dataframe
+
+    def populate_indicators_incremental(self, previous, new_candles, metadata):
+        new_candles["ema"] = self.ema.update(new_candles, metadata)
+        new_candles["rsi"] = self.rsi.update(new_candles, metadata)
+        return new_candles
+
+    def populate_entry_trend(self, dataframe, metadata):
+        dataframe.loc[
+            (dataframe["rsi"] > 50) & (dataframe["rsi"].shift(1) <= 50), ["enter_long", "enter_tag"]
+        ] = (1, "rsi_cross")
+        return dataframe
+
+    def populate_exit_trend(self, dataframe, metadata):
+        dataframe.loc[dataframe["close"] < dataframe["ema"], "exit_long"] = 1
+        return dataframe
+
+
+def test__analyze_ticker_internal_incremental(mocker) -> None:
+    data = generate_test_data("5m", 300, "2024-01-01 00:00:00")
+    metadata = {"pair": "ETH/BTC"}
+    strategy = IncrementalTestStrategy({})
+    strategy.dp = DataProvider({}, None, None)
+    full_spy = mocker.spy(strategy, "populate_indicators")
+    incremental_spy = mocker.spy(strategy, "populate_indicators_incremental")
+
+    strategy._analyze_ticker_internal(data.iloc[:200].copy(), metadata)
+    assert full_spy.call_count == 1
+    assert incremental_spy.call_count == 0
+
+    ret = strategy._analyze_ticker_internal(data.iloc[:230].copy(), metadata)
+    assert full_spy.call_count == 1
+    assert incremental_spy.call_count == 1
+    assert len(incremental_spy.call_args[0][1]) == 30
+
+    expected = IncrementalTestStrategy({}).analyze_ticker(data.iloc[:230].copy(), metadata)
+    assert len(ret) == 230
+    assert ret["date"].equals(data["date"].iloc[:230])
+    for column in ["ema", "rsi", "enter_long", "exit_long"]:
+        assert np.allclose(ret[column], expected[column], equal_nan=True)
+    assert ret["enter_tag"].fillna("").equals(expected["enter_tag"].fillna(""))
+
+    # Sliding window
+    ret = strategy._analyze_ticker_internal(data.iloc[10:240].copy(), metadata)
+    assert incremental_spy.call_count == 2
+    assert len(ret) == 230
+    assert ret["date"].equals(data["date"].iloc[10:240].reset_index(drop=True))
+
+    # Changed candle - full analysis
+    changed = data.iloc[10:250].copy()
+    changed.loc[239, "close"] += 1
+    strategy._analyze_ticker_internal(changed, metadata)
+    assert full_spy.call_count == 2
+    assert incremental_spy.call_count == 2
+
+    # Strategy asks for a full analysis
+    mocker.patch.object(strategy, "populate_indicators_incremental", return_value=None)
+    strategy._analyze_ticker_internal(data.iloc[10:260].copy(), metadata)
+    assert full_spy.call_count == 3
+
+
+def test__analyze_ticker_internal_incremental_state(mocker, caplog) -> None:
+    data = generate_test_data("5m", 300, "2024-01-01 00:00:00")
+    metadata = {"pair": "ETH/BTC"}
+    strategy = IncrementalTestStrategy({})
+    strategy.dp = DataProvider({}, None, None)
+    full_spy = mocker.spy(strategy, "populate_indicators")
+
+    strategy._analyze_ticker_internal(data.iloc[:200].copy(), metadata)
+    # Indicator state lost (e.g. not calculated in populate_indicators) - full analysis
+    strategy.rsi._state.clear()
+    ret = strategy._analyze_ticker_internal(data.iloc[:210].copy(), metadata)
+    assert full_spy.call_count == 2
+    assert log_has_re(r"IncrementalRSI was not calculated for ETH/BTC yet.*", caplog)
+    expected = IncrementalTestStrategy({}).analyze_ticker(data.iloc[:210].copy(), metadata)
+    assert np.allclose(ret["rsi"], expected["rsi"], equal_nan=True)
+
+    # Failing incremental analysis - the next analysis is a full one
+    mocker.patch.object(strategy.rsi, "update", side_effect=ValueError("fail"))
+    with pytest.raises(ValueError, match="fail"):
+        strategy._analyze_ticker_internal(data.iloc[:220].copy(), metadata)
+    assert "ETH/BTC" not in strategy._analyzed_df_per_pair
+    mocker.stopall()
+    full_spy = mocker.spy(strategy, "populate_indicators")
+    ret = strategy._analyze_ticker_internal(data.iloc[:230].copy(), metadata)
+    assert full_spy.call_count == 1
+    expected = IncrementalTestStrategy({}).analyze_ticker(data.iloc[:230].copy(), metadata)
+    assert np.allclose(ret["ema"], expected["ema"], equal_nan=True)
+
+
+def test_analyze_incremental_prunes_pairs(mocker) -> None:
+    data = generate_test_data("5m", 200, "2024-01-01 00:00:00")
+    strategy = IncrementalTestStrategy({})
+    strategy.dp = DataProvider({}, None, None)
+    mocker.patch.object(strategy.dp, "ohlcv", side_effect=lambda *args, **kwargs: data.copy())
+
+    strategy.analyze(["ETH/BTC", "XRP/BTC"])
+    assert set(strategy._analyzed_df_per_pair) == {"ETH/BTC", "XRP/BTC"}
+    # Pairs removed from the whitelist are forgotten
+    strategy.analyze(["XRP/BTC", "LTC/BTC"])
+    assert set(strategy._analyzed_df_per_pair) == {"XRP/BTC", "LTC/BTC"}
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_analyze_parallel(ohlcv_history, mocker, workers) -> None:
+    pairs = ["ETH/BTC", "XRP/BTC", "LTC/BTC", "NEO/BTC"]
+
+    def populate_indicators(dataframe, metadata):
+        # Earlier pairs finish last
+        time.sleep(0.02 * (len(pairs) - pairs.index(metadata["pair"])))
+        return dataframe
+
+    mocker.patch.multiple(
+        "freqtrade.strategy.interface.IStrategy",
+        advise_indicators=MagicMock(side_effect=populate_indicators),
+        advise_entry=MagicMock(side_effect=lambda x, meta: x),
+        advise_exit=MagicMock(side_effect=lambda x, meta: x),
+    )
+    rpc_mock = MagicMock()
+    strategy = StrategyTestV3({"analyze_workers": workers})
+    strategy.dp = DataProvider({}, None, rpc=rpc_mock)
+    mocker.patch.object(
+        strategy.dp, "ohlcv", side_effect=lambda *args, **kwargs: ohlcv_history.copy()
+    )
+
+    strategy.analyze(pairs)
+
+    for pair in pairs:
+        df, _ = strategy.dp.get_analyzed_dataframe(pair, strategy.timeframe)
+        assert len(df) == len(ohlcv_history)
+    # Analyzed dataframes are sent in the order of pairs
+    emitted = [
+        call.args[0]["data"]["key"][0]
+        for call in rpc_mock.send_msg.call_args_list
+        if call.args[0]["type"] == RPCMessageType.ANALYZED_DF
+    ]
+    assert emitted == pairs
+
+
 @pytest.mark.usefixtures("init_persistence")
 def test_is_pair_locked(default_conf):
     PairLocks.timeframe = default_conf["timeframe"]
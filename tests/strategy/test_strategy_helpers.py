@@ -1,11 +1,25 @@
 import numpy as np
 import pandas as pd
 import pytest
+import talib.abstract as ta
 
 from freqtrade.data.dataprovider import DataProvider
 from freqtrade.enums import CandleType
+from freqtrade.exceptions import IncrementalStateError
 from freqtrade.resolvers.strategy_resolver import StrategyResolver
-from freqtrade.strategy import merge_informative_pair, stoploss_from_absolute, stoploss_from_open
+from freqtrade.strategy import (
+    IncrementalATR,
+    IncrementalBollingerBands,
+    IncrementalEMA,
+    IncrementalRSI,
+    IncrementalSMA,
+    informative_decorator,
+    merge_informative_pair,
+    stoploss_from_absolute,
+    stoploss_from_open,
+)
+from freqtrade.strategy.informative_decorator import _CachedInformative, _merge_cached_informative
+from freqtrade.strategy.strategy_helper import _prepare_informative_pair
 from tests.conftest import generate_test_data, get_patched_exchange
 
 
@@ -387,9 +401,13 @@ def test_informative_decorator(mocker, default_conf_usdt, trading_mode):
         "freqtrade.data.dataprovider.DataProvider.historic_ohlcv", side_effect=test_historic_ohlcv
     )
 
+    prepare_spy = mocker.spy(informative_decorator, "_prepare_informative_pair")
     analyzed = strategy.advise_all_indicators(
         {p: data[(p, strategy.timeframe, candle_def)] for p in ("XRP/USDT", "LTC/USDT")}
     )
+    # Informatives of other pairs are populated once for both pairs
+    assert prepare_spy.call_count == 10
+    assert strategy._ft_informative_cache is None
     expected_columns = [
         "rsi_1h",
         "rsi_30m",  # Stacked informative decorators
@@ -404,3 +422,81 @@ def test_informative_decorator(mocker, default_conf_usdt, trading_mode):
     for _, dataframe in analyzed.items():
         for col in expected_columns:
             assert col in dataframe.columns
+
+    # Identical to populating informatives for every pair
+    for pair, dataframe in analyzed.items():
+        expected = strategy.advise_indicators(
+            data[(pair, strategy.timeframe, candle_def)].copy(), {"pair": pair}
+        )
+        pd.testing.assert_frame_equal(dataframe, expected)
+    assert prepare_spy.call_count == 24
+
+
+@pytest.mark.parametrize("ffill", [True, False])
+def test_merge_cached_informative(ffill):
+    data = generate_test_data("15m", 100, "2024-01-01 00:00:00")
+    # Missing candle and NaN value in the informative dataframe
+    informative = generate_test_data("1h", 30, "2024-01-01 02:00:00").drop(index=5)
+    informative["int_col"] = 1
+    informative.loc[8, "close"] = np.nan
+    expected = merge_informative_pair(data, informative, "15m", "1h", ffill=ffill)
+
+    prepared, date_merge = _prepare_informative_pair(informative, "15m", "1h", True, "date", None)
+    cached = _CachedInformative(prepared, date_merge)
+    for _ in range(2):
+        result = _merge_cached_informative(data, cached, ffill)
+        pd.testing.assert_frame_equal(result, expected)
+    assert len(cached.alignments) == 1
+
+    # Duplicate dates - regular merge
+    cached = _CachedInformative(pd.concat([prepared, prepared.iloc[[3]]]), date_merge)
+    assert cached.columns is None
+    result = _merge_cached_informative(data, cached, ffill)
+    assert len(result) > len(data)
+
+
+@pytest.mark.parametrize(
+    "indicator,ta_function,ta_kwargs",
+    [
+        (IncrementalSMA(10), "SMA", {"timeperiod": 10}),
+        (IncrementalEMA(10), "EMA", {"timeperiod": 10}),
+        (IncrementalRSI(14), "RSI", {"timeperiod": 14}),
+        (IncrementalATR(14), "ATR", {"timeperiod": 14}),
+        (
+            IncrementalBollingerBands(20, 2.0),
+            "BBANDS",
+            {"timeperiod": 20, "nbdevup": 2.0, "nbdevdn": 2.0},
+        ),
+    ],
+)
+def test_incremental_indicators(indicator, ta_function, ta_kwargs):
+    data = generate_test_data("5m", 300, "2024-01-01 00:00:00")
+    metadata = {"pair": "ETH/USDT"}
+    expected = getattr(ta, ta_function)(data, **ta_kwargs)
+    if ta_function == "BBANDS":
+        expected = pd.DataFrame(
+            {
+                "lower": expected["lowerband"],
+                "mid": expected["middleband"],
+                "upper": expected["upperband"],
+            }
+        )
+
+    result = indicator.calculate(data, metadata)
+    assert type(result) is type(expected)
+    assert np.allclose(result, expected, equal_nan=True)
+
+    # Continued in chunks - including chunks shorter than the period, and empty chunks
+    chunks = [indicator.calculate(data.iloc[:5], metadata)]
+    for start, end in [(5, 7), (7, 40), (40, 40), (40, 41), (41, 300)]:
+        chunks.append(indicator.update(data.iloc[start:end], metadata))
+    result = pd.concat(chunks)
+    assert result.index.equals(data.index)
+    assert np.allclose(result, expected, equal_nan=True)
+
+    # Unknown pair - continuing from the new candles only would not match the full calculation
+    with pytest.raises(IncrementalStateError, match=r"was not calculated for XRP/USDT yet"):
+        indicator.update(data.iloc[-3:], {"pair": "XRP/USDT"})
+
+    with pytest.raises(ValueError, match=r"period must be positive\."):
+        type(indicator)(0)
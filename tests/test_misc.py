@@ -8,6 +8,7 @@ import pandas as pd
 import pytest
 
 from freqtrade.misc import (
+    atomic_write_file,
     dataframe_to_json,
     deep_merge_dicts,
     file_dump_json,
@@ -35,6 +36,22 @@ def test_file_dump_json(mocker) -> None:
     assert json_dump.call_count == 1
 
 
+def test_atomic_write_file(tmp_path) -> None:
+    file = tmp_path / "file.json"
+    file.write_text("old")
+    with atomic_write_file(file) as tmp_file:
+        tmp_file.write_text("new")
+        assert file.read_text() == "old"
+    assert file.read_text() == "new"
+
+    with pytest.raises(OSError, match="disk full"):
+        with atomic_write_file(file) as tmp_file:
+            tmp_file.write_text("partial")
+            raise OSError("disk full")
+    assert file.read_text() == "new"
+    assert [f.name for f in tmp_path.iterdir()] == ["file.json"]
+
+
 def test_file_load_json(mocker, testdatadir) -> None:
     # 7m .json does not exist
     ret = file_load_json(testdatadir / "UNITTEST_BTC-7m.json")
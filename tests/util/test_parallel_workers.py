@@ -0,0 +1,38 @@
+import logging
+
+from freqtrade.util.parallel_workers import run_pairs_in_workers
+from tests.conftest import log_has
+
+
+logger = logging.getLogger(__name__)
+
+
+def _pair_worker(pair: str, factor: int) -> str:
+    logger.info(f"Processing {pair}")
+    if pair == "XRP/BTC":
+        try:
+            raise ValueError("Broken pair")
+        except ValueError:
+            logger.exception(f"Error processing {pair}")
+    return pair * factor
+
+
+def test_run_pairs_in_workers(caplog):
+    caplog.set_level(logging.INFO)
+    pairs = ["ETH/BTC", "XRP/BTC", "LTC/BTC"]
+
+    assert run_pairs_in_workers(_pair_worker, pairs, 2, factor=2) == [p * 2 for p in pairs]
+    # Log messages are re-emitted in pair order
+    messages = [r.getMessage() for r in caplog.records if r.name == __name__]
+    assert messages == [
+        "Processing ETH/BTC",
+        "Processing XRP/BTC",
+        "Error processing XRP/BTC",
+        "Processing LTC/BTC",
+    ]
+    # Including the traceback of exceptions
+    assert log_has("Error processing XRP/BTC", caplog)
+    record = next(r for r in caplog.records if r.getMessage() == "Error processing XRP/BTC")
+    assert record.exc_info is None
+    assert "ValueError: Broken pair" in record.exc_text
+    assert "ValueError: Broken pair" in caplog.text